@@ -0,0 +1,70 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=broad-except
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence, Tuple, TypeVar
+
+from src.model import PlannedItem, PlannedItemList
+
+T = TypeVar("T")
+ListFetchFunc = Callable[..., List[PlannedItem]]
+
+
+@dataclass(frozen=True)
+class ListFetchError:
+    planned_list: PlannedItemList
+    error: Exception
+
+
+@dataclass
+class ListFetchResult:
+    items: List[PlannedItem] = field(default_factory=list)
+    errors: List[ListFetchError] = field(default_factory=list)
+
+
+def _fetch_one(
+    fetch_func: ListFetchFunc, planned_list: PlannedItemList
+) -> Tuple[List[PlannedItem], Optional[Exception]]:
+    try:
+        return fetch_func(planned_list=planned_list), None
+    except Exception as exc:
+        return [], exc
+
+
+def fetch_lists(
+    lists: Sequence[PlannedItemList],
+    fetch_func: ListFetchFunc,
+    max_workers: int = 1,
+) -> ListFetchResult:
+    if max_workers <= 1 or len(lists) <= 1:
+        outcomes = [_fetch_one(fetch_func, item_list) for item_list in lists]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(lists))) as executor:
+            outcomes = list(
+                executor.map(lambda item_list: _fetch_one(fetch_func, item_list), lists)
+            )
+    result = ListFetchResult()
+    for item_list, (items, error) in zip(lists, outcomes):
+        if error is not None:
+            result.errors.append(ListFetchError(planned_list=item_list, error=error))
+            continue
+        result.items += items
+    return result
+
+
+def run_in_parallel(
+    jobs: Sequence[Callable[[], T]], max_workers: Optional[int] = None
+) -> List[T]:
+    workers = len(jobs) if max_workers is None else min(max_workers, len(jobs))
+    if workers <= 1:
+        return [job() for job in jobs]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(job) for job in jobs]
+        return [future.result() for future in futures]
+
+
+__all__ = ["ListFetchError", "ListFetchResult", "fetch_lists", "run_in_parallel"]
@@ -4,40 +4,56 @@
 from __future__ import annotations
 
 import sys
-from typing import List
+from typing import List, Optional
 
+from src.common.data.concurrency import fetch_lists, run_in_parallel
 from src.common.data.list_processing import (validate_and_create_calendar,
                                              validate_and_create_task_list,
                                              validate_and_create_todoist_project)
 from src.common.data.parameters import ParameterLoader
-from src.model import PlannedItem, PlannedItemList
+from src.model import ItemStatus, PlannedItem, PlannedItemList
 from src.sources.gcp import gcp
 from src.sources.todoist import todoist
 
 params = ParameterLoader()
 ignored_lists: list[str] = params.get("IGNORED_LISTS")
+fetch_max_workers: int = params.get("FETCH_MAX_WORKERS")
 
 
-def _fetch_from_lists(lists: List[PlannedItemList], list_type_name: str, fetch_func):
+def _fetch_from_lists(
+    lists: List[PlannedItemList],
+    list_type_name: str,
+    fetch_func,
+    max_workers: Optional[int] = None,
+):
     result: List[PlannedItem] = []
     if not lists or len(lists) == 0:
         print(f"No {list_type_name} found.")
     else:
-        for item_list in lists:
-            result += fetch_func(planned_list=item_list)
+        fetched = fetch_lists(
+            lists,
+            fetch_func,
+            max_workers=fetch_max_workers if max_workers is None else max_workers,
+        )
+        for error in fetched.errors:
+            name = error.planned_list.name or error.planned_list.id
+            print(
+                f"Error fetching {list_type_name} '{name}': {error.error}",
+                file=sys.stderr,
+            )
+        result = fetched.items
     return result
 
 
 def _apply_auto_complete_to_tasks(
-    tasks: List[PlannedItem], task_lists: List[PlannedItemList], fetch_func, auto_complete_func
+    tasks: List[PlannedItem],
+    task_lists: List[PlannedItemList],
+    auto_complete_func,
 ) -> List[PlannedItem]:
     total_auto_completed = 0
+    tasks_by_list = PlannedItem.group_by_list(tasks)
     for task_list in task_lists:
-        list_tasks = [
-            task
-            for task in tasks
-            if task.planned_item_list and task.planned_item_list.id == task_list.id
-        ]
+        list_tasks = tasks_by_list.get(task_list.id)
 
         if list_tasks:
             auto_completed = auto_complete_func(list_tasks, task_list)
@@ -45,7 +61,7 @@ def _apply_auto_complete_to_tasks(
 
     if total_auto_completed > 0:
         print(f"✅ {total_auto_completed} parent tasks were auto-completed")
-        tasks = _fetch_from_lists(task_lists, "task lists", fetch_func)
+        tasks = [task for task in tasks if task.status != ItemStatus.COMPLETED]
 
     return tasks
 
@@ -89,7 +105,7 @@ def get_pending_tasks_with_auto_complete() -> List[PlannedItem]:
     task_lists: List[PlannedItemList] = get_task_lists()
     tasks = _fetch_from_lists(task_lists, "task lists", gcp.get_pending_tasks)
 
-    return _apply_auto_complete_to_tasks(tasks, task_lists, gcp.get_pending_tasks, gcp.auto_complete_parent_tasks)
+    return _apply_auto_complete_to_tasks(tasks, task_lists, gcp.auto_complete_parent_tasks)
 
 
 def get_upcoming_events() -> List[PlannedItem]:
@@ -113,27 +129,38 @@ def get_todoist_projects_list() -> List[PlannedItemList]:
     return projects
 
 
+def _fetch_todoist_tasks(project_lists: List[PlannedItemList]) -> List[PlannedItem]:
+    if project_lists:
+        todoist.refresh_task_index()
+    return _fetch_from_lists(project_lists, "Todoist projects", todoist.get_pending_tasks)
+
+
 def get_todoist_pending_tasks() -> List[PlannedItem]:
     project_lists: List[PlannedItemList] = get_todoist_projects_list()
-    return _fetch_from_lists(project_lists, "Todoist projects", todoist.get_pending_tasks)
+    return _fetch_todoist_tasks(project_lists)
 
 
 def get_todoist_pending_tasks_with_auto_complete() -> List[PlannedItem]:
     project_lists: List[PlannedItemList] = get_todoist_projects_list()
-    tasks = _fetch_from_lists(project_lists, "Todoist projects", todoist.get_pending_tasks)
+    tasks = _fetch_todoist_tasks(project_lists)
 
     return _apply_auto_complete_to_tasks(
-        tasks, project_lists, todoist.get_pending_tasks, todoist.auto_complete_parent_tasks
+        tasks, project_lists, todoist.auto_complete_parent_tasks
     )
 
 
 def get_all_pending_tasks() -> List[PlannedItem]:
-    google_tasks = get_pending_tasks()
-    todoist_tasks = get_todoist_pending_tasks()
+    google_tasks, todoist_tasks = run_in_parallel(
+        [get_pending_tasks, get_todoist_pending_tasks]
+    )
     return google_tasks + todoist_tasks
 
 
 def get_all_pending_tasks_with_auto_complete() -> List[PlannedItem]:
-    google_tasks = get_pending_tasks_with_auto_complete()
-    todoist_tasks = get_todoist_pending_tasks_with_auto_complete()
+    google_tasks, todoist_tasks = run_in_parallel(
+        [
+            get_pending_tasks_with_auto_complete,
+            get_todoist_pending_tasks_with_auto_complete,
+        ]
+    )
     return google_tasks + todoist_tasks
@@ -12,6 +12,7 @@ from dotenv import load_dotenv  # type: ignore
 
 class ParameterLoader:
     _ENV_FILEPATH = ".env"
+    _DEFAULT_FETCH_MAX_WORKERS = 1
 
     def __init__(self) -> None:
         self._params: dict[str, Any] = {}
@@ -32,12 +33,21 @@ class ParameterLoader:
             and len(raw_ignored_lists.strip()) > 0
         ):
             ignored_lists = raw_ignored_lists.split(",")
+        fetch_max_workers = ParameterLoader._DEFAULT_FETCH_MAX_WORKERS
+        raw_fetch_max_workers = os.getenv("FETCH_MAX_WORKERS")
+        if (
+            raw_fetch_max_workers
+            and isinstance(raw_fetch_max_workers, str)
+            and raw_fetch_max_workers.strip().isdigit()
+        ):
+            fetch_max_workers = max(1, int(raw_fetch_max_workers.strip()))
         custom_date: Optional[datetime] = None
         now: datetime = custom_date or datetime.now(tzinfo)
         self._params["TZINFO"] = tzinfo
         self._params["NOW"] = now
         self._params["TODAY"] = now.date()
         self._params["IGNORED_LISTS"] = ignored_lists
+        self._params["FETCH_MAX_WORKERS"] = fetch_max_workers
 
     def get(self, key: str) -> Any:
         if key not in self._params:
@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import Optional
+from typing import Optional, Union
 from zoneinfo import ZoneInfo
 
 from src.common.data.utilities import is_event, is_true
@@ -12,19 +12,22 @@ from src.common.datetime.formatting_types import EndContext, StartContext
 from src.model import ItemType
 
 
+DateValue = Union[str, dt.datetime]
+
+
 class DateConverter:
     def __init__(self, timezone: Optional[str] = None) -> None:
         self._timezone = timezone
 
     def convert_start(
         self,
-        start_rfc3339: Optional[str],
+        start_rfc3339: Optional[DateValue],
         context: Optional[StartContext] = None,
     ) -> Optional[str]:
         result: Optional[str] = "-"
         if not start_rfc3339:
             return result
-        if "T" not in start_rfc3339:
+        if isinstance(start_rfc3339, str) and "T" not in start_rfc3339:
             return start_rfc3339
         ctx = context or StartContext()
         try:
@@ -54,18 +57,18 @@ class DateConverter:
             else:
                 result = local_dt.date().isoformat()
         except (ValueError, TypeError):
-            result = start_rfc3339
+            result = str(start_rfc3339)
         return result
 
     def convert_end(
         self,
-        end_rfc3339: Optional[str],
+        end_rfc3339: Optional[DateValue],
         context: Optional[EndContext] = None,
     ) -> str:
         result = "-"
         if not end_rfc3339:
             return result
-        if "T" not in end_rfc3339:
+        if isinstance(end_rfc3339, str) and "T" not in end_rfc3339:
             return end_rfc3339
         ctx = context or EndContext()
         try:
@@ -83,11 +86,13 @@ class DateConverter:
             else:
                 result = local_dt.date().isoformat()
         except (ValueError, TypeError):
-            result = end_rfc3339
+            result = str(end_rfc3339)
         return result
 
     @staticmethod
-    def _parse_datetime(timestamp: str) -> dt.datetime:
+    def _parse_datetime(timestamp: DateValue) -> dt.datetime:
+        if isinstance(timestamp, dt.datetime):
+            return timestamp
         iso_str = timestamp.replace("Z", "+00:00")
         return dt.datetime.fromisoformat(iso_str)
 
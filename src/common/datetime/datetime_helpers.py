@@ -6,7 +6,7 @@ from __future__ import annotations
 from typing import Any, Mapping, Optional
 
 from src.common.data.utilities import is_event, is_true
-from src.common.datetime.date_converter import DateConverter
+from src.common.datetime.date_converter import DateConverter, DateValue
 from src.common.datetime.formatting_types import EndContext, StartContext
 
 
@@ -28,7 +28,7 @@ def end_context_from_kwargs(kwargs: Mapping[str, Any]) -> EndContext:
 
 
 def human_start(
-    start_rfc3339: Optional[str],
+    start_rfc3339: Optional[DateValue],
     tz: Optional[str] = None,
     **kwargs: Any,
 ) -> Optional[str]:
@@ -38,7 +38,7 @@ def human_start(
 
 
 def human_end(
-    end_rfc3339: Optional[str],
+    end_rfc3339: Optional[DateValue],
     tz: Optional[str] = None,
     **kwargs: Any,
 ) -> str:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
 
 from src.model import ItemType, PlannedItemList
@@ -44,8 +45,8 @@ class HumanizeContext:
     calendar_days: int
     is_today_or_tomorrow: bool
     is_on_going: bool
-    start_raw: Optional[str]
-    end_raw: Optional[str]
+    start_at: Optional[datetime]
+    end_at: Optional[datetime]
 
 
 @dataclass(frozen=True)
@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 from datetime import date, timedelta
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from src.common.data.parameters import ParameterLoader
 
@@ -90,6 +90,19 @@ class Period:
         computed = (self.end - self.start).days + (1 if inclusive else 0)
         self.duration: int = duration if user_supplied_duration else computed
 
+    def split(self, days: int) -> List[Period]:
+        if days < 1:
+            raise ValueError("'days' must be >= 1")
+        windows: List[Period] = []
+        window_start = self.start
+        while window_start <= self.end:
+            window_end = min(window_start + timedelta(days=days - 1), self.end)
+            windows.append(
+                Period(start=window_start, end=window_end, inclusive=self._inclusive)
+            )
+            window_start = window_end + timedelta(days=1)
+        return windows
+
     def __repr__(self) -> str:
         return (
             f"Period(start={self.start!r}, end={self.end!r}, "
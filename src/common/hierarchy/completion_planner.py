@@ -0,0 +1,87 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+from src.model import ItemStatus, PlannedItem
+
+CompleteBatch = Callable[[List[PlannedItem]], Dict[str, bool]]
+
+
+@dataclass
+class CompletionPlan:
+    waves: List[List[PlannedItem]] = field(default_factory=list)
+    dependencies: Dict[str, List[str]] = field(default_factory=dict)
+
+    def add(self, item: PlannedItem, wave_index: int, dependencies: List[str]) -> None:
+        while len(self.waves) <= wave_index:
+            self.waves.append([])
+        self.waves[wave_index].append(item)
+        self.dependencies[item.id] = dependencies
+
+    def __len__(self) -> int:
+        return len(self.dependencies)
+
+
+def plan_completions(tasks: Iterable[PlannedItem]) -> CompletionPlan:
+    plan = CompletionPlan()
+    seen: Set[str] = set()
+    done: Dict[int, bool] = {}
+    wave_of: Dict[int, int] = {}
+    stack: List[Tuple[PlannedItem, bool, bool]] = [
+        (task, True, False) for task in reversed(list(tasks)) if task.is_root()
+    ]
+
+    while stack:
+        node, eligible, expanded = stack.pop()
+        if not expanded:
+            eligible = eligible and bool(node.id) and node.id not in seen
+            if eligible:
+                seen.add(node.id)
+            stack.append((node, eligible, True))
+            for child in reversed(node.subitems):
+                stack.append((child, eligible, False))
+            continue
+
+        children_done = all(done[id(child)] for child in node.subitems)
+        planned = (
+            eligible
+            and bool(node.subitems)
+            and node.status != ItemStatus.COMPLETED
+            and children_done
+        )
+        done[id(node)] = children_done and (
+            planned or node.status == ItemStatus.COMPLETED
+        )
+        if planned:
+            planned_children = [c for c in node.subitems if id(c) in wave_of]
+            wave_index = max((wave_of[id(c)] + 1 for c in planned_children), default=0)
+            wave_of[id(node)] = wave_index
+            plan.add(node, wave_index, [c.id for c in planned_children])
+
+    return plan
+
+
+def execute_completion_plan(
+    plan: CompletionPlan, complete_batch: CompleteBatch
+) -> List[PlannedItem]:
+    succeeded: Set[str] = set()
+    completed: List[PlannedItem] = []
+    for wave in plan.waves:
+        ready = [
+            item
+            for item in wave
+            if all(dep in succeeded for dep in plan.dependencies[item.id])
+        ]
+        if not ready:
+            continue
+        results = complete_batch(ready)
+        for item in ready:
+            if results.get(item.id, False):
+                item.status = ItemStatus.COMPLETED
+                succeeded.add(item.id)
+                completed.append(item)
+    return completed
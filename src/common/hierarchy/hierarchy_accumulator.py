@@ -0,0 +1,61 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from typing import Mapping
+
+from src.common.hierarchy.item_mapper_protocol import ItemMapperProtocol
+from src.common.hierarchy.item_node import ItemNode
+from src.common.hierarchy.item_not_found_error import ItemNotFoundError
+from src.common.hierarchy.item_sorter import ItemSorter
+from src.common.hierarchy.parent_policy import ParentPolicy
+
+
+class HierarchyAccumulator:
+    def __init__(
+        self,
+        mapper: ItemMapperProtocol,
+        parent_policy: ParentPolicy,
+        sorter: ItemSorter,
+    ) -> None:
+        self._mapper = mapper
+        self._parent_policy = parent_policy
+        self._sorter = sorter
+        self._items_by_id: dict[str, ItemNode] = {}
+
+    def __len__(self) -> int:
+        return len(self._items_by_id)
+
+    def add(self, raw: Mapping[str, object]) -> None:
+        self.add_entity(self._mapper.to_entity(raw))
+
+    def add_entity(self, node: ItemNode) -> None:
+        if not node.id or node.id in self._items_by_id:
+            return
+        self._items_by_id[node.id] = node
+
+    def finish(self) -> list[ItemNode]:
+        roots: list[ItemNode] = []
+        for node in self._items_by_id.values():
+            parent_id = node.parent
+            if parent_id:
+                parent = self._items_by_id.get(parent_id)
+                if parent:
+                    parent.add_subitem(node)
+                elif self._parent_policy is ParentPolicy.STRICT:
+                    raise ItemNotFoundError(
+                        f"Parent {parent_id} not found for item {node.id}"
+                    )
+                else:
+                    roots.append(node)
+            else:
+                roots.append(node)
+        self._sort_tree(roots)
+        return roots
+
+    def _sort_tree(self, roots: list[ItemNode]) -> None:
+        self._sorter.sort(roots)
+        for node in self._items_by_id.values():
+            if node.subitems:
+                self._sorter.sort(node.subitems)
@@ -3,7 +3,7 @@
 # pylint: disable=missing-function-docstring
 from __future__ import annotations
 
-from typing import Optional, Protocol, runtime_checkable
+from typing import Optional, Protocol, Sequence, runtime_checkable
 
 
 @runtime_checkable
@@ -12,7 +12,7 @@ class ItemNode(Protocol):
     parent: Optional[str]
     title: str
     position: Optional[str]
-    subitems: list[ItemNode]
+    subitems: Sequence[ItemNode]
 
     def add_subitem(self, subitem: ItemNode) -> None: ...
     def is_root(self) -> bool: ...
@@ -0,0 +1,11 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=duplicate-code
+from .file_sync_state_store import FileSyncStateStore
+from .sync_state import SyncState
+from .sync_state_store import SyncStateStore
+
+__all__ = [
+    "FileSyncStateStore",
+    "SyncState",
+    "SyncStateStore",
+]
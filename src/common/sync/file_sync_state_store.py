@@ -0,0 +1,45 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+from src.common.sync.sync_state import SyncState
+
+
+class FileSyncStateStore:
+    def __init__(self, directory: Optional[Path] = None) -> None:
+        self._directory = directory or Path(os.getenv("SYNC_STATE_DIR", "config/sync"))
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self._directory / f"{digest}.json"
+
+    def read(self, key: str) -> Optional[SyncState]:
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            print(f"Invalid sync state in {path}: {exc}")
+            return None
+        if not isinstance(data, dict) or data.get("key") != key:
+            return None
+        return SyncState.from_dict(data)
+
+    def write(self, key: str, state: SyncState) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        serialized = json.dumps({"key": key, **state.to_dict()})
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(serialized, encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
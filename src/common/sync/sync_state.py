@@ -0,0 +1,32 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class SyncState:
+    token: Optional[str] = None
+    synced_at: Optional[str] = None
+    scope: Optional[str] = None
+    items: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "token": self.token,
+            "synced_at": self.synced_at,
+            "scope": self.scope,
+            "items": self.items,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SyncState":
+        return cls(
+            token=data.get("token"),
+            synced_at=data.get("synced_at"),
+            scope=data.get("scope"),
+            items=dict(data.get("items") or {}),
+        )
@@ -0,0 +1,19 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from typing import Optional, Protocol
+
+from src.common.sync.sync_state import SyncState
+
+
+class SyncStateStore(Protocol):
+    def read(self, key: str) -> Optional[SyncState]:
+        raise NotImplementedError
+
+    def write(self, key: str, state: SyncState) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
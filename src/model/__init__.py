@@ -4,9 +4,10 @@
 # pylint: disable=duplicate-code
 from .core import (DataSource, DataSourceError, ItemGroup, ItemStatus,
                    ItemStatusError, ItemType, ItemTypeError, PlannedItem,
-                   PlannedItemDataSource, PlannedItemDataSourceError,
-                   PlannedItemGroup, PlannedItemStatus, PlannedItemStatusError,
-                   PlannedItemType, PlannedItemTypeError)
+                   PlannedItemBatch, PlannedItemDataSource,
+                   PlannedItemDataSourceError, PlannedItemGroup,
+                   PlannedItemStatus, PlannedItemStatusError, PlannedItemType,
+                   PlannedItemTypeError)
 from .list import (ItemList, ListMetadata, PlannedItemList,
                    PlannedItemListMetadata)
 from .protocols import ItemLike, ItemLineFormatter, ItemRenderer
@@ -22,6 +23,7 @@ __all__ = [
     "ItemStatusError",
     "DataSourceError",
     "PlannedItem",
+    "PlannedItemBatch",
     "ItemList",
     "ListMetadata",
     "DateRules",
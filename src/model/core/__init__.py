@@ -9,6 +9,7 @@ from .exceptions import (DataSourceError, ItemStatusError, ItemTypeError,
                          PlannedItemDataSourceError, PlannedItemStatusError,
                          PlannedItemTypeError)
 from .planned_item import PlannedItem
+from .planned_item_batch import PlannedItemBatch
 
 __all__ = [
     "ItemType",
@@ -19,6 +20,7 @@ __all__ = [
     "ItemStatusError",
     "DataSourceError",
     "PlannedItem",
+    "PlannedItemBatch",
     "PlannedItemType",
     "PlannedItemStatus",
     "PlannedItemDataSource",
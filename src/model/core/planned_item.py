@@ -4,22 +4,30 @@
 # pylint: disable=missing-function-docstring
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+import sys
+from dataclasses import InitVar, asdict, dataclass, field
+from functools import partial, wraps
 from datetime import datetime, time, timedelta
-from typing import Any, Dict, Final, List, Optional
+from typing import (Any, Dict, Final, Iterable, List, Mapping, Optional,
+                    Sequence, Tuple)
 from zoneinfo import ZoneInfo
 
 from src.common.data.parameters import ParameterLoader
 from src.common.datetime.period import Period
 from src.model.core.enums import DataSource, ItemGroup, ItemStatus, ItemType
 from src.model.list import ItemList
-from src.model.rules import DateRules
+from src.model.rules import DateRules, GroupBoundaries
 
 params = ParameterLoader()
 tzinfo: ZoneInfo = params.get("TZINFO")
-now: datetime = params.get("NOW")
-today: datetime.date = params.get("TODAY")
 UNTITLED: Final[str] = "(untitled)"
+NO_LINKS: Final[Tuple[Dict[str, Any], ...]] = ()
+NO_SUBITEMS: Final[Tuple[PlannedItem, ...]] = ()
+LEGACY_DATE_KEYWORDS: Final[Dict[str, str]] = {
+    "start_raw": "start_rfc3339",
+    "end_raw": "end_rfc3339",
+    "updated_raw": "updated_rfc3339",
+}
 
 
 def parse_rfc3339(
@@ -42,6 +50,18 @@ def parse_rfc3339(
     return dt.astimezone(tzinfo)
 
 
+def _epoch(value: Optional[datetime]) -> Optional[float]:
+    return None if value is None else value.timestamp()
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return None if value is None else value.isoformat()
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return None if value is None else sys.intern(value)
+
+
 def _clean_str(value: Optional[str]) -> Optional[str]:
     if value is None:
         return None
@@ -49,7 +69,7 @@ def _clean_str(value: Optional[str]) -> Optional[str]:
     return trimmed or None
 
 
-@dataclass
+@dataclass(slots=True)
 class PlannedItem:
     kind: Optional[str] = None
     id: Optional[str] = None
@@ -60,9 +80,9 @@ class PlannedItem:
     title: str = UNTITLED
     notes: Optional[str] = None
     status: Optional[ItemStatus] = None
-    start_raw: Optional[str] = None
-    end_raw: Optional[str] = None
-    updated_raw: Optional[str] = None
+    start_rfc3339: InitVar[Optional[str]] = None
+    end_rfc3339: InitVar[Optional[str]] = None
+    updated_rfc3339: InitVar[Optional[str]] = None
     parent: Optional[str] = None
     position: Optional[str] = None
     priority: Optional[int] = None
@@ -71,15 +91,25 @@ class PlannedItem:
     labels: Optional[List[str]] = None
     hidden: bool = False
     deleted: bool = False
-    links: List[Dict[str, Any]] = field(default_factory=list)
-    assignment_info: Dict[str, Any] = field(default_factory=dict)
-    subitems: List[PlannedItem] = field(default_factory=list)
+    links: Optional[Sequence[Dict[str, Any]]] = NO_LINKS
+    assignment_info: Optional[Dict[str, Any]] = None
+    subitems: Sequence[PlannedItem] = NO_SUBITEMS
     planned_item_list: Optional[ItemList] = None
     data_source: Optional[DataSource] = None
-    _calculated_dates = DateRules.calculate_dates()
-
-    def __post_init__(self) -> None:
-        self.kind = _clean_str(self.kind)
+    start_at: Optional[datetime] = None
+    end_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    start_ts: Optional[float] = field(default=None, init=False, repr=False)
+    end_ts: Optional[float] = field(default=None, init=False, repr=False)
+    updated_ts: Optional[float] = field(default=None, init=False, repr=False)
+
+    def __post_init__(
+        self,
+        start_rfc3339: Optional[str],
+        end_rfc3339: Optional[str],
+        updated_rfc3339: Optional[str],
+    ) -> None:
+        self.kind = _intern(_clean_str(self.kind))
         self.id = _clean_str(self.id)
         self.etag = _clean_str(self.etag)
         self.self_link = _clean_str(self.self_link)
@@ -88,6 +118,10 @@ class PlannedItem:
         self.notes = _clean_str(self.notes)
         self.parent = _clean_str(self.parent)
         self.position = _clean_str(self.position)
+        self.project_id = _intern(self.project_id)
+        self.section_id = _intern(self.section_id)
+        if self.labels:
+            self.labels = [sys.intern(label) for label in self.labels]
         if self.status is not None and not isinstance(self.status, ItemStatus):
             raise TypeError("status must be a Status or None")
         if self.type is None or not isinstance(self.type, ItemType):
@@ -96,38 +130,61 @@ class PlannedItem:
             self.data_source, DataSource
         ):
             raise TypeError("data_source must be a DataSource or None")
-        for name in ("start_raw", "end_raw", "updated_raw"):
-            raw = getattr(self, name)
-            if raw is not None:
-                parsed = parse_rfc3339(
-                    raw, keep_midnight_local=(self.type == ItemType.TASK)
-                )
-                setattr(self, name, None if parsed is None else parsed.isoformat())
-        if (
-            self.type == ItemType.EVENT
-            and self.start_raw is not None
-            and self.end_raw is not None
-        ):
-            dt = datetime.fromisoformat(self.end_raw)
-            if dt.time() == datetime.min.time():
-                dt = dt - timedelta(seconds=1)
-                self.end_raw = dt.isoformat()
+        self._parse_dates(start_rfc3339, end_rfc3339, updated_rfc3339)
         for st in self.subitems:
             if st is self:
                 raise ValueError("PlannedItem cannot be its own subitem")
 
-    def _get_dt(self, attr: str) -> Optional[datetime]:
-        return parse_rfc3339(
-            getattr(self, attr), keep_midnight_local=(self.type == ItemType.TASK)
-        )
+    def _parse_dates(
+        self,
+        start_rfc3339: Optional[str],
+        end_rfc3339: Optional[str],
+        updated_rfc3339: Optional[str],
+    ) -> None:
+        keep_midnight_local = self.type == ItemType.TASK
+        start_at = self.start_at
+        end_at = self.end_at
+        updated_at = self.updated_at
+        if start_rfc3339:
+            start_at = parse_rfc3339(start_rfc3339, keep_midnight_local=keep_midnight_local)
+        if end_rfc3339:
+            end_at = parse_rfc3339(end_rfc3339, keep_midnight_local=keep_midnight_local)
+            if (
+                self.type == ItemType.EVENT
+                and start_at is not None
+                and end_at.time() == datetime.min.time()
+            ):
+                end_at = end_at - timedelta(seconds=1)
+        if updated_rfc3339:
+            updated_at = parse_rfc3339(
+                updated_rfc3339, keep_midnight_local=keep_midnight_local
+            )
+        self.set_dates(start_at, end_at, updated_at)
 
     @property
-    def start_at(self) -> Optional[datetime]:
-        return self._get_dt("start_raw")
+    def start_raw(self) -> Optional[str]:
+        return _isoformat(self.start_at)
 
     @property
-    def end_at(self) -> Optional[datetime]:
-        return self._get_dt("end_raw")
+    def end_raw(self) -> Optional[str]:
+        return _isoformat(self.end_at)
+
+    @property
+    def updated_raw(self) -> Optional[str]:
+        return _isoformat(self.updated_at)
+
+    def set_dates(
+        self,
+        start_at: Optional[datetime],
+        end_at: Optional[datetime],
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        self.start_at = start_at
+        self.end_at = end_at
+        self.updated_at = updated_at
+        self.start_ts = _epoch(start_at)
+        self.end_ts = _epoch(end_at)
+        self.updated_ts = _epoch(updated_at)
 
     def is_root(self) -> bool:
         return self.parent is None
@@ -135,9 +192,16 @@ class PlannedItem:
     def add_subitem(self, subitem: PlannedItem) -> None:
         if subitem is self:
             raise ValueError("PlannedItem cannot be its own subitem")
+        if not isinstance(self.subitems, list):
+            self.subitems = list(self.subitems)
         if subitem not in self.subitems:
             self.subitems.append(subitem)
 
+    def add_link(self, link: Dict[str, Any]) -> None:
+        if not isinstance(self.links, list):
+            self.links = list(self.links or ())
+        self.links.append(link)
+
     def is_all_day(self) -> bool:
         if self.type == ItemType.TASK:
             return True
@@ -161,9 +225,14 @@ class PlannedItem:
     def is_ongoing(self) -> bool:
         if self.type != ItemType.EVENT:
             raise NotImplementedError("is_ongoing() is supported just for events")
-        start = self.start_at
-        end = self.end_at
-        return start and end and start <= now <= end and not self.is_all_day()
+        return self.spans_instant(DateRules.now().timestamp()) and not self.is_all_day()
+
+    def spans_instant(self, ts: float) -> bool:
+        return (
+            self.start_ts is not None
+            and self.end_ts is not None
+            and self.start_ts <= ts <= self.end_ts
+        )
 
     def calendar_days(self) -> int:
         if self.type == ItemType.TASK:
@@ -207,7 +276,7 @@ class PlannedItem:
         start = self.start_at
         if not start:
             return None
-        delta: timedelta = start - now
+        delta: timedelta = start - DateRules.now()
         total_seconds = int(delta.total_seconds())
         if total_seconds % 60 == 59:
             total_seconds += 1
@@ -231,6 +300,7 @@ class PlannedItem:
         end = self.end_at
         if not end or not start:
             return None
+        now = DateRules.now()
         if not start <= now < end:
             return None
         delta: timedelta = end - now
@@ -254,20 +324,29 @@ class PlannedItem:
         return f"PlannedItem({asdict(self)!r})"
 
     @staticmethod
-    def sort(items: List[PlannedItem]) -> List[PlannedItem]:
-        def task_ref_dt(it: PlannedItem) -> Optional[datetime]:
-            return it.start_at or it.end_at
+    def group_by_list(
+        items: Iterable[PlannedItem],
+    ) -> Dict[Optional[str], List[PlannedItem]]:
+        groups: Dict[Optional[str], List[PlannedItem]] = {}
+        for it in items:
+            list_id = it.planned_item_list.id if it.planned_item_list else None
+            groups.setdefault(list_id, []).append(it)
+        return groups
 
-        def effective_start(it: PlannedItem) -> Optional[datetime]:
-            return task_ref_dt(it) if it.type == ItemType.TASK else it.start_at
+    @staticmethod
+    def sort(items: List[PlannedItem]) -> List[PlannedItem]:
+        def effective_start_ts(it: PlannedItem) -> Optional[float]:
+            if it.type == ItemType.TASK and it.start_ts is None:
+                return it.end_ts
+            return it.start_ts
 
-        def local_date(dt: Optional[datetime]) -> Optional[datetime.date]:
-            return None if dt is None else dt.astimezone(tzinfo).date()
+        now_ts = DateRules.now().timestamp()
+        today = DateRules.today()
 
         def category(it: PlannedItem) -> int:
             start = it.start_at
             end = it.end_at
-            start_d = local_date(start)
+            start_d = DateRules.local_date(start)
             category: int = 4
             if it.type == ItemType.TASK:
                 if (it.status == ItemStatus.COMPLETED) or (start_d and start_d < today):
@@ -277,11 +356,13 @@ class PlannedItem:
                 if start_d == today:
                     category = 3
             elif it.type == ItemType.EVENT:
-                if (end and end < now) or (start and start < now):
+                if (it.end_ts is not None and it.end_ts < now_ts) or (
+                    it.start_ts is not None and it.start_ts < now_ts
+                ):
                     category = 1
                 if start is None and end is None:
                     category = 2
-                if (start and end and start <= now <= end) or (start_d == today):
+                if it.spans_instant(now_ts) or (start_d == today):
                     category = 3
             else:
                 raise NotImplementedError(f"Unknown item type: {it.type}")
@@ -314,11 +395,11 @@ class PlannedItem:
             cat = category(it)
             sta = status(it)
             typ = item_type(it)
-            ref = effective_start(it)
+            ref = effective_start_ts(it)
             tkey = title_key(it)
             if cat == 2 or ref is None:
                 return (cat, sta, typ, tkey)
-            return (cat, ref.astimezone(tzinfo), sta, typ, tkey)
+            return (cat, ref, sta, typ, tkey)
 
         return sorted(items, key=keyfn)
 
@@ -326,6 +407,7 @@ class PlannedItem:
     def dynamic_span(
         entries: list[PlannedItem],
     ) -> tuple[datetime.date, datetime.date]:
+        today = DateRules.today()
         if not entries:
             return today, today
         s_min: Optional[datetime.date] = None
@@ -356,25 +438,44 @@ class PlannedItem:
         }
 
     @staticmethod
-    def _init_groups(groups: list[str]) -> dict[str, list[PlannedItem]]:
+    def init_groups(groups: list[str]) -> dict[str, list[PlannedItem]]:
         return {g: [] for g in groups}
 
     @staticmethod
-    def _group_for_task(  # noqa: PLR0911
-        it: PlannedItem,
+    def _task_group_for_date(
+        start_d: datetime.date,
         *,
-        cd: dict[str, datetime.date | int],
+        cd: Mapping[str, datetime.date | int],
+        enabled: dict[str, bool],
+    ) -> Optional[ItemGroup]:
+        today = DateRules.today()
+        if start_d == today:
+            return ItemGroup.TODAY
+        if start_d < today:
+            return ItemGroup.DUED
+        return PlannedItem._upcoming_group_for_date(start_d, cd=cd, enabled=enabled)
+
+    @staticmethod
+    def _event_group_for_date(
+        start_d: datetime.date,
+        *,
+        cd: Mapping[str, datetime.date | int],
+        enabled: dict[str, bool],
+    ) -> Optional[ItemGroup]:
+        if start_d == DateRules.today():
+            return ItemGroup.TODAY
+        return PlannedItem._upcoming_group_for_date(start_d, cd=cd, enabled=enabled)
+
+    @staticmethod
+    def _upcoming_group_for_date(  # noqa: PLR0911
+        start_d: datetime.date,
+        *,
+        cd: Mapping[str, datetime.date | int],
         enabled: dict[str, bool],
     ) -> Optional[ItemGroup]:
-        start_d = DateRules.local_date(it.start_at)
         result: Optional[ItemGroup] = None
-        if it.status == ItemStatus.COMPLETED:
-            result = ItemGroup.DUED
-        elif start_d is None or start_d == today:
-            result = ItemGroup.TODAY
-        elif start_d < today:
-            result = ItemGroup.DUED
-        elif start_d == today + timedelta(days=1):
+        today = DateRules.today()
+        if start_d == today + timedelta(days=1):
             result = ItemGroup.TOMORROW
         elif (
             cd["wd"] == 4
@@ -405,78 +506,72 @@ class PlannedItem:
         return result
 
     @staticmethod
-    def _group_for_event(  # noqa: PLR0911
-        it: PlannedItem,
-        *,
-        cd: dict[str, datetime.date | int],
+    def group_tables(
+        cd: Mapping[str, datetime.date | int],
         enabled: dict[str, bool],
+    ) -> dict[ItemType, GroupBoundaries]:
+        today = DateRules.today()
+        return {
+            ItemType.TASK: GroupBoundaries.spanning(
+                partial(PlannedItem._task_group_for_date, cd=cd, enabled=enabled),
+                cd,
+                today,
+            ),
+            ItemType.EVENT: GroupBoundaries.spanning(
+                partial(PlannedItem._event_group_for_date, cd=cd, enabled=enabled),
+                cd,
+                today,
+            ),
+        }
+
+    @staticmethod
+    def _group_for_task(
+        it: PlannedItem, *, boundaries: GroupBoundaries
+    ) -> Optional[ItemGroup]:
+        if it.status == ItemStatus.COMPLETED:
+            return ItemGroup.DUED
+        start_d = DateRules.local_date(it.start_at)
+        if start_d is None:
+            return ItemGroup.TODAY
+        return boundaries.classify(start_d)
+
+    @staticmethod
+    def _group_for_event(
+        it: PlannedItem, *, boundaries: GroupBoundaries
     ) -> Optional[ItemGroup]:
         start = it.start_at
         end = it.end_at
-        start_d = DateRules.local_date(start)
-        result: Optional[ItemGroup] = None
         if it.is_ongoing():
-            result = ItemGroup.ON_GOING
-        elif start is None and end is None:
-            result = ItemGroup.TODAY
-        elif (start and end and start <= now <= end) or (start_d == today):
-            result = ItemGroup.TODAY
-        elif start_d == today + timedelta(days=1):
-            result = ItemGroup.TOMORROW
-        elif (
-            cd["wd"] == 4
-            and enabled.get(ItemGroup.THIS_SUNDAY, False)
-            and start_d == cd["this_week_sun"]
-        ):
-            result = ItemGroup.THIS_SUNDAY
-        elif start_d:
-            if enabled.get(ItemGroup.THIS_WEEKEND, False) and DateRules.in_this_weekend(
-                start_d
-            ):
-                result = ItemGroup.THIS_WEEKEND
-            elif DateRules.in_rest_of_this_week(start_d) and DateRules.is_weekday(
-                start_d
-            ):
-                result = ItemGroup.REST_OF_THIS_WEEK
-            elif DateRules.in_next_week_range(start_d):
-                result = ItemGroup.NEXT_WEEK
-            elif (
-                start_d.month == today.month
-                and start_d.year == today.year
-                and start_d > cd["this_week_sun"]
-            ):
-                result = ItemGroup.REST_OF_THIS_MONTH
-            elif (
-                today.month == 12
-                and start_d.month == 1
-                and start_d.year == today.year + 1
-            ) or (start_d.month == today.month + 1 and start_d.year == today.year):
-                result = ItemGroup.NEXT_MONTH
-            elif start_d >= cd["first_month_after_next"]:
-                result = ItemGroup.FUTURE
-        return result
+            return ItemGroup.ON_GOING
+        if start is None and end is None:
+            return ItemGroup.TODAY
+        if it.spans_instant(DateRules.now().timestamp()):
+            return ItemGroup.TODAY
+        start_d = DateRules.local_date(start)
+        if start_d is None:
+            return None
+        return boundaries.classify(start_d)
 
     @staticmethod
     def _group_for_item(
         it: PlannedItem,
         *,
-        cd: dict[str, datetime.date | int],
-        enabled: dict[str, bool],
+        tables: dict[ItemType, GroupBoundaries],
     ) -> Optional[ItemGroup]:
         if it.type == ItemType.TASK:
-            return PlannedItem._group_for_task(it, cd=cd, enabled=enabled)
+            return PlannedItem._group_for_task(it, boundaries=tables[ItemType.TASK])
         if it.type == ItemType.EVENT:
-            return PlannedItem._group_for_event(it, cd=cd, enabled=enabled)
+            return PlannedItem._group_for_event(it, boundaries=tables[ItemType.EVENT])
         raise NotImplementedError(f"Unknown item type: {it.type}")
 
     @staticmethod
-    def _maybe_promote_this_friday(
+    def maybe_promote_this_friday(
         groups: dict[ItemGroup, list[PlannedItem]],
     ) -> None:
         rotw = groups.get(ItemGroup.REST_OF_THIS_WEEK, [])
         if not rotw:
             return
-        cd = PlannedItem._calculated_dates
+        cd = DateRules.calculate_dates()
         if all(
             DateRules.is_exactly_on(
                 cd["this_week_fri"], it.type, it.start_at, it.end_at
@@ -487,7 +582,7 @@ class PlannedItem:
             groups[ItemGroup.REST_OF_THIS_WEEK] = []
 
     @staticmethod
-    def _compute_enabled_flags(wd: int) -> dict[str, bool]:
+    def compute_enabled_flags(wd: int) -> dict[str, bool]:
         base = PlannedItem._enabled_week_flags(wd)
         base.setdefault(ItemGroup.THIS_WEEKEND, True)
         base.setdefault(ItemGroup.THIS_SUNDAY, True)
@@ -497,20 +592,21 @@ class PlannedItem:
     def _distribute_into_buckets(
         items: list[PlannedItem],
         order: list[str],
-        cd: dict[str, datetime.date | int],
+        cd: Mapping[str, datetime.date | int],
         enabled: dict[str, bool],
     ) -> dict[ItemGroup, list[PlannedItem]]:
-        buckets: dict[ItemGroup, list[PlannedItem]] = PlannedItem._init_groups(order)
+        buckets: dict[ItemGroup, list[PlannedItem]] = PlannedItem.init_groups(order)
+        tables = PlannedItem.group_tables(cd, enabled)
         for it in items:
-            group = PlannedItem._group_for_item(it, cd=cd, enabled=enabled)
+            group = PlannedItem._group_for_item(it, tables=tables)
             if group is None:
                 continue
             buckets.setdefault(group, []).append(it)
-        PlannedItem._maybe_promote_this_friday(buckets)
+        PlannedItem.maybe_promote_this_friday(buckets)
         return buckets
 
     @staticmethod
-    def _dedupe_after_month(
+    def dedupe_after_month(
         order: list[str],
         buckets: dict[ItemGroup, list[PlannedItem]],
     ) -> None:
@@ -534,7 +630,7 @@ class PlannedItem:
             buckets[g] = filtered
 
     @staticmethod
-    def _build_result(
+    def build_result(
         order: list[str],
         buckets: dict[ItemGroup, list[PlannedItem]],
     ) -> dict[str, tuple[Period, list[PlannedItem]]]:
@@ -554,11 +650,28 @@ class PlannedItem:
     def time_grouper(
         items: list[PlannedItem],
     ) -> dict[str, tuple[Period, list[PlannedItem]]]:
-        cd = PlannedItem._calculated_dates
-        enabled = PlannedItem._compute_enabled_flags(cd["wd"])
+        cd = DateRules.calculate_dates()
+        enabled = PlannedItem.compute_enabled_flags(cd["wd"])
         order = ItemGroup.ordered()
         buckets = PlannedItem._distribute_into_buckets(
             items=items, order=order, cd=cd, enabled=enabled
         )
-        PlannedItem._dedupe_after_month(order=order, buckets=buckets)
-        return PlannedItem._build_result(order=order, buckets=buckets)
+        PlannedItem.dedupe_after_month(order=order, buckets=buckets)
+        return PlannedItem.build_result(order=order, buckets=buckets)
+
+
+def _accept_legacy_date_keywords(init):
+    @wraps(init)
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        for legacy, current in LEGACY_DATE_KEYWORDS.items():
+            if legacy not in kwargs:
+                continue
+            if current in kwargs:
+                raise TypeError(f"{legacy} is an alias of {current}; pass only one")
+            kwargs[current] = kwargs.pop(legacy)
+        init(self, *args, **kwargs)
+
+    return __init__
+
+
+PlannedItem.__init__ = _accept_legacy_date_keywords(PlannedItem.__init__)
@@ -0,0 +1,231 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Dict, Final, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from src.common.datetime.period import Period
+from src.model.core.enums import ItemGroup, ItemStatus, ItemType
+from src.model.core.planned_item import PlannedItem
+from src.model.rules import DateRules, GroupBoundaries
+
+_EPOCH: Final[datetime] = datetime(1970, 1, 1)
+_SECONDS_PER_DAY: Final[int] = 86400
+_NO_GROUP: Final[int] = -1
+_STATUS_RANKS: Final[Dict[ItemStatus, int]] = {
+    ItemStatus.NEEDS_ACTION: 1,
+    ItemStatus.CONFIRMED: 2,
+    ItemStatus.TENTATIVE: 3,
+    ItemStatus.COMPLETED: 4,
+    ItemStatus.CANCELLED: 5,
+}
+_OTHER_STATUS_RANK: Final[int] = 6
+_TYPE_RANKS: Final[Dict[ItemType, int]] = {ItemType.TASK: 1, ItemType.EVENT: 2}
+_OTHER_TYPE_RANK: Final[int] = 3
+
+
+def _wall_seconds(dt: Optional[datetime]) -> float:
+    if dt is None:
+        return np.nan
+    return (dt.replace(tzinfo=None) - _EPOCH).total_seconds()
+
+
+def _epoch_day(d: date) -> int:
+    return (d - _EPOCH.date()).days
+
+
+def _classify_days(boundaries: GroupBoundaries, days: np.ndarray) -> np.ndarray:
+    starts = np.array([_epoch_day(d) for d in boundaries.starts], dtype=np.float64)
+    group_ids = np.array(
+        [_NO_GROUP if g is None else g.id for g in boundaries.groups], dtype=np.int64
+    )
+    return group_ids[np.maximum(np.searchsorted(starts, days, side="right") - 1, 0)]
+
+
+class PlannedItemBatch:
+    def __init__(self, items: Sequence[PlannedItem]) -> None:
+        self.items: List[PlannedItem] = list(items)
+        count = len(self.items)
+        self.start_ts = np.fromiter(
+            (np.nan if it.start_ts is None else it.start_ts for it in self.items),
+            dtype=np.float64,
+            count=count,
+        )
+        self.end_ts = np.fromiter(
+            (np.nan if it.end_ts is None else it.end_ts for it in self.items),
+            dtype=np.float64,
+            count=count,
+        )
+        self.start_wall = np.fromiter(
+            (_wall_seconds(it.start_at) for it in self.items), dtype=np.float64, count=count
+        )
+        self.end_wall = np.fromiter(
+            (_wall_seconds(it.end_at) for it in self.items), dtype=np.float64, count=count
+        )
+        self.type_ranks = np.fromiter(
+            (_TYPE_RANKS.get(it.type, _OTHER_TYPE_RANK) for it in self.items),
+            dtype=np.int8,
+            count=count,
+        )
+        self.status_ranks = np.fromiter(
+            (_STATUS_RANKS.get(it.status, _OTHER_STATUS_RANK) for it in self.items),
+            dtype=np.int8,
+            count=count,
+        )
+        list_codes: Dict[Optional[str], int] = {}
+        self.list_codes = np.fromiter(
+            (
+                list_codes.setdefault(
+                    it.planned_item_list.id if it.planned_item_list else None,
+                    len(list_codes),
+                )
+                for it in self.items
+            ),
+            dtype=np.int32,
+            count=count,
+        )
+        self.list_ids: List[Optional[str]] = list(list_codes)
+        titles = np.array(
+            [(it.title or "").strip().casefold() for it in self.items], dtype=np.str_
+        )
+        if count:
+            _, self.title_ranks = np.unique(titles, return_inverse=True)
+        else:
+            self.title_ranks = np.zeros(0, dtype=np.intp)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @property
+    def is_task(self) -> np.ndarray:
+        return self.type_ranks == _TYPE_RANKS[ItemType.TASK]
+
+    @property
+    def is_event(self) -> np.ndarray:
+        return self.type_ranks == _TYPE_RANKS[ItemType.EVENT]
+
+    @property
+    def start_day(self) -> np.ndarray:
+        return np.floor(self.start_wall / _SECONDS_PER_DAY)
+
+    def _check_types(self) -> None:
+        unknown = np.flatnonzero(self.type_ranks == _OTHER_TYPE_RANK)
+        if unknown.size:
+            raise NotImplementedError(
+                f"Unknown item type: {self.items[unknown[0]].type}"
+            )
+
+    def _ongoing_window(self) -> np.ndarray:
+        now_ts = DateRules.now().timestamp()
+        return (self.start_ts <= now_ts) & (now_ts <= self.end_ts)
+
+    def is_all_day(self) -> np.ndarray:
+        start_sod = np.mod(self.start_wall, _SECONDS_PER_DAY)
+        end_sod = np.mod(self.end_wall, _SECONDS_PER_DAY)
+        duration = np.mod(self.end_wall - self.start_wall, _SECONDS_PER_DAY)
+        events = (
+            (start_sod == 0)
+            & (end_sod == _SECONDS_PER_DAY - 1)
+            & (duration == _SECONDS_PER_DAY - 1)
+        )
+        return self.is_task | (self.is_event & events)
+
+    def categories(self) -> np.ndarray:
+        self._check_types()
+        now_ts = DateRules.now().timestamp()
+        today_day = _epoch_day(DateRules.today())
+        has_start = ~np.isnan(self.start_ts)
+        has_end = ~np.isnan(self.end_ts)
+        start_day = self.start_day
+        is_task = self.is_task
+        completed = self.status_ranks == _STATUS_RANKS[ItemStatus.COMPLETED]
+        cat = np.full(len(self), 4, dtype=np.int8)
+        cat[is_task & (completed | (start_day < today_day))] = 1
+        cat[is_task & ~has_start] = 2
+        cat[is_task & (start_day == today_day)] = 3
+        is_event = ~is_task
+        cat[is_event & ((self.end_ts < now_ts) | (self.start_ts < now_ts))] = 1
+        cat[is_event & ~has_start & ~has_end] = 2
+        cat[is_event & (self._ongoing_window() | (start_day == today_day))] = 3
+        return cat
+
+    def argsort(self) -> np.ndarray:
+        cat = self.categories()
+        ref = np.where(self.is_task & np.isnan(self.start_ts), self.end_ts, self.start_ts)
+        short_key = (cat == 2) | np.isnan(ref)
+        return np.lexsort(
+            (
+                self.title_ranks,
+                self.type_ranks,
+                self.status_ranks,
+                np.where(short_key, 0.0, ref),
+                ~short_key,
+                cat,
+            )
+        )
+
+    def sort(self) -> List[PlannedItem]:
+        return [self.items[i] for i in self.argsort()]
+
+    def group_ids(
+        self,
+        cd: Mapping[str, date | int],
+        enabled: dict[str, bool],
+    ) -> np.ndarray:
+        self._check_types()
+        tables = PlannedItem.group_tables(cd, enabled)
+        has_start = ~np.isnan(self.start_ts)
+        has_end = ~np.isnan(self.end_ts)
+        is_task = self.is_task
+        is_event = self.is_event
+        completed = self.status_ranks == _STATUS_RANKS[ItemStatus.COMPLETED]
+        ongoing = self._ongoing_window()
+        start_day = np.where(has_start, self.start_day, 0)
+        conditions = [
+            is_task & completed,
+            is_task & ~has_start,
+            is_task,
+            is_event & ongoing & ~self.is_all_day(),
+            is_event & ~has_start & ~has_end,
+            is_event & ongoing,
+            is_event & has_start,
+        ]
+        choices = [
+            ItemGroup.DUED.id,
+            ItemGroup.TODAY.id,
+            _classify_days(tables[ItemType.TASK], start_day),
+            ItemGroup.ON_GOING.id,
+            ItemGroup.TODAY.id,
+            ItemGroup.TODAY.id,
+            _classify_days(tables[ItemType.EVENT], start_day),
+        ]
+        return np.select(conditions, choices, default=_NO_GROUP)
+
+    def group_by_list(self) -> Dict[Optional[str], List[PlannedItem]]:
+        order = np.argsort(self.list_codes, kind="stable")
+        bounds = np.searchsorted(
+            self.list_codes[order], np.arange(1, len(self.list_ids))
+        )
+        return {
+            list_id: [self.items[i] for i in indices]
+            for list_id, indices in zip(self.list_ids, np.split(order, bounds))
+        }
+
+    def time_grouper(self) -> dict[str, tuple[Period, list[PlannedItem]]]:
+        cd = DateRules.calculate_dates()
+        enabled = PlannedItem.compute_enabled_flags(cd["wd"])
+        order = ItemGroup.ordered()
+        group_ids = self.group_ids(cd, enabled)
+        buckets: dict[ItemGroup, list[PlannedItem]] = PlannedItem.init_groups(order)
+        for group in order:
+            buckets[group] = [self.items[i] for i in np.flatnonzero(group_ids == group.id)]
+        PlannedItem.maybe_promote_this_friday(buckets)
+        PlannedItem.dedupe_after_month(order=order, buckets=buckets)
+        return PlannedItem.build_result(order=order, buckets=buckets)
+
+
+__all__ = ["PlannedItemBatch"]
@@ -3,6 +3,7 @@
 # pylint: disable=missing-function-docstring
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Literal, Optional
 
@@ -11,12 +12,16 @@ from src.model.list.list_metadata import ListMetadata
 Kind = Literal["calendar", "tasklist"]
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemList:
     kind: Kind
     id: str
     name: Optional[str] = None
     metadata: Optional[ListMetadata] = None
 
+    def __post_init__(self) -> None:
+        self.kind = sys.intern(self.kind)
+        self.id = sys.intern(self.id)
+
 
 PlannedItemList = ItemList
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ListMetadata:
     access_role: Optional[str] = None
     time_zone: Optional[str] = None
@@ -3,6 +3,7 @@
 # pylint: disable=missing-function-docstring
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Iterable, Optional, Protocol, Sequence, runtime_checkable
 
 from src.model import ItemStatus, PlannedItemList
@@ -14,6 +15,8 @@ class ItemLike(Protocol):
     status: Optional[ItemStatus]
     start_raw: Optional[str]
     end_raw: Optional[str]
+    start_at: Optional[datetime]
+    end_at: Optional[datetime]
     subitems: Sequence[ItemLike]
     planned_item_list: Optional[PlannedItemList]
 
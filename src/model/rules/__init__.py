@@ -2,9 +2,15 @@
 # pylint: disable=missing-class-docstring
 # pylint: disable=missing-function-docstring
 # pylint: disable=duplicate-code
+from .clock import Clock, FixedClock, SystemClock
 from .date_rules import DateRules, PlannedItemDateRules
+from .group_boundaries import GroupBoundaries
 
 __all__ = [
+    "Clock",
     "DateRules",
+    "FixedClock",
+    "GroupBoundaries",
     "PlannedItemDateRules",
+    "SystemClock",
 ]
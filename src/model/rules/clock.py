@@ -0,0 +1,46 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, tzinfo
+from typing import Protocol, runtime_checkable
+
+
+@runtime_checkable
+class Clock(Protocol):
+    @property
+    def tzinfo(self) -> tzinfo: ...
+
+    @property
+    def now(self) -> datetime: ...
+
+    @property
+    def today(self) -> date: ...
+
+
+@dataclass(frozen=True)
+class FixedClock:
+    tzinfo: tzinfo
+    now: datetime
+
+    @property
+    def today(self) -> date:
+        return self.now.astimezone(self.tzinfo).date()
+
+
+@dataclass(frozen=True)
+class SystemClock:
+    tzinfo: tzinfo
+
+    @property
+    def now(self) -> datetime:
+        return datetime.now(self.tzinfo)
+
+    @property
+    def today(self) -> date:
+        return self.now.date()
+
+
+__all__ = ["Clock", "FixedClock", "SystemClock"]
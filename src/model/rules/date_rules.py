@@ -1,23 +1,42 @@
 # pylint: disable=missing-module-docstring
 # pylint: disable=missing-class-docstring
 # pylint: disable=missing-function-docstring
-from datetime import date, datetime, timedelta
-from typing import Dict, Optional
+from datetime import date, datetime, timedelta, tzinfo
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
 from zoneinfo import ZoneInfo
 
 from src.common.data.parameters import ParameterLoader
 from src.common.datetime.period import Period
 from src.model.core.enums import ItemGroup, ItemType
+from src.model.rules.clock import Clock, FixedClock
+
+ANCHOR_CACHE_SIZE = 4
 
 
 class DateRules:
     _params = ParameterLoader()
     _tzinfo: ZoneInfo = _params.get("TZINFO")
-    _today: datetime.date = _params.get("TODAY")
+    _clock: Clock = FixedClock(tzinfo=_tzinfo, now=_params.get("NOW"))
+
+    @staticmethod
+    def use_clock(clock: Clock) -> None:
+        DateRules._clock = clock
+        DateRules._tzinfo = clock.tzinfo
+        DateRules._anchors.cache_clear()
+
+    @staticmethod
+    def now() -> datetime:
+        return DateRules._clock.now
+
+    @staticmethod
+    def today() -> date:
+        return DateRules._clock.today
 
     @staticmethod
-    def _first_day(year: int, month: int) -> datetime.date:
-        return datetime(year, month, 1, tzinfo=DateRules._tzinfo).date()
+    def _first_day(year: int, month: int, tz: Optional[tzinfo] = None) -> datetime.date:
+        return datetime(year, month, 1, tzinfo=tz or DateRules._tzinfo).date()
 
     @staticmethod
     def _next_month(d: datetime.date) -> tuple[int, int]:
@@ -43,13 +62,14 @@ class DateRules:
     ) -> tuple[datetime.date, datetime.date]:
         if item_type == ItemType.TASK:
             ref = start_at or end_at
-            d = DateRules.local_date(ref) or DateRules._today
+            d = DateRules.local_date(ref) or DateRules.today()
             return d, d
         if item_type == ItemType.EVENT:
             s = DateRules.local_date(start_at)
             e = DateRules.local_date(end_at)
             if s is None and e is None:
-                return DateRules._today, DateRules._today
+                today = DateRules.today()
+                return today, today
             if s is None:
                 return e, e
             if e is None:
@@ -63,31 +83,22 @@ class DateRules:
 
     @staticmethod
     def in_rest_of_this_week(d: datetime.date) -> bool:
-        start = max(DateRules._today + timedelta(days=2), DateRules._today)
+        today = DateRules.today()
+        start = max(today + timedelta(days=2), today)
         end = DateRules.calculate_dates()["this_week_fri"]
         return start <= d <= end
 
     @staticmethod
     def in_this_weekend(d: datetime.date) -> bool:
-        return (
-            DateRules.calculate_dates()["this_week_sat"]
-            <= d
-            <= DateRules.calculate_dates()["this_week_sun"]
-        )
+        cd = DateRules.calculate_dates()
+        return cd["this_week_sat"] <= d <= cd["this_week_sun"]
 
     @staticmethod
     def in_next_week_range(d: datetime.date) -> bool:
-        if DateRules.calculate_dates()["wd"] == 6:
-            return (
-                DateRules.calculate_dates()["next_week_tue"]
-                <= d
-                <= DateRules.calculate_dates()["next_week_sun"]
-            )
-        return (
-            DateRules.calculate_dates()["next_week_mon"]
-            <= d
-            <= DateRules.calculate_dates()["next_week_sun"]
-        )
+        cd = DateRules.calculate_dates()
+        if cd["wd"] == 6:
+            return cd["next_week_tue"] <= d <= cd["next_week_sun"]
+        return cd["next_week_mon"] <= d <= cd["next_week_sun"]
 
     @staticmethod
     def is_exactly_on(
@@ -102,22 +113,24 @@ class DateRules:
     @staticmethod
     def fixed_period_for(group: ItemGroup) -> Optional[Period]:
         result: Optional[Period] = None
+        today = DateRules.today()
+        cd = DateRules.calculate_dates()
         if group == ItemGroup.TODAY:
             result = Period(
-                start=DateRules._today,
-                end=DateRules._today,
+                start=today,
+                end=today,
                 inclusive=True,
                 duration=1,
             )
         elif group == ItemGroup.TOMORROW:
-            d = DateRules._today + timedelta(days=1)
+            d = today + timedelta(days=1)
             result = Period(start=d, end=d, inclusive=True, duration=1)
         elif group == ItemGroup.REST_OF_THIS_WEEK:
             w_start = max(
-                DateRules._today + timedelta(days=2),
-                DateRules._today,
+                today + timedelta(days=2),
+                today,
             )
-            w_end = DateRules.calculate_dates()["this_week_fri"]
+            w_end = cd["this_week_fri"]
             w_start = min(w_start, w_end)
             result = Period(
                 start=w_start,
@@ -126,26 +139,26 @@ class DateRules:
                 duration=(w_end - w_start).days + 1,
             )
         elif group == ItemGroup.THIS_FRIDAY:
-            d = DateRules.calculate_dates()["this_week_fri"]
+            d = cd["this_week_fri"]
             result = Period(start=d, end=d, inclusive=True, duration=1)
         elif group == ItemGroup.THIS_WEEKEND:
             ws, we = (
-                DateRules.calculate_dates()["this_week_sat"],
-                DateRules.calculate_dates()["this_week_sun"],
+                cd["this_week_sat"],
+                cd["this_week_sun"],
             )
             result = Period(
                 start=ws, end=we, inclusive=True, duration=(we - ws).days + 1
             )
         elif group == ItemGroup.THIS_SUNDAY:
-            d = DateRules.calculate_dates()["this_week_sun"]
+            d = cd["this_week_sun"]
             result = Period(start=d, end=d, inclusive=True, duration=1)
         elif group == ItemGroup.NEXT_WEEK:
             start = (
-                DateRules.calculate_dates()["next_week_tue"]
-                if DateRules.calculate_dates()["wd"] == 6
-                else DateRules.calculate_dates()["next_week_mon"]
+                cd["next_week_tue"]
+                if cd["wd"] == 6
+                else cd["next_week_mon"]
             )
-            end = DateRules.calculate_dates()["next_week_sun"]
+            end = cd["next_week_sun"]
             start = min(start, end)
             result = Period(
                 start=start,
@@ -155,10 +168,10 @@ class DateRules:
             )
         elif group == ItemGroup.REST_OF_THIS_MONTH:
             m_start = max(
-                DateRules.calculate_dates()["next_week_sun"] + timedelta(days=1),
-                DateRules.calculate_dates()["first_this_month"],
+                cd["next_week_sun"] + timedelta(days=1),
+                cd["first_this_month"],
             )
-            m_end = DateRules.calculate_dates()["last_this_month"]
+            m_end = cd["last_this_month"]
             m_start = min(m_start, m_end)
             result = Period(
                 start=m_start,
@@ -168,42 +181,47 @@ class DateRules:
             )
         elif group == ItemGroup.NEXT_MONTH:
             result = Period(
-                start=DateRules.calculate_dates()["first_next_month"],
-                end=DateRules.calculate_dates()["last_next_month"],
+                start=cd["first_next_month"],
+                end=cd["last_next_month"],
                 inclusive=True,
                 duration=(
-                    DateRules.calculate_dates()["last_next_month"]
-                    - DateRules.calculate_dates()["first_next_month"]
+                    cd["last_next_month"]
+                    - cd["first_next_month"]
                 ).days
                 + 1,
             )
         return result
 
     @staticmethod
-    def calculate_dates() -> Dict[str, date]:
-        wd = DateRules._today.weekday()
-        y_man, m_man = DateRules._month_after_next(DateRules._today)
-        y_next, m_next = DateRules._next_month(DateRules._today)
-        this_week_sun = DateRules._today + timedelta(days=6 - wd)
+    def calculate_dates() -> Mapping[str, date]:
+        return DateRules._anchors(DateRules.today(), DateRules._tzinfo)
+
+    @staticmethod
+    @lru_cache(maxsize=ANCHOR_CACHE_SIZE)
+    def _anchors(today: date, tz: tzinfo) -> Mapping[str, date]:
+        wd = today.weekday()
+        y_man, m_man = DateRules._month_after_next(today)
+        y_next, m_next = DateRules._next_month(today)
+        this_week_sun = today + timedelta(days=6 - wd)
         next_week_mon = this_week_sun + timedelta(days=1)
-        first_next_month = DateRules._first_day(y_next, m_next)
-        first_month_after_next = DateRules._first_day(y_man, m_man)
-        return {
-            "wd": wd,
-            "this_week_fri": DateRules._today + timedelta(days=4 - wd),
-            "this_week_sat": DateRules._today + timedelta(days=5 - wd),
-            "this_week_sun": this_week_sun,
-            "next_week_mon": next_week_mon,
-            "next_week_tue": next_week_mon + timedelta(days=1),
-            "next_week_sun": next_week_mon + timedelta(days=6),
-            "first_this_month": DateRules._first_day(
-                DateRules._today.year, DateRules._today.month
-            ),
-            "first_next_month": first_next_month,
-            "last_this_month": first_next_month - timedelta(days=1),
-            "first_month_after_next": first_month_after_next,
-            "last_next_month": first_month_after_next - timedelta(days=1),
-        }
+        first_next_month = DateRules._first_day(y_next, m_next, tz)
+        first_month_after_next = DateRules._first_day(y_man, m_man, tz)
+        return MappingProxyType(
+            {
+                "wd": wd,
+                "this_week_fri": today + timedelta(days=4 - wd),
+                "this_week_sat": today + timedelta(days=5 - wd),
+                "this_week_sun": this_week_sun,
+                "next_week_mon": next_week_mon,
+                "next_week_tue": next_week_mon + timedelta(days=1),
+                "next_week_sun": next_week_mon + timedelta(days=6),
+                "first_this_month": DateRules._first_day(today.year, today.month, tz),
+                "first_next_month": first_next_month,
+                "last_this_month": first_next_month - timedelta(days=1),
+                "first_month_after_next": first_month_after_next,
+                "last_next_month": first_month_after_next - timedelta(days=1),
+            }
+        )
 
 
 PlannedItemDateRules = DateRules
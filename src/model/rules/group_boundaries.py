@@ -0,0 +1,51 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Callable, Mapping, Optional, Tuple
+
+from src.model.core.enums import ItemGroup
+
+DayClassifier = Callable[[date], Optional[ItemGroup]]
+
+
+@dataclass(frozen=True)
+class GroupBoundaries:
+    starts: Tuple[date, ...]
+    groups: Tuple[Optional[ItemGroup], ...]
+
+    def classify(self, d: date) -> Optional[ItemGroup]:
+        return self.groups[max(bisect_right(self.starts, d) - 1, 0)]
+
+    @staticmethod
+    def build(classify_day: DayClassifier, first: date, last: date) -> GroupBoundaries:
+        starts = [first]
+        groups = [classify_day(first)]
+        d = first + timedelta(days=1)
+        while d <= last:
+            group = classify_day(d)
+            if group != groups[-1]:
+                starts.append(d)
+                groups.append(group)
+            d += timedelta(days=1)
+        return GroupBoundaries(starts=tuple(starts), groups=tuple(groups))
+
+    @staticmethod
+    def spanning(
+        classify_day: DayClassifier,
+        anchors: Mapping[str, date | int],
+        today: date,
+    ) -> GroupBoundaries:
+        days = [today, *(v for v in anchors.values() if isinstance(v, date))]
+        return GroupBoundaries.build(
+            classify_day,
+            min(days) - timedelta(days=1),
+            max(days) + timedelta(days=1),
+        )
+
+
+__all__ = ["DayClassifier", "GroupBoundaries"]
@@ -4,7 +4,8 @@ from .display import (ItemLike, ItemLineFormatter, ItemRenderer,
                       TextItemLineFormatter, TextTreeRenderer, TreeRenderer,
                       human_end, human_start)
 from .display.date_formatting import DateConverter, EndContext, StartContext
-from .orchestration import DataFetcher, ListManager, is_valid_group
+from .orchestration import (DataFetcher, ListManager, SourceFanOut,
+                            SourceResults, is_valid_group)
 from .presenters import ConsolePresenter
 
 __all__ = [
@@ -18,6 +19,8 @@ __all__ = [
     "human_end",
     "DataFetcher",
     "ListManager",
+    "SourceFanOut",
+    "SourceResults",
     "is_valid_group",
     "ConsolePresenter",
     "DateConverter",
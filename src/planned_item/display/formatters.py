@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Optional
 from zoneinfo import ZoneInfo
 
@@ -29,45 +29,28 @@ class TextItemLineFormatter:
     bullet: str = "-"
 
     @staticmethod
-    def _parse_rfc3339(dt_str: Optional[str]) -> Optional[datetime]:
-        if not dt_str:
-            return None
-        try:
-            normalized = dt_str.replace("Z", "+00:00")
-            dt = datetime.fromisoformat(normalized)
-        except ValueError:
-            return None
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo)
-        return dt
+    def _local_date(dt: Optional[datetime]) -> Optional[date]:
+        return None if dt is None else dt.astimezone(tzinfo).date()
 
     @staticmethod
-    def _is_before_today(dt_str: Optional[str]) -> bool:
-        dt = TextItemLineFormatter._parse_rfc3339(dt_str)
-        return bool(dt and dt.astimezone(tzinfo).date() < today)
+    def _is_before_today(dt: Optional[datetime]) -> bool:
+        d = TextItemLineFormatter._local_date(dt)
+        return bool(d and d < today)
 
     @staticmethod
-    def _is_today(dt_str: Optional[str]) -> bool:
-        dt = TextItemLineFormatter._parse_rfc3339(dt_str)
-        return bool(dt and dt.astimezone(tzinfo).date() == today)
+    def _is_today(dt: Optional[datetime]) -> bool:
+        return TextItemLineFormatter._local_date(dt) == today
 
     @staticmethod
-    def _is_tomorrow(dt_str: Optional[str]) -> bool:
-        dt = TextItemLineFormatter._parse_rfc3339(dt_str)
-        return bool(dt and dt.astimezone(tzinfo).date() == today + timedelta(days=1))
+    def _is_tomorrow(dt: Optional[datetime]) -> bool:
+        return TextItemLineFormatter._local_date(dt) == today + timedelta(days=1)
 
     @staticmethod
-    def _is_today_or_tomorrow(dt_str: Optional[str]) -> bool:
-        dt = TextItemLineFormatter._parse_rfc3339(dt_str)
-        if not dt:
-            return False
-        d = dt.astimezone(tzinfo).date()
-        return d in (today, today + timedelta(days=1))
+    def _is_today_or_tomorrow(dt: Optional[datetime]) -> bool:
+        return TextItemLineFormatter._local_date(dt) in (today, today + timedelta(days=1))
 
     @staticmethod
-    def _is_on_going(start_str: Optional[str], end_str: Optional[str]) -> bool:
-        start = TextItemLineFormatter._parse_rfc3339(start_str)
-        end = TextItemLineFormatter._parse_rfc3339(end_str)
+    def _is_on_going(start: Optional[datetime], end: Optional[datetime]) -> bool:
         return bool(start and end and start <= now <= end)
 
     @staticmethod
@@ -81,19 +64,19 @@ class TextItemLineFormatter:
         self,
         item: ItemLike,
         item_type: Optional[ItemType],
-        start_raw: Optional[str],
-        end_raw: Optional[str],
+        start_at: Optional[datetime],
+        end_at: Optional[datetime],
     ) -> FormattingFlags:
-        if not start_raw:
+        if not start_at:
             return FormattingFlags(DateFlags(), StateFlags(), TimeHints())
         date_flags = DateFlags(
-            is_today_or_tomorrow=self._is_today_or_tomorrow(start_raw),
-            is_before_today=self._is_before_today(start_raw),
-            is_today=self._is_today(start_raw),
-            is_tomorrow=self._is_tomorrow(start_raw),
+            is_today_or_tomorrow=self._is_today_or_tomorrow(start_at),
+            is_before_today=self._is_before_today(start_at),
+            is_today=self._is_today(start_at),
+            is_tomorrow=self._is_tomorrow(start_at),
         )
         state_flags = StateFlags(
-            is_on_going=self._is_on_going(start_raw, end_raw) if end_raw else False,
+            is_on_going=self._is_on_going(start_at, end_at),
             is_ongoing=(item_type == ItemType.EVENT and item.is_ongoing()),
         )
         time_hints = TimeHints(
@@ -132,7 +115,7 @@ class TextItemLineFormatter:
     @staticmethod
     def _human_times(ctx: HumanizeContext) -> tuple[Optional[str], Optional[str]]:
         start = human_start(
-            start_rfc3339=ctx.start_raw,
+            start_rfc3339=ctx.start_at,
             is_all_day=ctx.is_all_day,
             calendar_days=ctx.calendar_days,
             is_today_or_tomorrow=ctx.is_today_or_tomorrow,
@@ -140,7 +123,7 @@ class TextItemLineFormatter:
             item_type=ctx.item_type,
         )
         end = human_end(
-            end_rfc3339=ctx.end_raw,
+            end_rfc3339=ctx.end_at,
             is_all_day=ctx.is_all_day,
             calendar_days=ctx.calendar_days,
         )
@@ -185,7 +168,8 @@ class TextItemLineFormatter:
             details.append("source: " + ctx.data_source.value)
         return details
 
-    def format_line(self, item: ItemLike, level: int, indent_size: int) -> str:
+    @staticmethod
+    def _validated_title(item: ItemLike) -> str:
         title = getattr(item, "title", None)
         if title is not None and not isinstance(title, str):
             raise ValueError("Item title must be a string.")
@@ -193,45 +177,46 @@ class TextItemLineFormatter:
             raise ValueError("Item title is missing.")
         if len(title.strip()) == 0:
             raise ValueError("Item title must not be empty or whitespace.")
-        title = title.strip()
-        start_raw = self._clean_str(getattr(item, "start_raw", None))
-        end_raw = self._clean_str(getattr(item, "end_raw", None))
-        meta = {
-            "item_type": getattr(item, "type", None),
-            "location": self._clean_str(getattr(item, "location", None)),
-            "is_all_day": item.is_all_day(),
-            "calendar_days": item.calendar_days(),
-            "planned_item_list": getattr(item, "planned_item_list", None),
-        }
-        flags = self._build_flags(item, meta["item_type"], start_raw, end_raw)
+        return title.strip()
+
+    def _status_and_details(self, item: ItemLike) -> tuple[str, list[str]]:
+        start_at = getattr(item, "start_at", None)
+        end_at = getattr(item, "end_at", None)
+        meta = ItemMeta(
+            item_type=getattr(item, "type", None),
+            is_all_day=item.is_all_day(),
+            calendar_days=item.calendar_days(),
+        )
+        flags = self._build_flags(item, meta.item_type, start_at, end_at)
         status = self._maybe_hide_status(
-            self._status_str(getattr(item, "status", None)), meta["item_type"], flags
+            self._status_str(getattr(item, "status", None)), meta.item_type, flags
         )
         times = self._human_times(
             HumanizeContext(
-                item_type=meta["item_type"],
-                is_all_day=meta["is_all_day"],
-                calendar_days=meta["calendar_days"],
+                item_type=meta.item_type,
+                is_all_day=meta.is_all_day,
+                calendar_days=meta.calendar_days,
                 is_today_or_tomorrow=flags.date.is_today_or_tomorrow,
                 is_on_going=flags.state.is_on_going,
-                start_raw=start_raw,
-                end_raw=end_raw,
+                start_at=start_at,
+                end_at=end_at,
             )
         )
-        details_items = self._details_list(
+        details = self._details_list(
             DetailsContext(
-                meta=ItemMeta(
-                    item_type=meta["item_type"],
-                    is_all_day=meta["is_all_day"],
-                    calendar_days=meta["calendar_days"],
-                ),
+                meta=meta,
                 timing=Timing(start=times[0], end=times[1]),
-                location=meta["location"],
+                location=self._clean_str(getattr(item, "location", None)),
                 flags=flags,
-                planned_item_list=meta["planned_item_list"],
+                planned_item_list=getattr(item, "planned_item_list", None),
                 data_source=getattr(item, "data_source", None),
             )
         )
+        return status, details
+
+    def format_line(self, item: ItemLike, level: int, indent_size: int) -> str:
+        title = self._validated_title(item)
+        status, details_items = self._status_and_details(item)
         details_str = f"({', '.join(details_items)})" if details_items else ""
         parts = [(" " * (indent_size * level)) + self.bullet]
         parts.append(title)
@@ -8,23 +8,16 @@ import sys
 from typing import List
 
 from src.model import PlannedItem
-from src.planned_item.orchestration.data_fetcher import DataFetcher
-from src.planned_item.orchestration.list_manager import ListManager
+from src.planned_item.orchestration.source_fan_out import SourceFanOut
 from src.planned_item.presenters.console_presenter import ConsolePresenter
 
 
 def main_google_only() -> None:
     print("🔍 Getting data from Google Tasks and Google Calendar...")
     
-    list_manager = ListManager()
-    task_lists = list_manager.get_task_lists()
-    calendars_list = list_manager.get_calendars_list()
-    data_fetcher = DataFetcher()
-    
-    tasks: List[PlannedItem] = data_fetcher.get_pending_tasks_with_auto_complete(
-        task_lists
-    )
-    events: List[PlannedItem] = data_fetcher.get_upcoming_events(calendars_list)
+    results = SourceFanOut().fetch(include_google_tasks=True, include_events=True)
+    tasks: List[PlannedItem] = results.tasks
+    events: List[PlannedItem] = results.events
     all_items: List[PlannedItem] = PlannedItem.sort(tasks + events)
     
     print(f"📊 Google Tasks: {len(tasks)} tasks, Google Calendar: {len(events)} events")
@@ -37,15 +30,11 @@ def main_google_only() -> None:
 def main_todoist_only() -> None:
     print("🔍 Getting data from Todoist...")
     
-    list_manager = ListManager()
-    todoist_projects = list_manager.get_todoist_projects()
-    calendars_list = list_manager.get_calendars_list()
-    data_fetcher = DataFetcher()
-    
-    tasks: List[PlannedItem] = data_fetcher.get_todoist_pending_tasks_with_auto_complete(
-        todoist_projects
+    results = SourceFanOut().fetch(
+        include_google_tasks=False, include_events=True, include_todoist=True
     )
-    events: List[PlannedItem] = data_fetcher.get_upcoming_events(calendars_list)
+    tasks: List[PlannedItem] = results.tasks
+    events: List[PlannedItem] = results.events
     all_items: List[PlannedItem] = PlannedItem.sort(tasks + events)
     
     print(f"📊 Todoist: {len(tasks)} tasks, Google Calendar: {len(events)} events")
@@ -58,18 +47,14 @@ def main_todoist_only() -> None:
 def main_all_sources() -> None:
     print("🔍 Getting data from all sources...")
     
-    list_manager = ListManager()
-    calendars_list = list_manager.get_calendars_list()
-    data_fetcher = DataFetcher()
-    
-    tasks: List[PlannedItem] = data_fetcher.get_all_pending_tasks_with_auto_complete()
-    events: List[PlannedItem] = data_fetcher.get_upcoming_events(calendars_list)
-    all_items: List[PlannedItem] = PlannedItem.sort(tasks + events)
-    
-    google_tasks = [t for t in tasks if t.data_source and "google" in t.data_source.value]
-    todoist_tasks = [t for t in tasks if t.data_source and "todoist" in t.data_source.value]
+    results = SourceFanOut().fetch(
+        include_google_tasks=True, include_events=True, include_todoist=True
+    )
+    events: List[PlannedItem] = results.events
+    all_items: List[PlannedItem] = PlannedItem.sort(results.all_items())
     
-    print(f"📊 Google Tasks: {len(google_tasks)}, Todoist: {len(todoist_tasks)}, "
+    print(f"📊 Google Tasks: {len(results.google_tasks)}, "
+          f"Todoist: {len(results.todoist_tasks)}, "
           f"Google Calendar: {len(events)} events")
     
     grouped_items = PlannedItem.time_grouper(all_items)
@@ -2,10 +2,13 @@
 # pylint: disable=duplicate-code
 from .data_fetcher import DataFetcher
 from .list_manager import ListManager
+from .source_fan_out import SourceFanOut, SourceResults
 from .validation import is_valid_group
 
 __all__ = [
     "DataFetcher",
     "ListManager",
+    "SourceFanOut",
+    "SourceResults",
     "is_valid_group",
 ]
@@ -3,10 +3,12 @@
 # pylint: disable=missing-function-docstring
 from __future__ import annotations
 
-from typing import List
+from functools import partial
+from typing import List, Optional
 
 from src.common.data.data_operations import (_apply_auto_complete_to_tasks,
                                              _fetch_from_lists,
+                                             _fetch_todoist_tasks,
                                              get_all_pending_tasks,
                                              get_all_pending_tasks_with_auto_complete,
                                              get_todoist_pending_tasks,
@@ -35,36 +37,44 @@ class DataFetcher:
             fetch_func=gcp.get_pending_tasks,
         )
 
-        return _apply_auto_complete_to_tasks(tasks, task_lists, gcp.get_pending_tasks, gcp.auto_complete_parent_tasks)
+        return _apply_auto_complete_to_tasks(tasks, task_lists, gcp.auto_complete_parent_tasks)
 
     @staticmethod
-    def get_upcoming_events(calendars_list: List[PlannedItemList]) -> List[PlannedItem]:
+    def get_upcoming_events(
+        calendars_list: List[PlannedItemList],
+        batched: bool = False,
+        incremental: bool = False,
+        window_days: Optional[int] = None,
+    ) -> List[PlannedItem]:
+        if incremental:
+            return _fetch_from_lists(
+                lists=calendars_list,
+                list_type_name="calendars",
+                fetch_func=partial(gcp.get_upcoming_events, incremental=True),
+            )
+        if batched:
+            if not calendars_list:
+                print("No calendars found.")
+                return []
+            return gcp.get_upcoming_events_batched(calendars_list)
         return _fetch_from_lists(
             lists=calendars_list,
             list_type_name="calendars",
-            fetch_func=gcp.get_upcoming_events,
+            fetch_func=partial(gcp.get_upcoming_events, window_days=window_days),
         )
 
     @staticmethod
     def get_todoist_pending_tasks(project_lists: List[PlannedItemList]) -> List[PlannedItem]:
-        return _fetch_from_lists(
-            lists=project_lists,
-            list_type_name="Todoist projects",
-            fetch_func=todoist.get_pending_tasks,
-        )
+        return _fetch_todoist_tasks(project_lists)
 
     @staticmethod
     def get_todoist_pending_tasks_with_auto_complete(
         project_lists: List[PlannedItemList],
     ) -> List[PlannedItem]:
-        tasks = _fetch_from_lists(
-            lists=project_lists,
-            list_type_name="Todoist projects",
-            fetch_func=todoist.get_pending_tasks,
-        )
+        tasks = _fetch_todoist_tasks(project_lists)
 
         return _apply_auto_complete_to_tasks(
-            tasks, project_lists, todoist.get_pending_tasks, todoist.auto_complete_parent_tasks
+            tasks, project_lists, todoist.auto_complete_parent_tasks
         )
 
     @staticmethod
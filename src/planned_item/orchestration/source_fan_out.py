@@ -0,0 +1,75 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from src.common.data.concurrency import run_in_parallel
+from src.model import PlannedItem
+from src.planned_item.orchestration.data_fetcher import DataFetcher
+from src.planned_item.orchestration.list_manager import ListManager
+
+
+@dataclass
+class SourceResults:
+    google_tasks: List[PlannedItem] = field(default_factory=list)
+    events: List[PlannedItem] = field(default_factory=list)
+    todoist_tasks: List[PlannedItem] = field(default_factory=list)
+
+    @property
+    def tasks(self) -> List[PlannedItem]:
+        return self.google_tasks + self.todoist_tasks
+
+    def all_items(self) -> List[PlannedItem]:
+        return self.tasks + self.events
+
+
+class SourceFanOut:
+    def __init__(
+        self,
+        list_manager: Optional[ListManager] = None,
+        data_fetcher: Optional[DataFetcher] = None,
+        auto_complete: bool = True,
+    ) -> None:
+        self._list_manager = list_manager or ListManager()
+        self._data_fetcher = data_fetcher or DataFetcher()
+        self._auto_complete = auto_complete
+
+    def _fetch_google_tasks(self) -> List[PlannedItem]:
+        task_lists = self._list_manager.get_task_lists()
+        if self._auto_complete:
+            return self._data_fetcher.get_pending_tasks_with_auto_complete(task_lists)
+        return self._data_fetcher.get_pending_tasks(task_lists)
+
+    def _fetch_events(self) -> List[PlannedItem]:
+        calendars_list = self._list_manager.get_calendars_list()
+        return self._data_fetcher.get_upcoming_events(calendars_list)
+
+    def _fetch_todoist_tasks(self) -> List[PlannedItem]:
+        projects = self._list_manager.get_todoist_projects()
+        if self._auto_complete:
+            return self._data_fetcher.get_todoist_pending_tasks_with_auto_complete(
+                projects
+            )
+        return self._data_fetcher.get_todoist_pending_tasks(projects)
+
+    def fetch(
+        self,
+        include_google_tasks: bool = True,
+        include_events: bool = True,
+        include_todoist: bool = False,
+    ) -> SourceResults:
+        jobs: List[tuple[str, Callable[[], List[PlannedItem]]]] = []
+        if include_google_tasks:
+            jobs.append(("google_tasks", self._fetch_google_tasks))
+        if include_events:
+            jobs.append(("events", self._fetch_events))
+        if include_todoist:
+            jobs.append(("todoist_tasks", self._fetch_todoist_tasks))
+        outcomes = run_in_parallel([job for _, job in jobs])
+        results = SourceResults()
+        for (name, _), items in zip(jobs, outcomes):
+            setattr(results, name, items)
+        return results
@@ -0,0 +1,205 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+import asyncio
+from typing import (AsyncIterator, Awaitable, Callable, Dict, Iterable, List,
+                    Optional)
+
+from googleapiclient.discovery import Resource
+from googleapiclient.http import HttpRequest
+
+from src.common.datetime.period import Period
+from src.common.sync.sync_state_store import SyncStateStore
+from src.model import PlannedItem, PlannedItemList
+from src.sources.gcp.auth.settings import AuthSettings
+from src.sources.gcp.data.config import TaskQueryConfig
+from src.sources.gcp.env_clock import EnvClock
+from src.sources.gcp.google_planned_source import (CALENDAR_LIST_PAGE_CAP,
+                                                   DEFAULT_CALENDAR_ID,
+                                                   DEFAULT_TODAY,
+                                                   EVENTS_PAGE_CAP,
+                                                   TASKS_PAGE_CAP,
+                                                   GooglePlannedSource,
+                                                   calendar_list_request,
+                                                   events_request,
+                                                   events_window,
+                                                   scoped_settings,
+                                                   tasklists_request)
+from src.sources.gcp.services.default_factory import \
+    DefaultGoogleServiceFactory
+from src.sources.gcp.services.factory import GoogleServiceFactory
+
+_DEFAULT_FACTORY: GoogleServiceFactory = DefaultGoogleServiceFactory()
+
+
+async def _execute(request: HttpRequest) -> Dict:
+    return await asyncio.to_thread(request.execute)
+
+
+async def apaginate(
+    fetch_page: Callable[[Optional[str], int], Awaitable[Dict]],
+    max_items: int,
+    page_size_cap: int,
+) -> AsyncIterator[Dict]:
+    results_count = 0
+    page_token: Optional[str] = None
+    while True:
+        remaining = max(1, max_items - results_count)
+        resp = await fetch_page(page_token, min(page_size_cap, remaining))
+        items = resp.get("items", []) or []
+        for it in items:
+            yield it
+            results_count += 1
+            if results_count >= max_items:
+                return
+        page_token = resp.get("nextPageToken")
+        if not page_token:
+            return
+
+
+class AsyncGooglePlannedSource:
+    # The fetch plan lives in GooglePlannedSource; its methods run on worker
+    # threads here, and only the iter_* streams paginate natively.
+    def __init__(
+        self,
+        service_factory: GoogleServiceFactory = _DEFAULT_FACTORY,
+        auth_settings: Optional[AuthSettings] = None,
+        clock: EnvClock = EnvClock(),
+        sync_store: Optional[SyncStateStore] = None,
+    ) -> None:
+        self._factory = service_factory
+        self._auth_settings = auth_settings
+        self._source = GooglePlannedSource(
+            service_factory=service_factory,
+            auth_settings=auth_settings,
+            clock=clock,
+            sync_store=sync_store,
+        )
+
+    async def _get_service(
+        self,
+        api_name: str,
+        api_version: str,
+        scopes: Optional[Iterable[str]] = None,
+    ) -> Resource:
+        eff_settings = scoped_settings(self._auth_settings, scopes)
+        return await asyncio.to_thread(
+            self._factory.build, api_name, api_version, settings=eff_settings
+        )
+
+    async def get_pending_tasks(
+        self,
+        planned_list: Optional[PlannedItemList] = None,
+        period: Period = Period(duration=120),
+        config: Optional[TaskQueryConfig] = None,
+    ) -> List[PlannedItem]:
+        return await asyncio.to_thread(
+            self._source.get_pending_tasks, planned_list, period, config
+        )
+
+    async def iter_tasks_lists(self, max_items: int = 200) -> AsyncIterator[Dict]:
+        service = await self._get_service(api_name="tasks", api_version="v1")
+
+        async def _fetch(page_token: Optional[str], max_results: int) -> Dict:
+            return await _execute(tasklists_request(service, page_token, max_results))
+
+        async for it in apaginate(
+            _fetch, max_items=max_items, page_size_cap=TASKS_PAGE_CAP
+        ):
+            yield it
+
+    async def get_tasks_lists(
+        self,
+        max_items: int = 200,
+    ) -> List[Dict[str, Optional[str]]]:
+        return await asyncio.to_thread(self._source.get_tasks_lists, max_items)
+
+    async def iter_upcoming_events(
+        self,
+        planned_list: Optional[PlannedItemList] = None,
+        period: Period = Period(start=DEFAULT_TODAY, duration=60),
+        max_items: int = 200,
+    ) -> AsyncIterator[Dict]:
+        planned_list = planned_list or PlannedItemList(
+            kind="calendar", id=DEFAULT_CALENDAR_ID
+        )
+        service_calendar = await self._get_service(
+            api_name="calendar", api_version="v3"
+        )
+        time_min, time_max = events_window(period)
+
+        async def _fetch(page_token: Optional[str], max_results: int) -> Dict:
+            return await _execute(
+                events_request(
+                    service_calendar,
+                    planned_list,
+                    time_min,
+                    time_max,
+                    page_token,
+                    max_results,
+                )
+            )
+
+        async for item in apaginate(
+            _fetch, max_items=max_items, page_size_cap=EVENTS_PAGE_CAP
+        ):
+            item["plannedItemList"] = planned_list
+            yield item
+
+    async def get_upcoming_events(
+        self,
+        planned_list: Optional[PlannedItemList] = None,
+        period: Period = Period(start=DEFAULT_TODAY, duration=60),
+        max_items: int = 200,
+        incremental: bool = False,
+        window_days: Optional[int] = None,
+    ) -> List[PlannedItem]:
+        return await asyncio.to_thread(
+            self._source.get_upcoming_events,
+            planned_list,
+            period,
+            max_items,
+            incremental,
+            window_days,
+        )
+
+    async def iter_calendars_list(
+        self,
+        max_items: int = 500,
+        min_access_role: str = "reader",
+        show_hidden: bool = True,
+    ) -> AsyncIterator[Dict]:
+        service = await self._get_service(api_name="calendar", api_version="v3")
+
+        async def _fetch(page_token: Optional[str], max_results: int) -> Dict:
+            return await _execute(
+                calendar_list_request(
+                    service, page_token, max_results, min_access_role, show_hidden
+                )
+            )
+
+        async for it in apaginate(
+            _fetch, max_items=max_items, page_size_cap=CALENDAR_LIST_PAGE_CAP
+        ):
+            yield it
+
+    async def get_calendars_list(
+        self,
+        max_items: int = 500,
+        min_access_role: str = "reader",
+        show_hidden: bool = True,
+    ) -> List[Dict[str, Optional[str]]]:
+        return await asyncio.to_thread(
+            self._source.get_calendars_list, max_items, min_access_role, show_hidden
+        )
+
+    async def auto_complete_parent_tasks(
+        self,
+        tasks: List[PlannedItem],
+        planned_list: Optional[PlannedItemList] = None,
+    ) -> int:
+        return await asyncio.to_thread(
+            self._source.auto_complete_parent_tasks, tasks, planned_list
+        )
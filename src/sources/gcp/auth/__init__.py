@@ -1,5 +1,6 @@
 # pylint: disable=missing-module-docstring
 # pylint: disable=duplicate-code
+from .caching_credentials_provider import CachingCredentialsProvider
 from .credentials_provider import CredentialsProvider
 from .default_credentials_provider import DefaultCredentialsProvider
 from .exceptions import AuthConfigError
@@ -9,6 +10,7 @@ from .token_storage import TokenStorage
 
 __all__ = [
     "AuthSettings",
+    "CachingCredentialsProvider",
     "CredentialsProvider",
     "DefaultCredentialsProvider",
     "TokenStorage",
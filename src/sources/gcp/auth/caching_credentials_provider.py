@@ -0,0 +1,53 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+import threading
+from typing import Dict, Hashable, Optional, Tuple
+
+from google.auth.exceptions import GoogleAuthError
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+
+from .credentials_provider import CredentialsProvider
+from .default_credentials_provider import DefaultCredentialsProvider
+from .file_token_storage import FileTokenStorage
+from .settings import AuthSettings
+from .token_storage import TokenStorage
+
+_CredentialsKey = Tuple[Hashable, ...]
+
+
+class CachingCredentialsProvider:
+    def __init__(self, inner: Optional[CredentialsProvider] = None) -> None:
+        self._inner = inner or DefaultCredentialsProvider()
+        self._cache: Dict[_CredentialsKey, Credentials] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(settings: AuthSettings, storage: Optional[TokenStorage]) -> _CredentialsKey:
+        return (str(settings.token_path), tuple(settings.scopes), id(storage))
+
+    def get(
+        self, settings: AuthSettings, storage: Optional[TokenStorage]
+    ) -> Credentials:
+        key = self._key(settings, storage)
+        with self._lock:
+            creds = self._cache.get(key)
+            if creds and creds.valid:
+                return creds
+            if creds and creds.expired and creds.refresh_token:
+                try:
+                    creds.refresh(Request())
+                    (storage or FileTokenStorage(settings.token_path)).write(creds)
+                    return creds
+                except GoogleAuthError as exc:
+                    print(f"Token refresh failed: {exc}")
+            creds = self._inner.get(settings=settings, storage=storage)
+            self._cache[key] = creds
+            return creds
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
@@ -1,15 +1,25 @@
 # pylint: disable=missing-module-docstring
 # pylint: disable=duplicate-code
 from .auto_completer import TaskAutoCompleter
-from .config import TaskQueryConfig
+from .batch import BatchOutcome, execute_batched
+from .config import TaskFetchStrategy, TaskQueryConfig
 from .enricher import TaskEnricher
+from .event_sync import CalendarEventSync
 from .fetcher import TaskFetcher
+from .listing_sizes import ListingSizes
+from .task_sync import TaskListSync
 from .updater import TaskUpdater
 
 __all__ = [
+    "BatchOutcome",
+    "CalendarEventSync",
+    "ListingSizes",
     "TaskAutoCompleter",
     "TaskFetcher",
     "TaskEnricher",
+    "TaskFetchStrategy",
+    "TaskListSync",
     "TaskQueryConfig",
     "TaskUpdater",
+    "execute_batched",
 ]
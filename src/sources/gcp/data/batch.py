@@ -0,0 +1,55 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Final, Hashable, Mapping, Optional, TypeVar
+
+from google.auth.exceptions import GoogleAuthError
+from googleapiclient.discovery import Resource
+from googleapiclient.errors import Error as GoogleApiClientError
+from googleapiclient.http import HttpRequest
+from httplib2 import HttpLib2Error
+
+BATCH_MAX_REQUESTS: Final[int] = 50
+K = TypeVar("K", bound=Hashable)
+_BATCH_ERRORS = (GoogleApiClientError, GoogleAuthError, HttpLib2Error, OSError)
+
+
+@dataclass(frozen=True)
+class BatchOutcome:
+    response: Optional[Dict] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def execute_batched(
+    service: Resource,
+    requests: Mapping[K, HttpRequest],
+    batch_size: int = BATCH_MAX_REQUESTS,
+) -> Dict[K, BatchOutcome]:
+    batch_size = max(1, batch_size)
+    keys = list(requests)
+    outcomes: Dict[K, BatchOutcome] = {}
+
+    def _callback(request_id: str, response: Optional[Dict], exception: Optional[Exception]):
+        outcomes[keys[int(request_id)]] = BatchOutcome(response=response, error=exception)
+
+    for start in range(0, len(keys), batch_size):
+        chunk = range(start, min(start + batch_size, len(keys)))
+        batch = service.new_batch_http_request(callback=_callback)
+        for index in chunk:
+            batch.add(requests[keys[index]], request_id=str(index))
+        try:
+            batch.execute()
+        except _BATCH_ERRORS as exc:
+            for index in chunk:
+                outcomes.setdefault(keys[index], BatchOutcome(error=exc))
+    return outcomes
+
+
+__all__ = ["BATCH_MAX_REQUESTS", "BatchOutcome", "execute_batched"]
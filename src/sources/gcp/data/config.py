@@ -5,12 +5,23 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
+from enum import Enum
 from typing import Optional
 
 
+class TaskFetchStrategy(str, Enum):
+    AUTO = "auto"
+    SINGLE_PASS = "single_pass"
+    TWO_QUERY = "two_query"
+
+
 @dataclass
 class TaskQueryConfig:
     max_items: int = 200
     include_undated: bool = True
     show_tz_shadow: bool = False
     filter_local_date: Optional[date] = None
+    incremental: bool = False
+    fetch_strategy: TaskFetchStrategy = TaskFetchStrategy.TWO_QUERY
+    streaming: bool = False
+    window_days: Optional[int] = None
@@ -31,23 +31,23 @@ class TaskEnricher:
     def enrich_items(self, items: List[dict]) -> List[dict]:
         enriched = []
         for item in items:
-            due_utc = self._parse_due_utc(item.get("due"))
-            if not due_utc:
-                if self.config.filter_local_date is None:
-                    enriched.append(item)
-                continue
-            local_date = due_utc.astimezone(self.tzinfo).date()
-            if (
-                self.config.filter_local_date is not None
-                and local_date != self.config.filter_local_date
-            ):
-                continue
-            enriched.append(item)
-            if self.config.show_tz_shadow and local_date != due_utc.date():
-                shadow = self._create_timezone_shadow(item, local_date)
-                enriched.append(shadow)
+            enriched += self.enrich_item(item)
         return enriched
 
+    def enrich_item(self, item: dict) -> List[dict]:
+        due_utc = self._parse_due_utc(item.get("due"))
+        if not due_utc:
+            return [item] if self.config.filter_local_date is None else []
+        local_date = due_utc.astimezone(self.tzinfo).date()
+        if (
+            self.config.filter_local_date is not None
+            and local_date != self.config.filter_local_date
+        ):
+            return []
+        if self.config.show_tz_shadow and local_date != due_utc.date():
+            return [item, self._create_timezone_shadow(item, local_date)]
+        return [item]
+
     def _create_timezone_shadow(self, item: dict, local_date: date) -> dict:
         local_midnight = datetime.combine(local_date, time.min, tzinfo=self.tzinfo)
         shadow = dict(item)
@@ -0,0 +1,149 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta, timezone
+from typing import Dict, Final, List, Optional
+
+from googleapiclient.discovery import Resource
+from googleapiclient.errors import HttpError
+
+from src.common.sync.sync_state import SyncState
+from src.common.sync.sync_state_store import SyncStateStore
+from src.model.list import PlannedItemList
+from src.sources.gcp.mappers.base import list_projection
+from src.sources.gcp.mappers.calendar_events import GoogleCalendarEventsMapper
+
+SYNC_PAGE_CAP: Final[int] = 250
+EVENTS_SYNC_FIELDS: Final[str] = list_projection(
+    GoogleCalendarEventsMapper().remote_fields(), "nextSyncToken"
+)
+HTTP_GONE: Final[int] = 410
+SYNC_HORIZON: Final[timedelta] = timedelta(days=365)
+
+
+def _parse_event_time(value: Optional[Dict]) -> Optional[datetime]:
+    if not value:
+        return None
+    if value.get("dateTime"):
+        parsed = datetime.fromisoformat(value["dateTime"])
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    if value.get("date"):
+        return datetime.combine(
+            datetime.fromisoformat(value["date"]).date(), time.min, tzinfo=timezone.utc
+        )
+    return None
+
+
+def _in_window(event: Dict, window_start: datetime, window_end: datetime) -> bool:
+    start = _parse_event_time(event.get("start"))
+    end = _parse_event_time(event.get("end")) or start
+    if start is None or end is None:
+        return False
+    return start <= window_end and end >= window_start
+
+
+def _horizon_scope(window_start: datetime, window_end: datetime) -> str:
+    horizon_end = (window_end + SYNC_HORIZON).astimezone(timezone.utc)
+    return f"{window_start.isoformat()}/{horizon_end.strftime('%Y-%m-%dT%H:%M:%SZ')}"
+
+
+def _covers(scope: Optional[str], window_start: datetime, window_end: datetime) -> bool:
+    if not scope or "/" not in scope:
+        return False
+    try:
+        horizon_start, horizon_end = (
+            datetime.fromisoformat(value) for value in scope.split("/", 1)
+        )
+    except ValueError:
+        return False
+    return horizon_start <= window_start and window_end <= horizon_end
+
+
+class CalendarEventSync:
+    def __init__(self, service: Resource, store: SyncStateStore):
+        self.service = service
+        self.store = store
+
+    @staticmethod
+    def state_key(planned_list: PlannedItemList) -> str:
+        return f"gcp/calendar/{planned_list.id}"
+
+    def sync(
+        self, planned_list: PlannedItemList, time_min: str, time_max: str
+    ) -> List[Dict]:
+        key = self.state_key(planned_list)
+        window_start = datetime.fromisoformat(time_min)
+        window_end = datetime.fromisoformat(time_max)
+        state = self.store.read(key)
+        if state is None or not state.token or not _covers(
+            state.scope, window_start, window_end
+        ):
+            state = self._full_sync(planned_list, window_start, window_end)
+        else:
+            try:
+                self._apply_changes(planned_list, state)
+            except HttpError as exc:
+                if exc.resp.status != HTTP_GONE:
+                    raise
+                print(f"Sync token expired for calendar '{planned_list.id}', resyncing")
+                self.store.delete(key)
+                state = self._full_sync(planned_list, window_start, window_end)
+        self.store.write(key, state)
+        return [
+            dict(event)
+            for event in state.items.values()
+            if _in_window(event, window_start, window_end)
+        ]
+
+    def _full_sync(
+        self, planned_list: PlannedItemList, window_start: datetime, window_end: datetime
+    ) -> SyncState:
+        # Sync a horizon wider than the requested window so the stored token keeps
+        # serving later windows; callers only see events filtered by _in_window.
+        scope = _horizon_scope(window_start, window_end)
+        time_min, time_max = scope.split("/", 1)
+        state = SyncState(scope=scope)
+        state.token = self._drain(
+            state,
+            calendarId=planned_list.id,
+            singleEvents=True,
+            timeMin=time_min,
+            timeMax=time_max,
+        )
+        return state
+
+    def _apply_changes(self, planned_list: PlannedItemList, state: SyncState) -> None:
+        state.token = self._drain(
+            state,
+            calendarId=planned_list.id,
+            singleEvents=True,
+            syncToken=state.token,
+        ) or state.token
+
+    def _drain(self, state: SyncState, **query) -> Optional[str]:
+        page_token: Optional[str] = None
+        while True:
+            resp = (
+                self.service.events()
+                .list(
+                    maxResults=SYNC_PAGE_CAP,
+                    pageToken=page_token,
+                    fields=EVENTS_SYNC_FIELDS,
+                    **query,
+                )
+                .execute()
+            )
+            for event in resp.get("items", []) or []:
+                event_id = event.get("id")
+                if not event_id:
+                    continue
+                if event.get("status") == "cancelled":
+                    state.items.pop(event_id, None)
+                else:
+                    state.items[event_id] = event
+            page_token = resp.get("nextPageToken")
+            if not page_token:
+                state.synced_at = datetime.now(timezone.utc).isoformat()
+                return resp.get("nextSyncToken")
@@ -5,19 +5,41 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
-from typing import List
+from typing import Callable, Dict, Final, List, Optional
 
 from googleapiclient.discovery import Resource
+from googleapiclient.http import HttpRequest
 
 from src.model import PlannedItemList
+from src.sources.gcp.mappers.base import list_projection
+from src.sources.gcp.mappers.tasks import GoogleTasksMapper
+
+from .config import TaskFetchStrategy
+from .listing_sizes import ListingSizes
+from .pagination import iter_pages
+
+TASKS_PAGE_CAP: Final[int] = 100
+TASKS_LIST_FIELDS: Final[str] = list_projection(GoogleTasksMapper().remote_fields())
 
 
 class TaskFetcher:
-    def __init__(self, service: Resource, planned_list: PlannedItemList):
+    def __init__(
+        self,
+        service: Resource,
+        planned_list: PlannedItemList,
+        sink: Optional[Callable[[dict], None]] = None,
+        prefetch: bool = False,
+        listing_sizes: Optional[ListingSizes] = None,
+    ):
         self.service = service
         self.planned_list = planned_list
+        self.sink = sink
+        self.prefetch = prefetch
+        self.listing_sizes = listing_sizes or ListingSizes()
         self.all_items: List[dict] = []
+        self.item_count = 0
         self.seen_ids: set = set()
+        self.listed_items: List[dict] = []
 
     @staticmethod
     def _replace_tz_with_z(iso_value: datetime | str) -> str:
@@ -30,59 +52,189 @@ class TaskFetcher:
                 iso_str += ".000"
         return f"{iso_str}Z"
 
-    def _append_items(self, items: List[dict]) -> None:
+    def _append_items(self, items: List[dict], limit: Optional[int] = None) -> None:
         for item in items:
+            if limit is not None and self.item_count >= limit:
+                return
             tid = item.get("id")
             if tid and tid not in self.seen_ids:
                 item["plannedItemList"] = self.planned_list
-                self.all_items.append(item)
+                if self.sink is None:
+                    self.all_items.append(item)
+                else:
+                    self.sink(item)
+                self.item_count += 1
                 self.seen_ids.add(tid)
 
+    def dated_request(
+        self,
+        page_token: Optional[str],
+        max_results: int,
+        start_dt: datetime,
+        end_dt_last: datetime,
+    ) -> HttpRequest:
+        return self.service.tasks().list(
+            tasklist=self.planned_list.id,
+            showCompleted=True,
+            showHidden=True,
+            showDeleted=False,
+            maxResults=max_results,
+            pageToken=page_token,
+            dueMin=TaskFetcher._replace_tz_with_z(start_dt),
+            dueMax=TaskFetcher._replace_tz_with_z(end_dt_last),
+            fields=TASKS_LIST_FIELDS,
+        )
+
+    def undated_request(self, page_token: Optional[str], max_results: int) -> HttpRequest:
+        return self.service.tasks().list(
+            tasklist=self.planned_list.id,
+            showCompleted=True,
+            showHidden=True,
+            showDeleted=False,
+            maxResults=max_results,
+            pageToken=page_token,
+            fields=TASKS_LIST_FIELDS,
+        )
+
+    def remaining(self, max_items: int) -> int:
+        return min(TASKS_PAGE_CAP, max(1, max_items - self.item_count))
+
+    def page_size_after(self, max_items: int) -> Callable[[int], int]:
+        already_loaded = self.item_count
+
+        def _page_size(received: int) -> int:
+            remaining = max_items - already_loaded - received
+            return min(TASKS_PAGE_CAP, remaining) if remaining > 0 else 0
+
+        return _page_size
+
+    @staticmethod
+    def undated_count(resp: Dict) -> int:
+        return sum(1 for t in resp.get("items", []) or [] if "due" not in t)
+
+    def append_dated(self, resp: Dict, limit: Optional[int] = None) -> None:
+        self._append_items(resp.get("items", []), limit)
+
+    def append_undated(self, resp: Dict, limit: Optional[int] = None) -> None:
+        self._append_items([t for t in resp.get("items", []) if "due" not in t], limit)
+
+    def merge_items(self, items: List[dict], limit: Optional[int] = None) -> None:
+        self._append_items(items, limit)
+
+    def load_listed_tasks(
+        self,
+        items: List[Dict],
+        max_items: int,
+        start_dt: datetime,
+        end_dt_last: datetime,
+        include_undated: bool,
+    ) -> None:
+        due_min = TaskFetcher._parse_due(TaskFetcher._replace_tz_with_z(start_dt))
+        due_max = TaskFetcher._parse_due(TaskFetcher._replace_tz_with_z(end_dt_last))
+        dated = [
+            t
+            for t in items
+            if "due" in t and due_min <= TaskFetcher._parse_due(t["due"]) <= due_max
+        ]
+        self._append_items(dated[:max_items])
+        if include_undated and self.item_count < max_items:
+            undated = [t for t in items if "due" not in t]
+            self._append_items(undated[: max_items - self.item_count])
+
+    def resolve_strategy(
+        self, strategy: TaskFetchStrategy, max_items: int, include_undated: bool
+    ) -> TaskFetchStrategy:
+        if strategy != TaskFetchStrategy.AUTO:
+            return strategy
+        if not include_undated:
+            return TaskFetchStrategy.TWO_QUERY
+        observed_size = self.listing_sizes.get(self.planned_list.id)
+        if observed_size is None:
+            return TaskFetchStrategy.SINGLE_PASS
+        observed_pages = -(-observed_size // TASKS_PAGE_CAP)
+        page_budget = max(1, -(-max_items // TASKS_PAGE_CAP))
+        if observed_pages > 2 * page_budget:
+            return TaskFetchStrategy.TWO_QUERY
+        return TaskFetchStrategy.SINGLE_PASS
+
+    def append_listed(self, resp: Dict) -> None:
+        self.listed_items += resp.get("items", []) or []
+
+    def finish_listing(
+        self,
+        max_items: int,
+        start_dt: datetime,
+        end_dt_last: datetime,
+        include_undated: bool,
+    ) -> None:
+        self.listing_sizes.record(self.planned_list.id, len(self.listed_items))
+        listed_items, self.listed_items = self.listed_items, []
+        self.load_listed_tasks(
+            listed_items, max_items, start_dt, end_dt_last, include_undated
+        )
+
+    def fetch_tasks(
+        self,
+        max_items: int,
+        start_dt: datetime,
+        end_dt_last: datetime,
+        include_undated: bool,
+        strategy: TaskFetchStrategy = TaskFetchStrategy.TWO_QUERY,
+    ) -> None:
+        strategy = self.resolve_strategy(strategy, max_items, include_undated)
+        if strategy == TaskFetchStrategy.SINGLE_PASS:
+            self.fetch_single_pass(max_items, start_dt, end_dt_last, include_undated)
+            return
+        self.fetch_dated_tasks(max_items, start_dt, end_dt_last)
+        self.fetch_undated_tasks(max_items, include_undated)
+
+    def fetch_single_pass(
+        self,
+        max_items: int,
+        start_dt: datetime,
+        end_dt_last: datetime,
+        include_undated: bool,
+    ) -> None:
+        for resp in iter_pages(
+            lambda token, size: self.undated_request(token, size).execute(),
+            lambda _: TASKS_PAGE_CAP,
+            self.prefetch,
+        ):
+            self.append_listed(resp)
+        self.finish_listing(max_items, start_dt, end_dt_last, include_undated)
+
+    @staticmethod
+    def _parse_due(raw: str) -> datetime:
+        return datetime.fromisoformat(raw.replace("Z", "+00:00"))
+
     def fetch_dated_tasks(
         self, max_items: int, start_dt: datetime, end_dt_last: datetime
     ) -> None:
-        page_token = None
-        while True:
-            remaining = max(1, max_items - len(self.all_items))
-            resp = (
-                self.service.tasks()
-                .list(
-                    tasklist=self.planned_list.id,
-                    showCompleted=True,
-                    showHidden=True,
-                    showDeleted=False,
-                    maxResults=min(100, remaining),
-                    pageToken=page_token,
-                    dueMin=TaskFetcher._replace_tz_with_z(start_dt),
-                    dueMax=TaskFetcher._replace_tz_with_z(end_dt_last),
-                )
-                .execute()
-            )
-            self._append_items(resp.get("items", []))
-            page_token = resp.get("nextPageToken")
-            if not page_token or len(self.all_items) >= max_items:
+        for resp in iter_pages(
+            lambda token, size: self.dated_request(
+                token, size, start_dt, end_dt_last
+            ).execute(),
+            self.page_size_after(max_items),
+            self.prefetch,
+        ):
+            self.append_dated(resp, max_items)
+            if self.item_count >= max_items:
                 break
 
     def fetch_undated_tasks(self, max_items: int, include_undated: bool) -> None:
-        if not include_undated or len(self.all_items) >= max_items:
+        if not include_undated or self.item_count >= max_items:
             return
-        page_token = None
-        while True:
-            remaining = max(1, max_items - len(self.all_items))
-            resp = (
-                self.service.tasks()
-                .list(
-                    tasklist=self.planned_list.id,
-                    showCompleted=True,
-                    showHidden=True,
-                    showDeleted=False,
-                    maxResults=min(100, remaining),
-                    pageToken=page_token,
-                )
-                .execute()
-            )
-            undated = [t for t in resp.get("items", []) if "due" not in t]
-            self._append_items(undated)
-            page_token = resp.get("nextPageToken")
-            if not page_token or len(self.all_items) >= max_items:
+        listed = 0
+        for resp in iter_pages(
+            lambda token, size: self.undated_request(token, size).execute(),
+            self.page_size_after(max_items),
+            self.prefetch,
+            count=TaskFetcher.undated_count,
+        ):
+            self.append_undated(resp, max_items)
+            listed += len(resp.get("items", []) or [])
+            if not resp.get("nextPageToken"):
+                self.listing_sizes.record(self.planned_list.id, listed)
+                break
+            if self.item_count >= max_items:
                 break
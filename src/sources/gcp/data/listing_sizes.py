@@ -0,0 +1,21 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+import threading
+from typing import Dict, Optional
+
+
+class ListingSizes:
+    def __init__(self) -> None:
+        self._sizes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, list_id: str) -> Optional[int]:
+        with self._lock:
+            return self._sizes.get(list_id)
+
+    def record(self, list_id: str, size: int) -> None:
+        with self._lock:
+            self._sizes[list_id] = size
@@ -0,0 +1,108 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Final, Iterator, Optional
+
+PREFETCH_PAGES_ENV: Final[str] = "GOOGLE_PREFETCH_PAGES"
+
+PageFetch = Callable[[Optional[str], int], Dict]
+PageCount = Callable[[Dict], int]
+
+
+def prefetch_pages_enabled() -> bool:
+    return bool(os.getenv(PREFETCH_PAGES_ENV, "").strip())
+
+
+def _page_items(resp: Dict) -> list:
+    return resp.get("items", []) or []
+
+
+def _page_len(resp: Dict) -> int:
+    return len(_page_items(resp))
+
+
+def _iter_pages_sequential(
+    fetch_page: PageFetch, page_size: Callable[[int], int], count: PageCount
+) -> Iterator[Dict]:
+    received = 0
+    page_token: Optional[str] = None
+    size = page_size(received)
+    while size > 0:
+        resp = fetch_page(page_token, size)
+        received += count(resp)
+        yield resp
+        page_token = resp.get("nextPageToken")
+        if not page_token:
+            return
+        size = page_size(received)
+
+
+def _iter_pages_prefetch(
+    fetch_page: PageFetch, page_size: Callable[[int], int], count: PageCount
+) -> Iterator[Dict]:
+    received = 0
+    size = page_size(received)
+    if size <= 0:
+        return
+    executor = ThreadPoolExecutor(max_workers=1)
+    pending: Optional[Future] = executor.submit(fetch_page, None, size)
+    try:
+        while pending is not None:
+            resp = pending.result()
+            received += count(resp)
+            pending = None
+            page_token = resp.get("nextPageToken")
+            if page_token:
+                size = page_size(received)
+                if size > 0:
+                    pending = executor.submit(fetch_page, page_token, size)
+            yield resp
+    finally:
+        if pending is not None:
+            pending.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_pages(
+    fetch_page: PageFetch,
+    page_size: Callable[[int], int],
+    prefetch: bool = False,
+    count: PageCount = _page_len,
+) -> Iterator[Dict]:
+    if prefetch:
+        return _iter_pages_prefetch(fetch_page, page_size, count)
+    return _iter_pages_sequential(fetch_page, page_size, count)
+
+
+def paginate(
+    fetch_page: PageFetch,
+    max_items: int,
+    page_size_cap: int,
+    prefetch: bool = False,
+) -> Iterator[Dict]:
+    def _page_size(received: int) -> int:
+        if received and received >= max_items:
+            return 0
+        return min(page_size_cap, max(1, max_items - received))
+
+    results_count = 0
+    for resp in iter_pages(fetch_page, _page_size, prefetch):
+        for it in _page_items(resp):
+            yield it
+            results_count += 1
+            if results_count >= max_items:
+                return
+
+
+__all__ = [
+    "PREFETCH_PAGES_ENV",
+    "PageCount",
+    "PageFetch",
+    "iter_pages",
+    "paginate",
+    "prefetch_pages_enabled",
+]
@@ -0,0 +1,70 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Dict, Final, List, Optional
+
+from googleapiclient.discovery import Resource
+
+from src.common.sync.sync_state import SyncState
+from src.common.sync.sync_state_store import SyncStateStore
+from src.model import PlannedItemList
+from src.sources.gcp.data.fetcher import TASKS_LIST_FIELDS
+
+SYNC_PAGE_CAP: Final[int] = 100
+
+
+class TaskListSync:
+    def __init__(self, service: Resource, store: SyncStateStore):
+        self.service = service
+        self.store = store
+
+    @staticmethod
+    def state_key(planned_list: PlannedItemList) -> str:
+        return f"gcp/tasklist/{planned_list.id}"
+
+    def sync(self, planned_list: PlannedItemList) -> List[Dict]:
+        key = self.state_key(planned_list)
+        state = self.store.read(key)
+        started_at = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+        if state is None or not state.synced_at:
+            state = SyncState()
+            self._drain(state, planned_list, updated_min=None)
+        else:
+            self._drain(state, planned_list, updated_min=state.synced_at)
+        state.synced_at = started_at.replace("+00:00", "Z")
+        self.store.write(key, state)
+        return [dict(item) for item in state.items.values()]
+
+    def _drain(
+        self, state: SyncState, planned_list: PlannedItemList, updated_min: Optional[str]
+    ) -> None:
+        page_token: Optional[str] = None
+        while True:
+            resp = (
+                self.service.tasks()
+                .list(
+                    tasklist=planned_list.id,
+                    showCompleted=True,
+                    showHidden=True,
+                    showDeleted=updated_min is not None,
+                    maxResults=SYNC_PAGE_CAP,
+                    pageToken=page_token,
+                    updatedMin=updated_min,
+                    fields=TASKS_LIST_FIELDS,
+                )
+                .execute()
+            )
+            for item in resp.get("items", []) or []:
+                task_id = item.get("id")
+                if not task_id:
+                    continue
+                if item.get("deleted"):
+                    state.items.pop(task_id, None)
+                else:
+                    state.items[task_id] = item
+            page_token = resp.get("nextPageToken")
+            if not page_token:
+                return
@@ -5,12 +5,14 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
 from googleapiclient.discovery import Resource
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
 
 from src.model.list import PlannedItemList
+from src.sources.gcp.data.batch import execute_batched
 
 
 class TaskUpdater:
@@ -18,17 +20,19 @@ class TaskUpdater:
         self.service = service
         self.planned_list = planned_list
 
+    def _completion_request(self, task_id: str) -> HttpRequest:
+        task_update = {
+            "id": task_id,
+            "status": "completed",
+            "completed": datetime.utcnow().isoformat() + "Z",
+        }
+        return self.service.tasks().update(
+            tasklist=self.planned_list.id, task=task_id, body=task_update
+        )
+
     def mark_task_as_completed(self, task_id: str) -> bool:
         try:
-            task_update = {
-                "id": task_id,
-                "status": "completed",
-                "completed": datetime.utcnow().isoformat() + "Z",
-            }
-
-            self.service.tasks().update(
-                tasklist=self.planned_list.id, task=task_id, body=task_update
-            ).execute()
+            self._completion_request(task_id).execute()
 
             print("Task %s marked as completed successfully", task_id)
             return True
@@ -40,6 +44,30 @@ class TaskUpdater:
             print("Unexpected error updating task %s: %s", task_id, exc)
             return False
 
+    def mark_tasks_as_completed(self, task_ids: List[str]) -> Dict[str, bool]:
+        if not task_ids:
+            return {}
+        try:
+            outcomes = execute_batched(
+                self.service,
+                {task_id: self._completion_request(task_id) for task_id in task_ids},
+            )
+        except Exception as exc:
+            print("Unexpected error updating tasks %s: %s", task_ids, exc)
+            return {task_id: False for task_id in task_ids}
+
+        results: Dict[str, bool] = {}
+        for task_id in task_ids:
+            outcome = outcomes.get(task_id)
+            if outcome and outcome.ok:
+                print("Task %s marked as completed successfully", task_id)
+                results[task_id] = True
+            else:
+                error = outcome.error if outcome else "missing batch response"
+                print("Error marking task %s as completed: %s", task_id, error)
+                results[task_id] = False
+        return results
+
     def get_task_details(self, task_id: str) -> Optional[dict]:
         try:
             task = (
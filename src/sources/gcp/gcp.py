@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 from datetime import date
+from functools import lru_cache
 from typing import Dict, Final, List, Optional
 
 from src.common.data.parameters import ParameterLoader
@@ -20,6 +21,7 @@ DEFAULT_TODAY: Final[date] = _PARAMS.get("TODAY")
 _DEFAULT_FACTORY: GoogleServiceFactory = DefaultGoogleServiceFactory()
 
 
+@lru_cache(maxsize=1)
 def _default_source() -> GooglePlannedSource:
     return GooglePlannedSource(service_factory=_DEFAULT_FACTORY, clock=EnvClock())
 
@@ -42,9 +44,25 @@ def get_upcoming_events(
     planned_list: Optional[PlannedItemList] = None,
     period: Period = Period(start=DEFAULT_TODAY, duration=60),
     max_items: int = 200,
+    incremental: bool = False,
+    window_days: Optional[int] = None,
 ) -> List[PlannedItem]:
     return _default_source().get_upcoming_events(
-        planned_list=planned_list, period=period, max_items=max_items
+        planned_list=planned_list,
+        period=period,
+        max_items=max_items,
+        incremental=incremental,
+        window_days=window_days,
+    )
+
+
+def get_upcoming_events_batched(
+    planned_lists: List[PlannedItemList],
+    period: Period = Period(start=DEFAULT_TODAY, duration=60),
+    max_items: int = 200,
+) -> List[PlannedItem]:
+    return _default_source().get_upcoming_events_batched(
+        planned_lists=planned_lists, period=period, max_items=max_items
     )
 
 
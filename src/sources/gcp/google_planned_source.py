@@ -3,26 +3,39 @@
 # pylint: disable=missing-function-docstring
 from __future__ import annotations
 
+import sys
 from dataclasses import replace
 from datetime import date, datetime, time, timedelta
+from functools import partial
 from typing import (Callable, Dict, Final, Iterable, Iterator, List, Optional,
                     Tuple)
 from zoneinfo import ZoneInfo
 
 from googleapiclient.discovery import Resource
+from googleapiclient.http import HttpRequest
 
+from src.common.data.concurrency import run_in_parallel
 from src.common.data.parameters import ParameterLoader
 from src.common.datetime.period import Period
+from src.common.hierarchy.hierarchy_accumulator import HierarchyAccumulator
 from src.common.hierarchy.hierarchy_builder import HierarchyBuilder
 from src.common.hierarchy.parent_policy import ParentPolicy
+from src.common.sync.file_sync_state_store import FileSyncStateStore
+from src.common.sync.sync_state_store import SyncStateStore
 from src.model import ItemStatus, PlannedItem, PlannedItemList
 from src.sources.gcp.auth.settings import AuthSettings
 from src.sources.gcp.data.auto_completer import TaskAutoCompleter
+from src.sources.gcp.data.batch import BatchOutcome, execute_batched
 from src.sources.gcp.data.config import TaskQueryConfig
 from src.sources.gcp.data.enricher import TaskEnricher
+from src.sources.gcp.data.event_sync import CalendarEventSync
 from src.sources.gcp.data.fetcher import TaskFetcher
+from src.sources.gcp.data.listing_sizes import ListingSizes
+from src.sources.gcp.data.pagination import paginate, prefetch_pages_enabled
+from src.sources.gcp.data.task_sync import TaskListSync
 from src.sources.gcp.data.updater import TaskUpdater
 from src.sources.gcp.env_clock import EnvClock
+from src.sources.gcp.mappers.base import list_projection
 from src.sources.gcp.mappers.calendar_events import GoogleCalendarEventsMapper
 from src.sources.gcp.mappers.tasks import GoogleTasksMapper
 from src.sources.gcp.services.default_factory import \
@@ -36,6 +49,22 @@ DEFAULT_TASKLIST_ID: Final[str] = "@default"
 TASKS_PAGE_CAP: Final[int] = 100
 CALENDAR_LIST_PAGE_CAP: Final[int] = 250
 EVENTS_PAGE_CAP: Final[int] = 250
+WINDOW_MAX_WORKERS: Final[int] = 4
+EVENTS_LIST_FIELDS: Final[str] = list_projection(
+    GoogleCalendarEventsMapper().remote_fields()
+)
+TASKLISTS_LIST_FIELDS: Final[str] = list_projection(("id", "title", "updated", "selfLink"))
+CALENDAR_LIST_FIELDS: Final[str] = list_projection(
+    (
+        "id",
+        "summary",
+        "primary",
+        "accessRole",
+        "timeZone",
+        "selected",
+        "backgroundColor",
+    )
+)
 _DEFAULT_FACTORY: GoogleServiceFactory = DefaultGoogleServiceFactory()
 
 
@@ -49,7 +78,7 @@ def _is_past(now: datetime, it: PlannedItem) -> bool:
     return False
 
 
-def _scoped_settings(
+def scoped_settings(
     settings: Optional[AuthSettings],
     scopes: Optional[Iterable[str]],
 ) -> AuthSettings:
@@ -64,25 +93,91 @@ def _local_day_bounds(d: date, tz: ZoneInfo) -> Tuple[datetime, datetime, dateti
     return start, end_inclusive, end_exclusive
 
 
-def _paginate(
-    fetch_page: Callable[[Optional[str], int], Dict],
-    max_items: int,
-    page_size_cap: int,
-) -> Iterator[Dict]:
-    results_count = 0
-    page_token: Optional[str] = None
-    while True:
-        remaining = max(1, max_items - results_count)
-        resp = fetch_page(page_token, min(page_size_cap, remaining))
-        items = resp.get("items", []) or []
-        for it in items:
-            yield it
-            results_count += 1
-            if results_count >= max_items:
+def events_window(period: Period) -> Tuple[str, str]:
+    return (
+        f"{period.start.isoformat()}T00:00:00Z",
+        f"{period.end.isoformat()}T23:59:59Z",
+    )
+
+
+def events_request(
+    service_calendar: Resource,
+    planned_list: PlannedItemList,
+    time_min: str,
+    time_max: str,
+    page_token: Optional[str],
+    max_results: int,
+) -> HttpRequest:
+    return service_calendar.events().list(
+        calendarId=planned_list.id,
+        singleEvents=True,
+        maxResults=max_results,
+        pageToken=page_token,
+        timeMin=time_min,
+        timeMax=time_max,
+        fields=EVENTS_LIST_FIELDS,
+    )
+
+
+def tasklists_request(
+    service: Resource, page_token: Optional[str], max_results: int
+) -> HttpRequest:
+    return service.tasklists().list(
+        maxResults=max_results,
+        pageToken=page_token,
+        fields=TASKLISTS_LIST_FIELDS,
+    )
+
+
+def calendar_list_request(
+    service: Resource,
+    page_token: Optional[str],
+    max_results: int,
+    min_access_role: str,
+    show_hidden: bool,
+) -> HttpRequest:
+    return service.calendarList().list(
+        maxResults=max_results,
+        pageToken=page_token,
+        minAccessRole=min_access_role,
+        showHidden=show_hidden,
+        fields=CALENDAR_LIST_FIELDS,
+    )
+
+
+def _merge_unique(batches: Iterable[List[Dict]], max_items: int) -> Iterator[Dict]:
+    seen_ids: set = set()
+    for batch in batches:
+        for item in batch:
+            item_id = item.get("id")
+            if not item_id or item_id in seen_ids:
+                continue
+            seen_ids.add(item_id)
+            yield item
+            if len(seen_ids) >= max_items:
                 return
-        page_token = resp.get("nextPageToken")
-        if not page_token:
-            return
+
+
+def _enriching_sink(
+    enricher: TaskEnricher, accumulator: HierarchyAccumulator
+) -> Callable[[Dict], None]:
+    def _sink(item: Dict) -> None:
+        for enriched in enricher.enrich_item(item):
+            accumulator.add(enriched)
+
+    return _sink
+
+
+def _build_tasks(
+    fetcher: TaskFetcher,
+    enricher: TaskEnricher,
+    accumulator: HierarchyAccumulator,
+) -> List[PlannedItem]:
+    if fetcher.sink is None:
+        for item in enricher.enrich_items(fetcher.all_items):
+            accumulator.add(item)
+    tasks = accumulator.finish()
+    return [t for t in tasks if t.is_root() and t.status == ItemStatus.NEEDS_ACTION]
 
 
 class GooglePlannedSource:
@@ -91,10 +186,21 @@ class GooglePlannedSource:
         service_factory: GoogleServiceFactory = _DEFAULT_FACTORY,
         auth_settings: Optional[AuthSettings] = None,
         clock: EnvClock = EnvClock(),
+        sync_store: Optional[SyncStateStore] = None,
+        prefetch_pages: Optional[bool] = None,
     ) -> None:
         self._factory = service_factory
         self._auth_settings = auth_settings
         self._clock = clock
+        self._sync_store = sync_store
+        self._listing_sizes = ListingSizes()
+        self._prefetch_pages = prefetch_pages
+
+    @property
+    def _prefetch(self) -> bool:
+        if self._prefetch_pages is None:
+            return prefetch_pages_enabled()
+        return self._prefetch_pages
 
     def _get_service(
         self,
@@ -102,9 +208,14 @@ class GooglePlannedSource:
         api_version: str,
         scopes: Optional[Iterable[str]] = None,
     ) -> Resource:
-        eff_settings = _scoped_settings(self._auth_settings, scopes)
+        eff_settings = scoped_settings(self._auth_settings, scopes)
         return self._factory.build(api_name, api_version, settings=eff_settings)
 
+    def _get_sync_store(self) -> SyncStateStore:
+        if self._sync_store is None:
+            self._sync_store = FileSyncStateStore()
+        return self._sync_store
+
     def get_pending_tasks(
         self,
         planned_list: Optional[PlannedItemList] = None,
@@ -118,14 +229,56 @@ class GooglePlannedSource:
         service = self._get_service(api_name="tasks", api_version="v1")
         start_dt, _, _ = _local_day_bounds(period.start, self._clock.tzinfo)
         _, end_dt_last, _ = _local_day_bounds(period.end, self._clock.tzinfo)
-        fetcher = TaskFetcher(service, planned_list)
-        fetcher.fetch_dated_tasks(config.max_items, start_dt, end_dt_last)
-        fetcher.fetch_undated_tasks(config.max_items, config.include_undated)
         enricher = TaskEnricher(config, planned_list)
-        enriched = enricher.enrich_items(fetcher.all_items)
         builder = HierarchyBuilder(parent_policy=ParentPolicy.LENIENT)
-        tasks = builder.build(enriched, GoogleTasksMapper())
-        return [t for t in tasks if t.is_root() and t.status == ItemStatus.NEEDS_ACTION]
+        accumulator = builder.accumulator(GoogleTasksMapper())
+        sink = _enriching_sink(enricher, accumulator) if config.streaming else None
+        fetcher = TaskFetcher(
+            service,
+            planned_list,
+            sink=sink,
+            prefetch=self._prefetch,
+            listing_sizes=self._listing_sizes,
+        )
+        if config.incremental:
+            task_sync = TaskListSync(service, self._get_sync_store())
+            fetcher.load_listed_tasks(
+                task_sync.sync(planned_list),
+                config.max_items,
+                start_dt,
+                end_dt_last,
+                config.include_undated,
+            )
+        elif config.window_days:
+            batches = run_in_parallel(
+                [
+                    partial(self._fetch_task_window, planned_list, window, config.max_items)
+                    for window in period.split(config.window_days)
+                ],
+                max_workers=WINDOW_MAX_WORKERS,
+            )
+            for batch in batches:
+                fetcher.merge_items(batch, config.max_items)
+            fetcher.fetch_undated_tasks(config.max_items, config.include_undated)
+        else:
+            fetcher.fetch_tasks(
+                config.max_items,
+                start_dt,
+                end_dt_last,
+                config.include_undated,
+                config.fetch_strategy,
+            )
+        return _build_tasks(fetcher, enricher, accumulator)
+
+    def _fetch_task_window(
+        self, planned_list: PlannedItemList, window: Period, max_items: int
+    ) -> List[Dict]:
+        service = self._get_service(api_name="tasks", api_version="v1")
+        start_dt, _, _ = _local_day_bounds(window.start, self._clock.tzinfo)
+        _, end_dt_last, _ = _local_day_bounds(window.end, self._clock.tzinfo)
+        fetcher = TaskFetcher(service, planned_list, prefetch=self._prefetch)
+        fetcher.fetch_dated_tasks(max_items, start_dt, end_dt_last)
+        return fetcher.all_items
 
     def get_tasks_lists(
         self,
@@ -134,14 +287,15 @@ class GooglePlannedSource:
         service = self._get_service(api_name="tasks", api_version="v1")
 
         def _fetch(page_token: Optional[str], max_results: int) -> Dict:
-            return (
-                service.tasklists()
-                .list(maxResults=max_results, pageToken=page_token)
-                .execute()
-            )
+            return tasklists_request(service, page_token, max_results).execute()
 
         results: List[Dict[str, Optional[str]]] = []
-        for it in _paginate(_fetch, max_items=max_items, page_size_cap=TASKS_PAGE_CAP):
+        for it in paginate(
+            _fetch,
+            max_items=max_items,
+            page_size_cap=TASKS_PAGE_CAP,
+            prefetch=self._prefetch,
+        ):
             results.append(
                 {
                     "id": it.get("id", ""),
@@ -157,36 +311,110 @@ class GooglePlannedSource:
         planned_list: Optional[PlannedItemList] = None,
         period: Period = Period(start=DEFAULT_TODAY, duration=60),
         max_items: int = 200,
+        incremental: bool = False,
+        window_days: Optional[int] = None,
     ) -> List[PlannedItem]:
         planned_list = planned_list or PlannedItemList(
             kind="calendar", id=DEFAULT_CALENDAR_ID
         )
+        if incremental:
+            service_calendar = self._get_service(api_name="calendar", api_version="v3")
+            time_min, time_max = events_window(period)
+            event_sync = CalendarEventSync(service_calendar, self._get_sync_store())
+            synced = event_sync.sync(planned_list, time_min, time_max)
+            return self._build_events(synced, planned_list)[:max_items]
+        if window_days:
+            batches = run_in_parallel(
+                [
+                    partial(self._fetch_event_window, planned_list, window, max_items)
+                    for window in period.split(window_days)
+                ],
+                max_workers=WINDOW_MAX_WORKERS,
+            )
+            return self._build_events(_merge_unique(batches, max_items), planned_list)
+        return self._build_events(
+            self._iter_events(planned_list, period, max_items), planned_list
+        )
+
+    def _iter_events(
+        self, planned_list: PlannedItemList, period: Period, max_items: int
+    ) -> Iterator[Dict]:
         service_calendar = self._get_service(api_name="calendar", api_version="v3")
-        time_min = f"{period.start.isoformat()}T00:00:00Z"
-        time_max = f"{period.end.isoformat()}T23:59:59Z"
+        time_min, time_max = events_window(period)
 
         def _fetch(page_token: Optional[str], max_results: int) -> Dict:
-            return (
-                service_calendar.events()
-                .list(
-                    calendarId=planned_list.id,
-                    singleEvents=True,
-                    maxResults=max_results,
-                    pageToken=page_token,
-                    timeMin=time_min,
-                    timeMax=time_max,
+            return events_request(
+                service_calendar, planned_list, time_min, time_max, page_token, max_results
+            ).execute()
+
+        return paginate(
+            _fetch,
+            max_items=max_items,
+            page_size_cap=EVENTS_PAGE_CAP,
+            prefetch=self._prefetch,
+        )
+
+    def _fetch_event_window(
+        self, planned_list: PlannedItemList, window: Period, max_items: int
+    ) -> List[Dict]:
+        return list(self._iter_events(planned_list, window, max_items))
+
+    def get_upcoming_events_batched(
+        self,
+        planned_lists: List[PlannedItemList],
+        period: Period = Period(start=DEFAULT_TODAY, duration=60),
+        max_items: int = 200,
+    ) -> List[PlannedItem]:
+        if not planned_lists:
+            return []
+        service_calendar = self._get_service(api_name="calendar", api_version="v3")
+        time_min, time_max = events_window(period)
+        collected: Dict[int, List[Dict]] = {i: [] for i in range(len(planned_lists))}
+        page_tokens: Dict[int, Optional[str]] = {i: None for i in collected}
+        pending = list(collected)
+        while pending:
+            requests = {
+                i: events_request(
+                    service_calendar,
+                    planned_lists[i],
+                    time_min,
+                    time_max,
+                    page_tokens[i],
+                    min(EVENTS_PAGE_CAP, max(1, max_items - len(collected[i]))),
                 )
-                .execute()
-            )
+                for i in pending
+            }
+            outcomes = execute_batched(service_calendar, requests)
+            next_pending: List[int] = []
+            for i in pending:
+                outcome = outcomes.get(i) or BatchOutcome(
+                    error=RuntimeError("missing batch response")
+                )
+                if not outcome.ok:
+                    name = planned_lists[i].name or planned_lists[i].id
+                    print(f"Error fetching calendar '{name}': {outcome.error}", file=sys.stderr)
+                    del collected[i]
+                    continue
+                items = (outcome.response or {}).get("items", []) or []
+                collected[i] += items[: max_items - len(collected[i])]
+                page_tokens[i] = (outcome.response or {}).get("nextPageToken")
+                if page_tokens[i] and len(collected[i]) < max_items:
+                    next_pending.append(i)
+            pending = next_pending
+        events: List[PlannedItem] = []
+        for i, raw_items in collected.items():
+            events += self._build_events(raw_items, planned_lists[i])
+        return events
 
-        all_items: List[Dict] = []
-        for item in _paginate(
-            _fetch, max_items=max_items, page_size_cap=EVENTS_PAGE_CAP
-        ):
-            item["plannedItemList"] = planned_list
-            all_items.append(item)
+    def _build_events(
+        self, raw_items: Iterable[Dict], planned_list: PlannedItemList
+    ) -> List[PlannedItem]:
         builder = HierarchyBuilder(parent_policy=ParentPolicy.LENIENT)
-        events = builder.build(all_items, GoogleCalendarEventsMapper())
+        accumulator = builder.accumulator(GoogleCalendarEventsMapper())
+        for item in raw_items:
+            item["plannedItemList"] = planned_list
+            accumulator.add(item)
+        events = accumulator.finish()
         now = self._clock.now
         return [it for it in events if not _is_past(now, it)]
 
@@ -199,20 +427,16 @@ class GooglePlannedSource:
         service = self._get_service(api_name="calendar", api_version="v3")
 
         def _fetch(page_token: Optional[str], max_results: int) -> Dict:
-            return (
-                service.calendarList()
-                .list(
-                    maxResults=max_results,
-                    pageToken=page_token,
-                    minAccessRole=min_access_role,
-                    showHidden=show_hidden,
-                )
-                .execute()
-            )
+            return calendar_list_request(
+                service, page_token, max_results, min_access_role, show_hidden
+            ).execute()
 
         results: List[Dict[str, Optional[str]]] = []
-        for it in _paginate(
-            _fetch, max_items=max_items, page_size_cap=CALENDAR_LIST_PAGE_CAP
+        for it in paginate(
+            _fetch,
+            max_items=max_items,
+            page_size_cap=CALENDAR_LIST_PAGE_CAP,
+            prefetch=self._prefetch,
         ):
             results.append(
                 {
@@ -1,7 +1,8 @@
 # pylint: disable=missing-module-docstring
 # pylint: disable=duplicate-code
 from .base import (BaseItemMapper, FieldSpec, GoogleBaseMapper, MappingError,
-                   as_bool, get_value, identity, map_to_planned_item)
+                   as_bool, get_value, identity, list_projection,
+                   map_to_planned_item)
 from .calendar_events import GoogleCalendarEventsMapper
 from .tasks import GoogleTasksMapper
 
@@ -13,6 +14,7 @@ __all__ = [
     "as_bool",
     "get_value",
     "identity",
+    "list_projection",
     "map_to_planned_item",
     "GoogleCalendarEventsMapper",
     "GoogleTasksMapper",
@@ -4,7 +4,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Mapping, Protocol, TypeVar
+from typing import (Any, Callable, Dict, Iterable, Mapping, Protocol, Tuple,
+                    TypeVar)
 
 from src.model import PlannedItem
 
@@ -17,6 +18,7 @@ __all__ = [
     "identity",
     "GoogleBaseMapper",
     "map_to_planned_item",
+    "list_projection",
 ]
 T = TypeVar("T")
 
@@ -34,6 +36,7 @@ class FieldSpec:
     transform: Callable[[Any], Any] = lambda v: v
     default: Any = None
     required: bool = False
+    remote: bool = True
 
 
 def get_value(raw: Mapping[str, Any], path: str) -> Any:
@@ -61,6 +64,12 @@ def identity(v: T) -> T:
     return v
 
 
+def list_projection(item_fields: Iterable[str], *envelope: str) -> str:
+    return ",".join(
+        ("nextPageToken", *envelope, f"items({','.join(item_fields)})")
+    )
+
+
 def map_to_planned_item(
     raw: Mapping[str, Any],
     field_specs: Mapping[str, FieldSpec],
@@ -92,3 +101,10 @@ class GoogleBaseMapper(BaseItemMapper):
 
     def to_entity(self, raw: Mapping[str, Any]) -> PlannedItem:
         return map_to_planned_item(raw, self._field_specs)
+
+    def remote_fields(self) -> Tuple[str, ...]:
+        fields: Dict[str, None] = {}
+        for spec in self._field_specs.values():
+            if spec.remote:
+                fields[spec.source.split(".")[0]] = None
+        return tuple(fields)
@@ -33,36 +33,47 @@ class GoogleCalendarEventsMapper(GoogleBaseMapper):
             "kind": FieldSpec("kind", transform=lambda v: v, default="calendar#event"),
             "id": FieldSpec("id", transform=lambda v: v, required=True),
             "etag": FieldSpec("etag", transform=lambda v: v),
-            "self_link": FieldSpec("selfLink", transform=lambda v: v),
+            "self_link": FieldSpec("selfLink", transform=lambda v: v, remote=False),
             "web_view_link": FieldSpec("htmlLink", transform=lambda v: v),
             "title": FieldSpec(
                 "summary", transform=lambda v: v or UNTITLED, default=UNTITLED
             ),
             "notes": FieldSpec("description", transform=lambda v: v),
             "status": FieldSpec("status", transform=ItemStatus.from_api),
-            "start_raw": FieldSpec("start", transform=_to_iso_start),
-            "end_raw": FieldSpec("end", transform=_to_iso_end),
-            "updated_raw": FieldSpec("updated", transform=lambda v: v),
-            "parent": FieldSpec("parent", transform=lambda v: None, default=None),
-            "position": FieldSpec("position", transform=lambda v: None, default=None),
-            "hidden": FieldSpec("hidden", transform=as_bool, default=False),
+            "start_rfc3339": FieldSpec("start", transform=_to_iso_start),
+            "end_rfc3339": FieldSpec("end", transform=_to_iso_end),
+            "updated_rfc3339": FieldSpec("updated", transform=lambda v: v),
+            "parent": FieldSpec(
+                "parent", transform=lambda v: None, default=None, remote=False
+            ),
+            "position": FieldSpec(
+                "position", transform=lambda v: None, default=None, remote=False
+            ),
+            "hidden": FieldSpec(
+                "hidden", transform=as_bool, default=False, remote=False
+            ),
             "deleted": FieldSpec(
                 "status",
                 transform=lambda v: str(v).lower() == "cancelled",
                 default=False,
             ),
-            "links": FieldSpec("attachments", transform=lambda v: None, default=None),
+            "links": FieldSpec(
+                "attachments", transform=lambda v: None, default=None, remote=False
+            ),
             "assignment_info": FieldSpec(
-                "creator", transform=lambda v: None, default=None
+                "creator", transform=lambda v: None, default=None, remote=False
+            ),
+            "type": FieldSpec(
+                "type", transform=lambda v: ItemType.EVENT, remote=False
             ),
-            "type": FieldSpec("type", transform=lambda v: ItemType.EVENT),
             "planned_item_list": FieldSpec(
-                "plannedItemList", transform=lambda v: None, default=None
+                "plannedItemList", transform=lambda v: None, default=None, remote=False
             ),
             "data_source": FieldSpec(
                 "data_source",
                 transform=lambda v: DataSource.GOOGLE_CALENDAR,
                 default=DataSource.GOOGLE_CALENDAR,
+                remote=False,
             ),
         }
         super().__init__(field_specs)
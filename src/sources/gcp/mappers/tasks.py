@@ -22,23 +22,24 @@ class GoogleTasksMapper(GoogleBaseMapper):
             "title": FieldSpec("title", default=UNTITLED),
             "notes": FieldSpec("notes"),
             "status": FieldSpec("status", transform=ItemStatus.from_api, default=None),
-            "start_raw": FieldSpec("due"),
-            "end_raw": FieldSpec("completed"),
-            "updated_raw": FieldSpec("updated"),
+            "start_rfc3339": FieldSpec("due"),
+            "end_rfc3339": FieldSpec("completed"),
+            "updated_rfc3339": FieldSpec("updated"),
             "parent": FieldSpec("parent"),
             "position": FieldSpec("position"),
             "hidden": FieldSpec("hidden", transform=as_bool, default=False),
             "deleted": FieldSpec("deleted", transform=as_bool, default=False),
             "links": FieldSpec("links", transform=identity, default=None),
             "assignment_info": FieldSpec("assignmentInfo"),
-            "type": FieldSpec("type", transform=lambda v: ItemType.TASK),
+            "type": FieldSpec("type", transform=lambda v: ItemType.TASK, remote=False),
             "planned_item_list": FieldSpec(
-                "plannedItemList", transform=identity, default=None
+                "plannedItemList", transform=identity, default=None, remote=False
             ),
             "data_source": FieldSpec(
                 "data_source",
                 transform=lambda v: DataSource.GOOGLE_TASK,
                 default=DataSource.GOOGLE_TASK,
+                remote=False,
             ),
         }
         super().__init__(field_specs)
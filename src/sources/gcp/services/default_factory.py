@@ -3,24 +3,83 @@
 # pylint: disable=missing-function-docstring
 from __future__ import annotations
 
-from typing import Optional
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
 
-from googleapiclient.discovery import Resource, build
+from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import Resource, build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.http import HttpRequest, build_http
 
+from src.sources.gcp.auth.caching_credentials_provider import \
+    CachingCredentialsProvider
 from src.sources.gcp.auth.credentials_provider import CredentialsProvider
-from src.sources.gcp.auth.default_credentials_provider import \
-    DefaultCredentialsProvider
 from src.sources.gcp.auth.settings import AuthSettings
 from src.sources.gcp.auth.token_storage import TokenStorage
 
+_ResourceKey = Tuple[str, str, Tuple[str, ...], str, int]
+_DISCOVERY_DOCS: Dict[Tuple[str, str], Optional[str]] = {}
+_DISCOVERY_LOCK = threading.Lock()
+_SHARED_CREDENTIALS_PROVIDER = CachingCredentialsProvider()
+
+
+def _discovery_document(api_name: str, api_version: str) -> Optional[str]:
+    key = (api_name, api_version)
+    with _DISCOVERY_LOCK:
+        if key not in _DISCOVERY_DOCS:
+            _DISCOVERY_DOCS[key] = get_static_doc(api_name, api_version)
+        return _DISCOVERY_DOCS[key]
+
+
+class _ThreadLocalAuthorizedHttp:
+    # httplib2.Http is not thread-safe: requests are built on one thread and may
+    # execute on another, so the connection is picked by the executing thread.
+    def __init__(self, credentials: Credentials) -> None:
+        self.credentials = credentials
+        self._local = threading.local()
+
+    def _transport(self) -> AuthorizedHttp:
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = AuthorizedHttp(self.credentials, http=build_http())
+            self._local.http = http
+        return http
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        return self._transport().request(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._transport(), name)
+
+
+def _request_builder_for(http: _ThreadLocalAuthorizedHttp) -> Callable[..., HttpRequest]:
+    def _request_builder(_http: Any, *args: Any, **kwargs: Any) -> HttpRequest:
+        return HttpRequest(http, *args, **kwargs)
+
+    return _request_builder
+
 
 class DefaultGoogleServiceFactory:
     def __init__(
         self, credentials_provider: Optional[CredentialsProvider] = None
     ) -> None:
         self._credentials_provider = (
-            credentials_provider or DefaultCredentialsProvider()
+            credentials_provider or _SHARED_CREDENTIALS_PROVIDER
         )
+        # Built Resources are shared across threads; each thread keeps one transport
+        # per credentials object and reuses it across requests.
+        self._resources: Dict[_ResourceKey, Tuple[Credentials, Resource]] = {}
+        self._transports: Dict[int, _ThreadLocalAuthorizedHttp] = {}
+        self._lock = threading.Lock()
+
+    def _transport_for(self, creds: Credentials) -> _ThreadLocalAuthorizedHttp:
+        with self._lock:
+            transport = self._transports.get(id(creds))
+            if transport is None or transport.credentials is not creds:
+                transport = _ThreadLocalAuthorizedHttp(creds)
+                self._transports[id(creds)] = transport
+            return transport
 
     def build(
         self,
@@ -30,5 +89,32 @@ class DefaultGoogleServiceFactory:
         storage: Optional[TokenStorage] = None,
     ) -> Resource:
         creds = self._credentials_provider.get(settings=settings, storage=storage)
-        # type: ignore[no-any-return]
-        return build(api_name, api_version, credentials=creds)
+        key = (
+            api_name,
+            api_version,
+            tuple(settings.scopes),
+            str(settings.token_path),
+            id(storage),
+        )
+        with self._lock:
+            cached = self._resources.get(key)
+        if cached and cached[0] is creds:
+            return cached[1]
+        request_builder = _request_builder_for(self._transport_for(creds))
+        document = _discovery_document(api_name, api_version)
+        if document is not None:
+            service = build_from_document(
+                document, credentials=creds, requestBuilder=request_builder
+            )
+        else:
+            # type: ignore[no-any-return]
+            service = build(
+                api_name,
+                api_version,
+                credentials=creds,
+                requestBuilder=request_builder,
+                static_discovery=False,
+            )
+        with self._lock:
+            self._resources[key] = (creds, service)
+        return service
@@ -1,26 +1,35 @@
 # pylint: disable=missing-module-docstring
 # pylint: disable=duplicate-code
+from .async_todoist_planned_source import AsyncTodoistPlannedSource
 from .auth import TodoistAuthSettings
-from .data import TodoistTaskAutoCompleter, TodoistTaskFetcher, TodoistTaskUpdater
+from .data import (TodoistTaskAutoCompleter, TodoistTaskFetcher,
+                   TodoistTaskIndex, TodoistTaskUpdater)
 from .mappers import TodoistTasksMapper
-from .services import TodoistClient
+from .services import (AsyncTodoistClient, TodoistApiClient, TodoistClient,
+                       TodoistSyncClient)
 from .todoist import (auto_complete_parent_tasks, create_task,
                       get_labels_list, get_pending_tasks, get_projects_list,
-                      get_tasks_by_filter)
+                      get_tasks_by_filter, refresh_task_index)
 from .todoist_planned_source import TodoistPlannedSource
 
 __all__ = [
     "TodoistAuthSettings",
     "TodoistClient",
+    "TodoistApiClient",
+    "TodoistSyncClient",
+    "AsyncTodoistClient",
     "TodoistTasksMapper",
     "TodoistTaskFetcher",
     "TodoistTaskUpdater",
     "TodoistTaskAutoCompleter",
+    "TodoistTaskIndex",
     "TodoistPlannedSource",
+    "AsyncTodoistPlannedSource",
     "get_pending_tasks",
     "get_projects_list", 
     "get_labels_list",
     "get_tasks_by_filter",
     "auto_complete_parent_tasks",
     "create_task",
+    "refresh_task_index",
 ]
\ No newline at end of file
@@ -0,0 +1,112 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional
+
+from src.common.hierarchy.hierarchy_builder import HierarchyBuilder
+from src.common.hierarchy.parent_policy import ParentPolicy
+from src.model import ItemStatus, PlannedItem, PlannedItemList
+from src.sources.todoist.auth.settings import TodoistAuthSettings
+from src.sources.todoist.data.auto_completer import TodoistTaskAutoCompleter
+from src.sources.todoist.data.fetcher import TodoistTaskFetcher
+from src.sources.todoist.data.updater import TodoistTaskUpdater
+from src.sources.todoist.mappers.tasks import TodoistTasksMapper
+from src.sources.todoist.services.async_client import AsyncTodoistClient
+from src.sources.todoist.todoist_planned_source import (DEFAULT_PROJECT_ID,
+                                                        _label_to_dict,
+                                                        _project_to_dict)
+
+
+class AsyncTodoistPlannedSource:
+    def __init__(self, auth_settings: Optional[TodoistAuthSettings] = None) -> None:
+        self._auth_settings = auth_settings or TodoistAuthSettings()
+        self._client = AsyncTodoistClient(self._auth_settings)
+
+    async def get_pending_tasks(
+        self,
+        planned_list: Optional[PlannedItemList] = None,
+        max_items: int = 200,
+    ) -> List[PlannedItem]:
+        planned_list = planned_list or PlannedItemList(
+            kind="todoist_project", id=DEFAULT_PROJECT_ID, name="Inbox"
+        )
+
+        fetcher = TodoistTaskFetcher(self._client.sync_client, planned_list)
+        try:
+            tasks = await self._client.get_tasks(project_id=fetcher.project_filter())
+            fetcher.add_pending_tasks(tasks, max_items)
+        except ValueError as e:
+            print(f"Error fetching Todoist tasks: {e}")
+
+        builder = HierarchyBuilder(parent_policy=ParentPolicy.LENIENT)
+        tasks = builder.build(fetcher.all_items, TodoistTasksMapper())
+
+        return [
+            t for t in tasks
+            if t.is_root() and t.status == ItemStatus.NEEDS_ACTION
+        ]
+
+    async def iter_projects(self, max_items: int = 100) -> AsyncIterator[Dict[str, Optional[str]]]:
+        try:
+            projects = await self._client.get_projects()
+        except ValueError as e:
+            print(f"Error fetching Todoist projects: {e}")
+            return
+        for project in projects[:max_items]:
+            yield _project_to_dict(project)
+
+    async def get_projects_list(self, max_items: int = 100) -> List[Dict[str, Optional[str]]]:
+        return [project async for project in self.iter_projects(max_items=max_items)]
+
+    async def iter_labels(self, max_items: int = 100) -> AsyncIterator[Dict[str, Optional[str]]]:
+        try:
+            labels = await self._client.get_labels()
+        except ValueError as e:
+            print(f"Error fetching Todoist labels: {e}")
+            return
+        for label in labels[:max_items]:
+            yield _label_to_dict(label)
+
+    async def get_labels_list(self, max_items: int = 100) -> List[Dict[str, Optional[str]]]:
+        return [label async for label in self.iter_labels(max_items=max_items)]
+
+    async def get_tasks_by_filter(
+        self,
+        filter_query: str,
+        planned_list: Optional[PlannedItemList] = None,
+        max_items: int = 100,
+    ) -> List[PlannedItem]:
+        planned_list = planned_list or PlannedItemList(
+            kind="todoist_filter", id="filter", name=f"Filter: {filter_query}"
+        )
+
+        fetcher = TodoistTaskFetcher(self._client.sync_client, planned_list)
+        try:
+            tasks = await self._client.get_tasks(filter_query=filter_query)
+            fetcher.add_tasks(tasks, max_items)
+        except ValueError as e:
+            print(f"Error fetching Todoist tasks with filter '{filter_query}': {e}")
+
+        builder = HierarchyBuilder(parent_policy=ParentPolicy.LENIENT)
+        tasks = builder.build(fetcher.all_items, TodoistTasksMapper())
+
+        return [t for t in tasks if t.is_root()]
+
+    async def auto_complete_parent_tasks(
+        self,
+        tasks: List[PlannedItem],
+        planned_list: Optional[PlannedItemList] = None,
+    ) -> int:
+        planned_list = planned_list or PlannedItemList(
+            kind="todoist_project", id=DEFAULT_PROJECT_ID, name="Inbox"
+        )
+
+        updater = TodoistTaskUpdater(self._client.sync_client, planned_list)
+        auto_completer = TodoistTaskAutoCompleter(updater)
+
+        return await asyncio.to_thread(
+            auto_completer.process_tasks_for_auto_completion, tasks
+        )
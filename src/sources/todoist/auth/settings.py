@@ -4,7 +4,24 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Final
+
+_DEFAULT_POOL_SIZE: Final[int] = 4
+_DEFAULT_INDEX_TTL: Final[float] = 60.0
+
+
+def _env_pool_size() -> int:
+    raw = os.getenv("TODOIST_POOL_SIZE", "").strip()
+    return max(1, int(raw)) if raw.isdigit() else _DEFAULT_POOL_SIZE
+
+
+def _env_index_ttl() -> float:
+    raw = os.getenv("TODOIST_INDEX_TTL", "").strip()
+    try:
+        return max(0.0, float(raw)) if raw else _DEFAULT_INDEX_TTL
+    except ValueError:
+        return _DEFAULT_INDEX_TTL
 
 
 @dataclass(frozen=True)
@@ -12,6 +29,10 @@ class TodoistAuthSettings:
     api_token: str = os.getenv("TODOIST_API_TOKEN", "")
     base_url: str = "https://api.todoist.com/rest/v2"
     sync_url: str = "https://api.todoist.com/sync/v9"
+    pool_size: int = field(default_factory=_env_pool_size)
+    account_wide: bool = bool(os.getenv("TODOIST_ACCOUNT_WIDE", ""))
+    index_ttl: float = field(default_factory=_env_index_ttl)
+    sync_api: bool = bool(os.getenv("TODOIST_SYNC_API", ""))
     
     def __post_init__(self) -> None:
         if not self.api_token:
@@ -2,10 +2,12 @@
 # pylint: disable=duplicate-code
 from .auto_completer import TodoistTaskAutoCompleter
 from .fetcher import TodoistTaskFetcher
+from .task_index import TodoistTaskIndex
 from .updater import TodoistTaskUpdater
 
 __all__ = [
     "TodoistTaskAutoCompleter",
     "TodoistTaskFetcher", 
+    "TodoistTaskIndex",
     "TodoistTaskUpdater",
 ]
\ No newline at end of file
@@ -6,11 +6,12 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional
 
 from src.model import PlannedItemList
-from src.sources.todoist.services.client import TodoistClient
+from src.sources.todoist.data.task_index import TodoistTaskIndex
+from src.sources.todoist.services.api_client import TodoistApiClient
 
 
 class TodoistTaskFetcher:
-    def __init__(self, client: TodoistClient, planned_list: PlannedItemList):
+    def __init__(self, client: TodoistApiClient, planned_list: PlannedItemList):
         self.client = client
         self.planned_list = planned_list
         self.all_items: List[Dict[str, Any]] = []
@@ -24,35 +25,47 @@ class TodoistTaskFetcher:
                 self.all_items.append(item)
                 self.seen_ids.add(task_id)
 
+    def project_filter(self) -> Optional[str]:
+        if (self.planned_list.id and 
+            self.planned_list.id != "inbox" and 
+            self.planned_list.id.isdigit()):
+            return self.planned_list.id
+        return None
+
+    def add_pending_tasks(self, tasks: List[Dict[str, Any]], max_items: int = 200) -> None:
+        pending_tasks = [task for task in tasks if not task.get("is_completed", False)]
+        
+        if len(pending_tasks) > max_items:
+            pending_tasks = pending_tasks[:max_items]
+        
+        self._append_items(pending_tasks)
+
+    def add_tasks(self, tasks: List[Dict[str, Any]], max_items: int = 100) -> None:
+        if len(tasks) > max_items:
+            tasks = tasks[:max_items]
+        
+        self._append_items(tasks)
+
     def fetch_pending_tasks(self, max_items: int = 200) -> None:
         try:
-            project_id = None
-            if (self.planned_list.id and 
-                self.planned_list.id != "inbox" and 
-                self.planned_list.id.isdigit()):
-                project_id = self.planned_list.id
-            
-            tasks = self.client.get_tasks(project_id=project_id)
-            
-            pending_tasks = [task for task in tasks if not task.get("is_completed", False)]
-            
-            if len(pending_tasks) > max_items:
-                pending_tasks = pending_tasks[:max_items]
-            
-            self._append_items(pending_tasks)
+            tasks = self.client.get_tasks(project_id=self.project_filter())
+            self.add_pending_tasks(tasks, max_items)
             
         except Exception as e:
             print(f"Error fetching Todoist tasks: {e}")
 
+    def fetch_pending_tasks_from_index(
+        self, index: TodoistTaskIndex, max_items: int = 200
+    ) -> None:
+        try:
+            self.add_pending_tasks(index.tasks_for(self.project_filter()), max_items)
+
+        except Exception as e:
+            print(f"Error fetching Todoist tasks: {e}")
+
     def fetch_completed_tasks(self, max_items: int = 50) -> None:
         try:
-            project_id = None
-            if (self.planned_list.id and 
-                self.planned_list.id != "inbox" and 
-                self.planned_list.id.isdigit()):
-                project_id = self.planned_list.id
-            
-            all_tasks = self.client.get_tasks(project_id=project_id)
+            all_tasks = self.client.get_tasks(project_id=self.project_filter())
             completed_tasks = [task for task in all_tasks if task.get("is_completed", False)]
             
             completed_tasks = completed_tasks[:max_items]
@@ -65,11 +78,7 @@ class TodoistTaskFetcher:
     def fetch_tasks_by_filter(self, filter_query: str, max_items: int = 100) -> None:
         try:
             tasks = self.client.get_tasks(filter_query=filter_query)
-            
-            if len(tasks) > max_items:
-                tasks = tasks[:max_items]
-            
-            self._append_items(tasks)
+            self.add_tasks(tasks, max_items)
             
         except Exception as e:
             print(f"Error fetching Todoist tasks with filter '{filter_query}': {e}")
\ No newline at end of file
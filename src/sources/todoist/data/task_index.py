@@ -0,0 +1,55 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Final, List, Optional
+
+from src.sources.todoist.services.api_client import TodoistApiClient
+
+DEFAULT_INDEX_TTL: Final[float] = 60.0
+
+
+class TodoistTaskIndex:
+    def __init__(self, client: TodoistApiClient, ttl_seconds: float = DEFAULT_INDEX_TTL):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self._all_tasks: List[Dict[str, Any]] = []
+        self._by_project: Dict[str, List[Dict[str, Any]]] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < self.ttl_seconds
+        )
+
+    def _load(self) -> None:
+        tasks = self.client.get_tasks()
+        by_project: Dict[str, List[Dict[str, Any]]] = {}
+        for task in tasks:
+            by_project.setdefault(str(task.get("project_id", "")), []).append(task)
+        self._all_tasks = tasks
+        self._by_project = by_project
+        self._loaded_at = time.monotonic()
+
+    def refresh(self) -> None:
+        with self._lock:
+            self._load()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded_at = None
+
+    def tasks_for(self, project_id: Optional[str]) -> List[Dict[str, Any]]:
+        with self._lock:
+            if not self._is_fresh():
+                self._load()
+            if project_id is None:
+                tasks = self._all_tasks
+            else:
+                tasks = self._by_project.get(project_id, [])
+            return [dict(task) for task in tasks]
@@ -4,14 +4,15 @@
 # pylint: disable=broad-except
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from src.model.list import PlannedItemList
-from src.sources.todoist.services.client import TodoistClient
+from src.sources.todoist.services.api_client import TodoistApiClient
+from src.sources.todoist.services.command_batch import close_tasks
 
 
 class TodoistTaskUpdater:
-    def __init__(self, client: TodoistClient, planned_list: PlannedItemList):
+    def __init__(self, client: TodoistApiClient, planned_list: PlannedItemList):
         self.client = client
         self.planned_list = planned_list
 
@@ -26,6 +27,25 @@ class TodoistTaskUpdater:
             print(f"Error marking Todoist task {task_id} as completed: {exc}")
             return False
 
+    def mark_tasks_as_completed(self, task_ids: List[str]) -> Dict[str, bool]:
+        if not task_ids:
+            return {}
+        try:
+            outcomes = close_tasks(self.client, task_ids)
+        except Exception as exc:
+            print(f"Error marking Todoist tasks {task_ids} as completed: {exc}")
+            return {task_id: False for task_id in task_ids}
+
+        results: Dict[str, bool] = {}
+        for task_id in task_ids:
+            outcome = outcomes[task_id]
+            if outcome.ok:
+                print(f"Task {task_id} marked as completed successfully in Todoist")
+            else:
+                print(f"Error marking Todoist task {task_id} as completed: {outcome.error}")
+            results[task_id] = outcome.ok
+        return results
+
     def get_task_details(self, task_id: str) -> Optional[Dict[str, Any]]:
         try:
             tasks = self.client.get_tasks()
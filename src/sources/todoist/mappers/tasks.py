@@ -37,9 +37,9 @@ class TodoistTasksMapper(GoogleBaseMapper):
                 transform=_convert_todoist_status, 
                 default=ItemStatus.NEEDS_ACTION
             ),
-            "start_raw": FieldSpec("due.datetime", default=None),
-            "end_raw": FieldSpec("completed_at", default=None),
-            "updated_raw": FieldSpec("created_at", default=None),
+            "start_rfc3339": FieldSpec("due.datetime", default=None),
+            "end_rfc3339": FieldSpec("completed_at", default=None),
+            "updated_rfc3339": FieldSpec("created_at", default=None),
             "parent": FieldSpec("parent_id", default=None),
             "position": FieldSpec("order", transform=str, default=None),
             "hidden": FieldSpec("hidden", transform=as_bool, default=False),
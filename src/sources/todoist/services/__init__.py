@@ -1,7 +1,25 @@
 # pylint: disable=missing-module-docstring
 # pylint: disable=duplicate-code
+from .api_client import TodoistApiClient
+from .async_client import AsyncTodoistClient
 from .client import TodoistClient
+from .command_batch import (SYNC_COMMANDS_LIMIT, CommandOutcome, close_tasks,
+                            execute_commands)
+from .sync_client import TodoistSyncClient
+from .transport import (HttpResponse, PooledHttpTransport, TransportError,
+                        shared_transport)
 
 __all__ = [
+    "AsyncTodoistClient",
+    "CommandOutcome",
+    "SYNC_COMMANDS_LIMIT",
+    "HttpResponse",
+    "PooledHttpTransport",
+    "TodoistApiClient",
     "TodoistClient",
+    "TodoistSyncClient",
+    "TransportError",
+    "close_tasks",
+    "execute_commands",
+    "shared_transport",
 ]
\ No newline at end of file
@@ -0,0 +1,31 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, Optional, Protocol
+
+
+class TodoistApiClient(Protocol):
+    def get_tasks(
+        self,
+        project_id: Optional[str] = None,
+        section_id: Optional[str] = None,
+        label: Optional[str] = None,
+        filter_query: Optional[str] = None,
+        lang: str = "en",
+    ) -> List[Dict[str, Any]]: ...
+
+    def get_projects(self) -> List[Dict[str, Any]]: ...
+
+    def get_sections(self, project_id: Optional[str] = None) -> List[Dict[str, Any]]: ...
+
+    def get_labels(self) -> List[Dict[str, Any]]: ...
+
+    def post_sync(self, fields: Mapping[str, Any]) -> Dict[str, Any]: ...
+
+    def complete_task(self, task_id: str) -> bool: ...
+
+    def create_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]: ...
+
+    def update_task(self, task_id: str, task_data: Dict[str, Any]) -> Dict[str, Any]: ...
@@ -0,0 +1,59 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from src.sources.todoist.auth.settings import TodoistAuthSettings
+from src.sources.todoist.services.client import TodoistClient
+
+
+class AsyncTodoistClient:
+    def __init__(
+        self,
+        settings: Optional[TodoistAuthSettings] = None,
+        client: Optional[TodoistClient] = None,
+    ) -> None:
+        self._client = client or TodoistClient(settings)
+        self.settings = self._client.settings
+
+    @property
+    def sync_client(self) -> TodoistClient:
+        return self._client
+
+    async def get_tasks(
+        self,
+        project_id: Optional[str] = None,
+        section_id: Optional[str] = None,
+        label: Optional[str] = None,
+        filter_query: Optional[str] = None,
+        lang: str = "en",
+    ) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(
+            self._client.get_tasks,
+            project_id=project_id,
+            section_id=section_id,
+            label=label,
+            filter_query=filter_query,
+            lang=lang,
+        )
+
+    async def get_projects(self) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self._client.get_projects)
+
+    async def get_sections(self, project_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self._client.get_sections, project_id)
+
+    async def get_labels(self) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self._client.get_labels)
+
+    async def complete_task(self, task_id: str) -> bool:
+        return await asyncio.to_thread(self._client.complete_task, task_id)
+
+    async def create_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
+        return await asyncio.to_thread(self._client.create_task, task_data)
+
+    async def update_task(self, task_id: str, task_data: Dict[str, Any]) -> Dict[str, Any]:
+        return await asyncio.to_thread(self._client.update_task, task_id, task_data)
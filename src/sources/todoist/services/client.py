@@ -3,18 +3,24 @@
 # pylint: disable=missing-function-docstring
 from __future__ import annotations
 
+import http.client
 import json
-from typing import Any, Dict, List, Optional
-from urllib.error import HTTPError, URLError
+from typing import Any, Dict, List, Mapping, Optional
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
 
 from src.sources.todoist.auth.settings import TodoistAuthSettings
+from src.sources.todoist.services.transport import (PooledHttpTransport,
+                                                    shared_transport)
 
 
 class TodoistClient:
-    def __init__(self, settings: Optional[TodoistAuthSettings] = None) -> None:
+    def __init__(
+        self,
+        settings: Optional[TodoistAuthSettings] = None,
+        transport: Optional[PooledHttpTransport] = None,
+    ) -> None:
         self.settings = settings or TodoistAuthSettings()
+        self.transport = transport or shared_transport(self.settings.pool_size)
         self.headers = {
             "Authorization": f"Bearer {self.settings.api_token}",
             "Content-Type": "application/json",
@@ -35,25 +41,49 @@ class TodoistClient:
         req_data = json.dumps(data).encode('utf-8') if data else None
         
         try:
-            request = Request(url, data=req_data, headers=self.headers, method=method)
-            
-            with urlopen(request) as response:
-                response_data = response.read().decode('utf-8')
-                return json.loads(response_data) if response_data else {}
-                
-        except HTTPError as e:
-            error_msg = f"HTTP {e.code}: {e.reason}"
-            if hasattr(e, 'read'):
-                error_body = e.read().decode('utf-8')
-                try:
-                    error_data = json.loads(error_body)
-                    error_msg += f" - {error_data}"
-                except json.JSONDecodeError:
-                    error_msg += f" - {error_body}"
-            raise ValueError(f"Todoist API error: {error_msg}") from e
-            
-        except URLError as e:
-            raise ValueError(f"Network error: {e.reason}") from e
+            response = self.transport.request(
+                method, url, body=req_data, headers=self.headers
+            )
+        except (OSError, http.client.HTTPException) as e:
+            raise ValueError(f"Network error: {e}") from e
+
+        response_data = response.body.decode('utf-8')
+        if not response.ok:
+            error_msg = f"HTTP {response.status}: {response.reason}"
+            try:
+                error_data = json.loads(response_data)
+                error_msg += f" - {error_data}"
+            except json.JSONDecodeError:
+                error_msg += f" - {response_data}"
+            raise ValueError(f"Todoist API error: {error_msg}")
+
+        return json.loads(response_data) if response_data else {}
+
+    def post_sync(self, fields: Mapping[str, Any]) -> Dict[str, Any]:
+        body = urlencode(
+            {
+                key: value if isinstance(value, str) else json.dumps(value)
+                for key, value in fields.items()
+            }
+        ).encode("utf-8")
+        headers = {
+            "Authorization": self.headers["Authorization"],
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+        try:
+            response = self.transport.request(
+                "POST", f"{self.settings.sync_url}/sync", body=body, headers=headers
+            )
+        except (OSError, http.client.HTTPException) as e:
+            raise ValueError(f"Network error: {e}") from e
+
+        response_data = response.body.decode("utf-8")
+        if not response.ok:
+            raise ValueError(
+                f"Todoist API error: HTTP {response.status}: {response.reason}"
+                f" - {response_data}"
+            )
+        return json.loads(response_data) if response_data else {}
 
     def get_tasks(
         self, 
@@ -0,0 +1,62 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Final, List, Optional
+
+from src.sources.todoist.services.api_client import TodoistApiClient
+
+SYNC_COMMANDS_LIMIT: Final[int] = 100
+
+
+@dataclass(frozen=True)
+class CommandOutcome:
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _status_to_outcome(status: Any) -> CommandOutcome:
+    if status == "ok":
+        return CommandOutcome()
+    if isinstance(status, dict):
+        return CommandOutcome(error=str(status.get("error") or status))
+    return CommandOutcome(error="missing sync_status entry")
+
+
+def execute_commands(
+    client: TodoistApiClient,
+    commands: List[Dict[str, Any]],
+    batch_size: int = SYNC_COMMANDS_LIMIT,
+) -> Dict[str, CommandOutcome]:
+    batch_size = max(1, min(batch_size, SYNC_COMMANDS_LIMIT))
+    outcomes: Dict[str, CommandOutcome] = {}
+    for start in range(0, len(commands), batch_size):
+        chunk = commands[start : start + batch_size]
+        try:
+            sync_status = client.post_sync({"commands": chunk}).get("sync_status") or {}
+        except ValueError as exc:
+            for command in chunk:
+                outcomes[command["uuid"]] = CommandOutcome(error=str(exc))
+            continue
+        for command in chunk:
+            outcomes[command["uuid"]] = _status_to_outcome(sync_status.get(command["uuid"]))
+    return outcomes
+
+
+def close_tasks(
+    client: TodoistApiClient,
+    task_ids: List[str],
+    batch_size: int = SYNC_COMMANDS_LIMIT,
+) -> Dict[str, CommandOutcome]:
+    commands = {
+        task_id: {"type": "item_close", "uuid": str(uuid.uuid4()), "args": {"id": task_id}}
+        for task_id in task_ids
+    }
+    outcomes = execute_commands(client, list(commands.values()), batch_size)
+    return {task_id: outcomes[command["uuid"]] for task_id, command in commands.items()}
@@ -0,0 +1,217 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Final, List, Mapping, Optional, Tuple
+
+from src.common.sync.file_sync_state_store import FileSyncStateStore
+from src.common.sync.sync_state import SyncState
+from src.common.sync.sync_state_store import SyncStateStore
+from src.sources.todoist.auth.settings import TodoistAuthSettings
+from src.sources.todoist.services.client import TodoistClient
+
+RESOURCE_TYPES: Final[Tuple[str, ...]] = ("items", "projects", "sections", "labels")
+DEFAULT_SYNC_TTL: Final[float] = 30.0
+_FULL_SYNC_TOKEN: Final[str] = "*"
+
+
+def _item_to_task(item: Dict[str, Any]) -> Dict[str, Any]:
+    task_id = str(item.get("id", ""))
+    return {
+        "id": task_id,
+        "content": item.get("content", ""),
+        "description": item.get("description", ""),
+        "project_id": item.get("project_id"),
+        "section_id": item.get("section_id"),
+        "parent_id": item.get("parent_id"),
+        "order": item.get("child_order"),
+        "priority": item.get("priority", 1),
+        "due": item.get("due"),
+        "duration": item.get("duration"),
+        "labels": item.get("labels", []),
+        "is_completed": bool(item.get("checked", False)),
+        "created_at": item.get("added_at"),
+        "creator_id": item.get("user_id"),
+        "assignee_id": item.get("responsible_uid"),
+        "assigner_id": item.get("assigned_by_uid"),
+        "url": f"https://todoist.com/showTask?id={task_id}",
+    }
+
+
+def _project_to_rest(project: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": str(project.get("id", "")),
+        "name": project.get("name", ""),
+        "color": project.get("color"),
+        "parent_id": project.get("parent_id"),
+        "order": project.get("child_order"),
+        "is_shared": project.get("shared", False),
+        "is_favorite": project.get("is_favorite", False),
+        "is_inbox_project": project.get("inbox_project", False),
+        "view_style": project.get("view_style", "list"),
+    }
+
+
+def _section_to_rest(section: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": str(section.get("id", "")),
+        "project_id": section.get("project_id"),
+        "order": section.get("section_order"),
+        "name": section.get("name", ""),
+    }
+
+
+def _label_to_rest(label: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": str(label.get("id", "")),
+        "name": label.get("name", ""),
+        "color": label.get("color"),
+        "order": label.get("item_order"),
+        "is_favorite": label.get("is_favorite", False),
+    }
+
+
+class TodoistSyncClient:
+    def __init__(
+        self,
+        settings: Optional[TodoistAuthSettings] = None,
+        store: Optional[SyncStateStore] = None,
+        rest_client: Optional[TodoistClient] = None,
+        sync_ttl: float = DEFAULT_SYNC_TTL,
+    ) -> None:
+        self._rest = rest_client or TodoistClient(settings)
+        self.settings = self._rest.settings
+        self._store = store or FileSyncStateStore()
+        self._sync_ttl = sync_ttl
+        self._state: Optional[SyncState] = None
+        self._synced_at: Optional[float] = None
+        self._lock = threading.Lock()
+        token_digest = hashlib.sha1(self.settings.api_token.encode("utf-8")).hexdigest()
+        self._state_key = f"todoist/sync/{token_digest[:16]}"
+
+    @property
+    def rest_client(self) -> TodoistClient:
+        return self._rest
+
+    def _post_sync(self, sync_token: str) -> Dict[str, Any]:
+        return self._rest.post_sync(
+            {"sync_token": sync_token, "resource_types": list(RESOURCE_TYPES)}
+        )
+
+    def _load_state(self) -> SyncState:
+        if self._state is None:
+            self._state = self._store.read(self._state_key) or SyncState()
+            for resource in RESOURCE_TYPES:
+                self._state.items.setdefault(resource, {})
+        return self._state
+
+    def _apply(self, state: SyncState, payload: Dict[str, Any]) -> None:
+        if payload.get("full_sync"):
+            for resource in RESOURCE_TYPES:
+                state.items[resource] = {}
+        for resource in RESOURCE_TYPES:
+            replica = state.items[resource]
+            for obj in payload.get(resource, []) or []:
+                obj_id = str(obj.get("id", ""))
+                if not obj_id:
+                    continue
+                if obj.get("is_deleted"):
+                    replica.pop(obj_id, None)
+                else:
+                    replica[obj_id] = obj
+        state.token = payload.get("sync_token") or state.token
+        state.synced_at = datetime.now(timezone.utc).isoformat()
+
+    def sync(self, force: bool = False) -> None:
+        with self._lock:
+            if (
+                not force
+                and self._synced_at is not None
+                and time.monotonic() - self._synced_at < self._sync_ttl
+            ):
+                return
+            state = self._load_state()
+            payload = self._post_sync(state.token or _FULL_SYNC_TOKEN)
+            self._apply(state, payload)
+            self._store.write(self._state_key, state)
+            self._synced_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._synced_at = None
+
+    def _replica(self, resource: str) -> List[Dict[str, Any]]:
+        self.sync()
+        with self._lock:
+            return [dict(obj) for obj in self._load_state().items[resource].values()]
+
+    def get_tasks(
+        self,
+        project_id: Optional[str] = None,
+        section_id: Optional[str] = None,
+        label: Optional[str] = None,
+        filter_query: Optional[str] = None,
+        lang: str = "en",
+    ) -> List[Dict[str, Any]]:
+        if filter_query:
+            return self._rest.get_tasks(
+                project_id=project_id,
+                section_id=section_id,
+                label=label,
+                filter_query=filter_query,
+                lang=lang,
+            )
+        tasks = [
+            _item_to_task(item)
+            for item in sorted(
+                self._replica("items"), key=lambda it: it.get("child_order") or 0
+            )
+            if not item.get("checked") and not item.get("is_deleted")
+        ]
+        if project_id:
+            tasks = [t for t in tasks if str(t.get("project_id")) == str(project_id)]
+        if section_id:
+            tasks = [t for t in tasks if str(t.get("section_id")) == str(section_id)]
+        if label:
+            tasks = [t for t in tasks if label in (t.get("labels") or [])]
+        return tasks
+
+    def get_projects(self) -> List[Dict[str, Any]]:
+        projects = sorted(self._replica("projects"), key=lambda p: p.get("child_order") or 0)
+        return [_project_to_rest(p) for p in projects if not p.get("is_archived")]
+
+    def get_sections(self, project_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        sections = [_section_to_rest(s) for s in self._replica("sections")]
+        if project_id:
+            sections = [s for s in sections if str(s.get("project_id")) == str(project_id)]
+        return sections
+
+    def get_labels(self) -> List[Dict[str, Any]]:
+        return [_label_to_rest(label) for label in self._replica("labels")]
+
+    def post_sync(self, fields: Mapping[str, Any]) -> Dict[str, Any]:
+        result = self._rest.post_sync(fields)
+        if "commands" in fields:
+            self.invalidate()
+        return result
+
+    def complete_task(self, task_id: str) -> bool:
+        completed = self._rest.complete_task(task_id)
+        if completed:
+            self.invalidate()
+        return completed
+
+    def create_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
+        created = self._rest.create_task(task_data)
+        self.invalidate()
+        return created
+
+    def update_task(self, task_id: str, task_data: Dict[str, Any]) -> Dict[str, Any]:
+        updated = self._rest.update_task(task_id, task_data)
+        self.invalidate()
+        return updated
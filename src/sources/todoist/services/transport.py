@@ -0,0 +1,256 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+import base64
+import gzip
+import http.client
+import queue
+import select
+import threading
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Final, Mapping, Optional, Tuple
+from urllib.parse import SplitResult, unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+DEFAULT_POOL_SIZE: Final[int] = 4
+DEFAULT_TIMEOUT: Final[float] = 30.0
+MAX_REDIRECTS: Final[int] = 5
+_REDIRECT_STATUSES: Final[frozenset] = frozenset({301, 302, 303, 307, 308})
+_REDIRECTABLE_METHODS: Final[frozenset] = frozenset({"GET", "HEAD"})
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+_IDEMPOTENT_METHODS: Final[frozenset] = frozenset(
+    {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+)
+
+
+class TransportError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    status: int
+    reason: str
+    body: bytes
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+
+def _inflate(body: bytes) -> bytes:
+    try:
+        return zlib.decompress(body)
+    except zlib.error:
+        return zlib.decompress(body, -zlib.MAX_WBITS)
+
+
+def _decode_body(body: bytes, content_encoding: Optional[str]) -> bytes:
+    encoding = (content_encoding or "").strip().lower()
+    try:
+        if encoding == "gzip":
+            return gzip.decompress(body)
+        if encoding == "deflate":
+            return _inflate(body)
+    except (OSError, EOFError, zlib.error) as exc:
+        raise TransportError(f"Invalid {encoding} response body: {exc}") from exc
+    return body
+
+
+def _redirect_headers(
+    headers: Mapping[str, str], source: str, target: str
+) -> Dict[str, str]:
+    if urlsplit(source).netloc == urlsplit(target).netloc:
+        return dict(headers)
+    return {k: v for k, v in headers.items() if k.lower() != "authorization"}
+
+
+def _proxy_for(scheme: str, host: str) -> Optional[SplitResult]:
+    proxy = getproxies().get(scheme)
+    if not proxy or proxy_bypass(host):
+        return None
+    return urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+
+
+def _proxy_headers(proxy: SplitResult) -> Dict[str, str]:
+    if not proxy.username:
+        return {}
+    credentials = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+    token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+    return {"Proxy-Authorization": f"Basic {token}"}
+
+
+def _is_dropped(conn: http.client.HTTPConnection) -> bool:
+    if conn.sock is None:
+        return False
+    try:
+        readable, _, _ = select.select([conn.sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+def _may_retry(method: str, exc: Exception) -> bool:
+    return method.upper() in _IDEMPOTENT_METHODS or isinstance(
+        exc, http.client.CannotSendRequest
+    )
+
+
+class PooledHttpTransport:
+    def __init__(
+        self, pool_size: int = DEFAULT_POOL_SIZE, timeout: float = DEFAULT_TIMEOUT
+    ) -> None:
+        self._pool_size = max(1, pool_size)
+        self._timeout = timeout
+        self._pools: Dict[Tuple[str, str], queue.LifoQueue] = {}
+        self._lock = threading.Lock()
+
+    def _pool(self, scheme: str, netloc: str) -> queue.LifoQueue:
+        with self._lock:
+            pool = self._pools.get((scheme, netloc))
+            if pool is None:
+                pool = queue.LifoQueue(maxsize=self._pool_size)
+                self._pools[(scheme, netloc)] = pool
+            return pool
+
+    def _connect(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        proxy = _proxy_for(scheme, urlsplit(f"//{netloc}").hostname or netloc)
+        if proxy is None:
+            if scheme == "http":
+                return http.client.HTTPConnection(netloc, timeout=self._timeout)
+            return http.client.HTTPSConnection(netloc, timeout=self._timeout)
+        if scheme == "http":
+            return http.client.HTTPConnection(
+                proxy.hostname, proxy.port, timeout=self._timeout
+            )
+        conn = http.client.HTTPSConnection(
+            proxy.hostname, proxy.port, timeout=self._timeout
+        )
+        conn.set_tunnel(netloc, headers=_proxy_headers(proxy))
+        return conn
+
+    def _acquire(
+        self, scheme: str, netloc: str
+    ) -> Tuple[http.client.HTTPConnection, bool]:
+        pool = self._pool(scheme, netloc)
+        while True:
+            try:
+                conn = pool.get_nowait()
+            except queue.Empty:
+                return self._connect(scheme, netloc), False
+            if not _is_dropped(conn):
+                return conn, True
+            conn.close()
+
+    def _release(
+        self, scheme: str, netloc: str, conn: http.client.HTTPConnection
+    ) -> None:
+        try:
+            self._pool(scheme, netloc).put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> HttpResponse:
+        headers = headers or {}
+        for _ in range(MAX_REDIRECTS + 1):
+            response, location = self._send(method, url, body, headers)
+            if response.status not in _REDIRECT_STATUSES or not location:
+                return response
+            target = urljoin(url, location)
+            if method.upper() not in _REDIRECTABLE_METHODS:
+                raise TransportError(
+                    f"Refusing to follow HTTP {response.status} redirect of {method} "
+                    f"{url} to {target}"
+                )
+            headers = _redirect_headers(headers, url, target)
+            url = target
+        raise TransportError(f"Too many redirects (>{MAX_REDIRECTS}) for {url}")
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Mapping[str, str],
+    ) -> Tuple[HttpResponse, Optional[str]]:
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += f"?{parts.query}"
+        request_headers = {"Accept-Encoding": "gzip, deflate", **headers}
+        proxy = (
+            _proxy_for(parts.scheme, parts.hostname or parts.netloc)
+            if parts.scheme == "http"
+            else None
+        )
+        if proxy is not None:
+            path = url
+            request_headers.update(_proxy_headers(proxy))
+
+        conn, reused = self._acquire(parts.scheme, parts.netloc)
+        while True:
+            try:
+                conn.request(method, path, body=body, headers=request_headers)
+                response = conn.getresponse()
+                data = response.read()
+            except _STALE_CONNECTION_ERRORS as exc:
+                conn.close()
+                if not reused or not _may_retry(method, exc):
+                    raise
+                conn, reused = self._connect(parts.scheme, parts.netloc), False
+                continue
+            except Exception:
+                conn.close()
+                raise
+            break
+
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(parts.scheme, parts.netloc, conn)
+        return (
+            HttpResponse(
+                status=response.status,
+                reason=response.reason,
+                body=_decode_body(data, response.getheader("Content-Encoding")),
+            ),
+            response.getheader("Location"),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            while True:
+                try:
+                    pool.get_nowait().close()
+                except queue.Empty:
+                    break
+
+
+_SHARED_TRANSPORTS: Dict[int, PooledHttpTransport] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_transport(pool_size: int = DEFAULT_POOL_SIZE) -> PooledHttpTransport:
+    with _SHARED_LOCK:
+        transport = _SHARED_TRANSPORTS.get(pool_size)
+        if transport is None:
+            transport = PooledHttpTransport(pool_size=pool_size)
+            _SHARED_TRANSPORTS[pool_size] = transport
+        return transport
@@ -3,6 +3,7 @@
 # pylint: disable=missing-function-docstring
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 from src.model import PlannedItem, PlannedItemList
@@ -12,6 +13,7 @@ from src.sources.todoist.todoist_planned_source import TodoistPlannedSource
 DEFAULT_PROJECT_ID = "inbox"
 
 
+@lru_cache(maxsize=1)
 def _default_source() -> TodoistPlannedSource:
     return TodoistPlannedSource()
 
@@ -25,6 +27,10 @@ def get_pending_tasks(
     )
 
 
+def refresh_task_index() -> None:
+    _default_source().refresh_task_index()
+
+
 def get_projects_list(max_items: int = 100) -> List[Dict[str, Optional[str]]]:
     return _default_source().get_projects_list(max_items=max_items)
 
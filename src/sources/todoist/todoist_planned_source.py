@@ -3,7 +3,7 @@
 # pylint: disable=missing-function-docstring
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from src.common.hierarchy.hierarchy_builder import HierarchyBuilder
 from src.common.hierarchy.parent_policy import ParentPolicy
@@ -11,17 +11,67 @@ from src.model import ItemStatus, PlannedItem, PlannedItemList
 from src.sources.todoist.auth.settings import TodoistAuthSettings
 from src.sources.todoist.data.auto_completer import TodoistTaskAutoCompleter
 from src.sources.todoist.data.fetcher import TodoistTaskFetcher
+from src.sources.todoist.data.task_index import TodoistTaskIndex
 from src.sources.todoist.data.updater import TodoistTaskUpdater
 from src.sources.todoist.mappers.tasks import TodoistTasksMapper
+from src.sources.todoist.services.api_client import TodoistApiClient
 from src.sources.todoist.services.client import TodoistClient
+from src.sources.todoist.services.sync_client import TodoistSyncClient
 
 DEFAULT_PROJECT_ID = "inbox"
 
 
+def _project_to_dict(project: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    return {
+        "id": str(project.get("id", "")),
+        "title": project.get("name", ""),
+        "color": project.get("color"),
+        "is_shared": project.get("is_shared", False),
+        "is_favorite": project.get("is_favorite", False),
+        "is_inbox_project": project.get("is_inbox_project", False),
+        "view_style": project.get("view_style", "list"),
+    }
+
+
+def _label_to_dict(label: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    return {
+        "id": str(label.get("id", "")),
+        "title": label.get("name", ""),
+        "color": label.get("color"),
+        "is_favorite": label.get("is_favorite", False),
+    }
+
+
 class TodoistPlannedSource:
-    def __init__(self, auth_settings: Optional[TodoistAuthSettings] = None) -> None:
+    def __init__(
+        self,
+        auth_settings: Optional[TodoistAuthSettings] = None,
+        account_wide: Optional[bool] = None,
+        index_ttl: Optional[float] = None,
+        client: Optional[TodoistApiClient] = None,
+    ) -> None:
         self._auth_settings = auth_settings or TodoistAuthSettings()
-        self._client = TodoistClient(self._auth_settings)
+        self._client: TodoistApiClient = client or (
+            TodoistSyncClient(self._auth_settings)
+            if self._auth_settings.sync_api
+            else TodoistClient(self._auth_settings)
+        )
+        if account_wide is None:
+            account_wide = self._auth_settings.account_wide
+        if index_ttl is None:
+            index_ttl = self._auth_settings.index_ttl
+        self._task_index = (
+            TodoistTaskIndex(self._client, ttl_seconds=index_ttl) if account_wide else None
+        )
+
+    def refresh_task_index(self) -> None:
+        if self._task_index is None:
+            return
+        try:
+            self._task_index.refresh()
+        except Exception as e:
+            print(f"Error fetching Todoist tasks: {e}")
+            self._task_index.invalidate()
 
     def get_pending_tasks(
         self,
@@ -33,7 +83,10 @@ class TodoistPlannedSource:
         )
         
         fetcher = TodoistTaskFetcher(self._client, planned_list)
-        fetcher.fetch_pending_tasks(max_items)
+        if self._task_index is not None:
+            fetcher.fetch_pending_tasks_from_index(self._task_index, max_items)
+        else:
+            fetcher.fetch_pending_tasks(max_items)
         
         builder = HierarchyBuilder(parent_policy=ParentPolicy.LENIENT)
         tasks = builder.build(fetcher.all_items, TodoistTasksMapper())
@@ -49,15 +102,7 @@ class TodoistPlannedSource:
             results: List[Dict[str, Optional[str]]] = []
             
             for project in projects[:max_items]:
-                results.append({
-                    "id": str(project.get("id", "")),
-                    "title": project.get("name", ""),
-                    "color": project.get("color"),
-                    "is_shared": project.get("is_shared", False),
-                    "is_favorite": project.get("is_favorite", False),
-                    "is_inbox_project": project.get("is_inbox_project", False),
-                    "view_style": project.get("view_style", "list"),
-                })
+                results.append(_project_to_dict(project))
             return results
         except Exception as e:
             print(f"Error fetching Todoist projects: {e}")
@@ -69,12 +114,7 @@ class TodoistPlannedSource:
             results: List[Dict[str, Optional[str]]] = []
             
             for label in labels[:max_items]:
-                results.append({
-                    "id": str(label.get("id", "")),
-                    "title": label.get("name", ""),
-                    "color": label.get("color"),
-                    "is_favorite": label.get("is_favorite", False),
-                })
+                results.append(_label_to_dict(label))
             return results
         except Exception as e:
             print(f"Error fetching Todoist labels: {e}")
@@ -110,7 +150,10 @@ class TodoistPlannedSource:
         updater = TodoistTaskUpdater(self._client, planned_list)
         auto_completer = TodoistTaskAutoCompleter(updater)
         
-        return auto_completer.process_tasks_for_auto_completion(tasks)
+        completed_count = auto_completer.process_tasks_for_auto_completion(tasks)
+        if completed_count and self._task_index is not None:
+            self._task_index.invalidate()
+        return completed_count
 
     def create_task(
         self,
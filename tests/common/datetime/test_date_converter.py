@@ -0,0 +1,30 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from src.common.datetime.datetime_helpers import human_end, human_start
+from src.model import ItemType
+
+_MOMENT = datetime(2026, 3, 2, 10, 30, tzinfo=timezone.utc)
+
+
+def test_humanizers_accept_parsed_datetimes_like_rfc3339_strings():
+    for kwargs in (
+        {"is_all_day": False, "calendar_days": 1, "item_type": ItemType.EVENT},
+        {"is_all_day": True, "calendar_days": 2, "item_type": ItemType.EVENT},
+        {"is_on_going": True, "item_type": ItemType.EVENT},
+    ):
+        assert human_start(_MOMENT, tz="Europe/Madrid", **kwargs) == human_start(
+            _MOMENT.isoformat(), tz="Europe/Madrid", **kwargs
+        )
+        assert human_end(_MOMENT, tz="Europe/Madrid", **kwargs) == human_end(
+            _MOMENT.isoformat(), tz="Europe/Madrid", **kwargs
+        )
+
+
+def test_missing_dates_render_as_placeholder():
+    assert human_start(None) == "-"
+    assert human_end(None) == "-"
@@ -0,0 +1,15 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from src.common.sync.file_sync_state_store import FileSyncStateStore
+from src.common.sync.sync_state import SyncState
+
+
+def test_directory_is_resolved_when_the_store_is_created(tmp_path, monkeypatch):
+    monkeypatch.setenv("SYNC_STATE_DIR", str(tmp_path / "late"))
+    store = FileSyncStateStore()
+    store.write("k", SyncState(token="t"))
+    assert len(list((tmp_path / "late").glob("*.json"))) == 1
+    assert store.read("k").token == "t"
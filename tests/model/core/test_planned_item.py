@@ -0,0 +1,77 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from src.model import ItemType, PlannedItem
+
+
+def _event() -> PlannedItem:
+    return PlannedItem(
+        id="e1",
+        type=ItemType.EVENT,
+        title="Trip",
+        start_rfc3339="2026-03-02",
+        end_rfc3339="2026-03-04",
+        updated_rfc3339="2026-02-01T10:00:00Z",
+    )
+
+
+def test_replace_keeps_parsed_dates():
+    item = _event()
+    copy = replace(item, title="Trip (moved)")
+    assert copy.title == "Trip (moved)"
+    assert (copy.start_at, copy.end_at, copy.updated_at) == (
+        item.start_at,
+        item.end_at,
+        item.updated_at,
+    )
+    assert (copy.start_ts, copy.end_ts) == (item.start_ts, item.end_ts)
+    assert copy.end_raw == item.end_raw
+
+
+def test_replace_can_move_dates_with_datetimes():
+    item = _event()
+    later = item.start_at.replace(day=9)
+    copy = replace(item, start_at=later)
+    assert copy.start_at == later
+    assert copy.start_ts == later.timestamp()
+    assert copy.end_at == item.end_at
+
+
+def test_raw_accessors_are_read_only_views_of_the_parsed_dates():
+    item = _event()
+    assert item.start_raw == item.start_at.isoformat()
+    with pytest.raises(AttributeError):
+        item.start_raw = "2026-01-01"
+
+
+def test_legacy_raw_keywords_are_accepted_as_aliases():
+    legacy = PlannedItem(
+        id="e1",
+        type=ItemType.EVENT,
+        title="Trip",
+        start_raw="2026-03-02",
+        end_raw="2026-03-04",
+        updated_raw="2026-02-01T10:00:00Z",
+    )
+    current = _event()
+    assert (legacy.start_at, legacy.end_at, legacy.updated_at) == (
+        current.start_at,
+        current.end_at,
+        current.updated_at,
+    )
+    with pytest.raises(TypeError):
+        PlannedItem(type=ItemType.TASK, start_raw="2026-03-02", start_rfc3339="2026-03-02")
+
+
+def test_add_link_builds_a_private_list():
+    first = _event()
+    second = _event()
+    first.add_link({"type": "email"})
+    assert first.links == [{"type": "email"}]
+    assert second.links == ()
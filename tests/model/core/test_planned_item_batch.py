@@ -0,0 +1,65 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=protected-access
+from __future__ import annotations
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from src.model import DateRules, ItemGroup, ItemType, PlannedItem, PlannedItemBatch
+from src.model.rules import FixedClock
+
+NEW_YORK = ZoneInfo("America/New_York")
+
+
+def _at(hour: int, minute: int, fold: int = 0) -> datetime:
+    return datetime(2026, 11, 1, hour, minute, tzinfo=NEW_YORK, fold=fold)
+
+
+def _event(item_id: str, start: datetime, end: datetime) -> PlannedItem:
+    return PlannedItem(
+        id=item_id, type=ItemType.EVENT, title=item_id, start_at=start, end_at=end
+    )
+
+
+@pytest.fixture(name="fall_back_now")
+def _fall_back_now():
+    now = _at(1, 30, fold=1)
+    previous = DateRules._clock
+    DateRules.use_clock(FixedClock(tzinfo=NEW_YORK, now=now))
+    yield now
+    DateRules.use_clock(previous)
+
+
+def _items() -> list[PlannedItem]:
+    return [
+        _event("first-pass", _at(1, 10), _at(1, 40)),
+        _event("second-pass", _at(1, 10, fold=1), _at(1, 50, fold=1)),
+        _event("across", _at(1, 45), _at(1, 55, fold=1)),
+        _event("later", _at(3, 0), _at(4, 0)),
+        PlannedItem(
+            id="task", type=ItemType.TASK, title="task", start_at=_at(0, 0)
+        ),
+    ]
+
+
+def _ids(groups: dict) -> dict[str, list[str]]:
+    return {name: [it.id for it in items] for name, (_, items) in groups.items()}
+
+
+def test_batch_matches_scalar_across_dst_fold(fall_back_now):
+    items = _items()
+    batch = PlannedItemBatch(items)
+    assert [it.id for it in batch.sort()] == [it.id for it in PlannedItem.sort(items)]
+    assert _ids(batch.time_grouper()) == _ids(PlannedItem.time_grouper(items))
+    assert [it.is_ongoing() for it in items[:4]] == [False, True, True, False]
+    assert fall_back_now.timestamp() > items[0].end_ts
+
+
+def test_ongoing_uses_instants_across_dst_fold(fall_back_now):
+    del fall_back_now
+    ongoing = _ids(PlannedItemBatch(_items()).time_grouper())[ItemGroup.ON_GOING]
+    assert ongoing == ["second-pass", "across"]
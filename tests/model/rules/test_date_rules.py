@@ -0,0 +1,56 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=protected-access
+from __future__ import annotations
+
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from src.model import DateRules, ItemGroup, ItemType, PlannedItem
+from src.model.rules import FixedClock
+
+UTC = ZoneInfo("UTC")
+
+
+@pytest.fixture(name="use_clock")
+def _use_clock():
+    previous = DateRules._clock
+    yield DateRules.use_clock
+    DateRules.use_clock(previous)
+
+
+def test_calculate_dates_is_read_only(use_clock):
+    use_clock(FixedClock(tzinfo=UTC, now=datetime(2026, 10, 14, 9, tzinfo=UTC)))
+    cd = DateRules.calculate_dates()
+    with pytest.raises(TypeError):
+        cd["this_week_fri"] = date(2000, 1, 1)
+    assert DateRules.calculate_dates()["this_week_fri"] == date(2026, 10, 16)
+
+
+def _group_of(item: PlannedItem, items: list[PlannedItem]):
+    groups = PlannedItem.time_grouper(items)
+    return next(name for name, (_, members) in groups.items() if item in members)
+
+
+def test_use_clock_drives_sort_and_grouping(use_clock):
+    task = PlannedItem(
+        id="t", type=ItemType.TASK, title="t", start_at=datetime(2026, 10, 15, tzinfo=UTC)
+    )
+    event = PlannedItem(
+        id="e",
+        type=ItemType.EVENT,
+        title="e",
+        start_at=datetime(2026, 10, 16, 9, tzinfo=UTC),
+        end_at=datetime(2026, 10, 16, 10, tzinfo=UTC),
+    )
+    undated = PlannedItem(id="u", type=ItemType.EVENT, title="u")
+    items = [event, task, undated]
+    use_clock(FixedClock(tzinfo=UTC, now=datetime(2026, 10, 15, 8, tzinfo=UTC)))
+    assert [it.id for it in PlannedItem.sort(items)] == ["u", "t", "e"]
+    assert _group_of(event, items) == ItemGroup.TOMORROW
+    use_clock(FixedClock(tzinfo=UTC, now=datetime(2026, 10, 16, 9, 30, tzinfo=UTC)))
+    assert [it.id for it in PlannedItem.sort(items)] == ["t", "u", "e"]
+    assert _group_of(event, items) == ItemGroup.ON_GOING
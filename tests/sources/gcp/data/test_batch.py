@@ -0,0 +1,56 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+from httplib2 import HttpLib2Error
+
+from src.sources.gcp.data.batch import execute_batched
+
+
+class _FakeBatch:
+    def __init__(self, service: _FakeService, callback: Callable) -> None:
+        self._service = service
+        self._callback = callback
+        self._requests: List[Tuple[str, str]] = []
+
+    def add(self, request: str, request_id: str) -> None:
+        self._requests.append((request_id, request))
+
+    def execute(self) -> None:
+        self._service.executed += 1
+        if self._service.executed in self._service.failing_batches:
+            raise HttpLib2Error("connection reset")
+        for request_id, request in self._requests:
+            self._callback(request_id, {"items": [request]}, None)
+
+
+class _FakeService:
+    def __init__(self, failing_batches: Optional[set] = None) -> None:
+        self.failing_batches = failing_batches or set()
+        self.executed = 0
+
+    def new_batch_http_request(self, callback: Callable) -> _FakeBatch:
+        return _FakeBatch(self, callback)
+
+
+def test_execute_batched_returns_one_outcome_per_key():
+    requests: Dict[str, str] = {f"cal{i}": f"req{i}" for i in range(5)}
+    outcomes = execute_batched(_FakeService(), requests, batch_size=2)
+    assert set(outcomes) == set(requests)
+    assert all(outcome.ok for outcome in outcomes.values())
+    assert outcomes["cal3"].response == {"items": ["req3"]}
+
+
+def test_failed_batch_execute_only_fails_its_own_chunk():
+    requests: Dict[str, str] = {f"cal{i}": f"req{i}" for i in range(5)}
+    service = _FakeService(failing_batches={2})
+    outcomes = execute_batched(service, requests, batch_size=2)
+    assert service.executed == 3
+    assert set(outcomes) == set(requests)
+    failed = {key for key, outcome in outcomes.items() if not outcome.ok}
+    assert failed == {"cal2", "cal3"}
+    assert isinstance(outcomes["cal2"].error, HttpLib2Error)
+    assert outcomes["cal4"].response == {"items": ["req4"]}
@@ -0,0 +1,131 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from typing import Dict, List
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from src.common.sync.file_sync_state_store import FileSyncStateStore
+from src.model.list import PlannedItemList
+from src.sources.gcp.data.event_sync import CalendarEventSync
+
+CALENDAR = PlannedItemList(kind="calendar", id="cal")
+WINDOW = ("2026-10-18T00:00:00Z", "2026-12-16T23:59:59Z")
+
+
+def _event(event_id: str, day: str, status: str = "confirmed") -> Dict:
+    return {
+        "id": event_id,
+        "status": status,
+        "start": {"dateTime": f"{day}T10:00:00+00:00"},
+        "end": {"dateTime": f"{day}T11:00:00+00:00"},
+    }
+
+
+class _FakeRequest:
+    def __init__(self, service: _FakeEvents, query: Dict) -> None:
+        self._service = service
+        self._query = query
+
+    def execute(self) -> Dict:
+        self._service.queries.append(self._query)
+        response = self._service.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class _FakeEvents:
+    def __init__(self, responses: List) -> None:
+        self.responses = responses
+        self.queries: List[Dict] = []
+
+    def list(self, **query) -> _FakeRequest:
+        return _FakeRequest(self, query)
+
+
+class _FakeService:
+    def __init__(self, responses: List) -> None:
+        self._events = _FakeEvents(responses)
+
+    def events(self) -> _FakeEvents:
+        return self._events
+
+    @property
+    def queries(self) -> List[Dict]:
+        return self._events.queries
+
+
+def _page(items: List[Dict], token: str) -> Dict:
+    return {"items": items, "nextSyncToken": token}
+
+
+def _ids(events: List[Dict]) -> List[str]:
+    return sorted(event["id"] for event in events)
+
+
+def test_incremental_sync_applies_changes_and_drops_cancelled(tmp_path):
+    service = _FakeService(
+        [
+            _page([_event("a", "2026-10-20"), _event("b", "2026-10-21")], "t1"),
+            _page(
+                [_event("a", "2026-10-20", status="cancelled"), _event("c", "2026-10-22")],
+                "t2",
+            ),
+        ]
+    )
+    sync = CalendarEventSync(service, FileSyncStateStore(tmp_path))
+    assert _ids(sync.sync(CALENDAR, *WINDOW)) == ["a", "b"]
+    assert _ids(sync.sync(CALENDAR, *WINDOW)) == ["b", "c"]
+    assert "timeMin" in service.queries[0]
+    assert service.queries[1]["syncToken"] == "t1"
+    assert "timeMin" not in service.queries[1]
+
+
+def test_moving_window_reuses_the_stored_horizon(tmp_path):
+    service = _FakeService(
+        [
+            _page([_event("a", "2026-10-18"), _event("b", "2027-01-10")], "t1"),
+            _page([], "t2"),
+        ]
+    )
+    sync = CalendarEventSync(service, FileSyncStateStore(tmp_path))
+    assert _ids(sync.sync(CALENDAR, *WINDOW)) == ["a"]
+    next_day = ("2026-10-19T00:00:00Z", "2027-01-15T23:59:59Z")
+    assert _ids(sync.sync(CALENDAR, *next_day)) == ["b"]
+    assert service.queries[0]["timeMax"] > next_day[1]
+    assert service.queries[1]["syncToken"] == "t1"
+
+
+def test_window_outside_the_horizon_triggers_a_full_sync(tmp_path):
+    service = _FakeService(
+        [
+            _page([_event("a", "2026-10-20")], "t1"),
+            _page([_event("old", "2026-09-01")], "t2"),
+        ]
+    )
+    sync = CalendarEventSync(service, FileSyncStateStore(tmp_path))
+    sync.sync(CALENDAR, *WINDOW)
+    earlier = ("2026-09-01T00:00:00Z", "2026-09-30T23:59:59Z")
+    assert _ids(sync.sync(CALENDAR, *earlier)) == ["old"]
+    assert "syncToken" not in service.queries[1]
+
+
+def test_gone_sync_token_resyncs_from_scratch(tmp_path):
+    gone = HttpError(httplib2.Response({"status": "410"}), b"gone")
+    service = _FakeService(
+        [
+            _page([_event("a", "2026-10-20")], "t1"),
+            gone,
+            _page([_event("b", "2026-10-21")], "t3"),
+        ]
+    )
+    store = FileSyncStateStore(tmp_path)
+    sync = CalendarEventSync(service, store)
+    sync.sync(CALENDAR, *WINDOW)
+    assert _ids(sync.sync(CALENDAR, *WINDOW)) == ["b"]
+    assert "timeMin" in service.queries[2]
+    assert store.read(CalendarEventSync.state_key(CALENDAR)).token == "t3"
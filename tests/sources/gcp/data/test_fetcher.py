@@ -0,0 +1,74 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from src.model import PlannedItemList
+from src.sources.gcp.data.config import TaskFetchStrategy, TaskQueryConfig
+from src.sources.gcp.data.fetcher import TaskFetcher
+from src.sources.gcp.data.listing_sizes import ListingSizes
+
+_START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+_END = datetime(2026, 1, 31, 23, 59, 59, tzinfo=timezone.utc)
+
+
+class _Request:
+    def __init__(self, response: Dict) -> None:
+        self._response = response
+
+    def execute(self) -> Dict:
+        return self._response
+
+
+class _Tasks:
+    def __init__(self, items: List[Dict]) -> None:
+        self.items = items
+        self.calls: List[Dict] = []
+
+    def list(self, **kwargs) -> _Request:
+        self.calls.append(kwargs)
+        return _Request({"items": list(self.items)})
+
+
+class _Service:
+    def __init__(self, items: List[Dict]) -> None:
+        self.collection = _Tasks(items)
+
+    def tasks(self) -> _Tasks:
+        return self.collection
+
+
+def _items() -> List[Dict]:
+    return [
+        {"id": "dated", "title": "a", "due": "2026-01-10T00:00:00.000Z"},
+        {"id": "undated", "title": "b"},
+    ]
+
+
+def test_default_strategy_queries_the_dated_window():
+    assert TaskQueryConfig().fetch_strategy == TaskFetchStrategy.TWO_QUERY
+    service = _Service(_items())
+    fetcher = TaskFetcher(service, PlannedItemList(kind="tasklist", id="l1"))
+    fetcher.fetch_tasks(10, _START, _END, include_undated=True)
+    assert "dueMin" in service.collection.calls[0]
+    assert {item["id"] for item in fetcher.all_items} == {"dated", "undated"}
+
+
+def test_auto_strategy_uses_observations_from_its_own_store():
+    sizes = ListingSizes()
+    planned_list = PlannedItemList(kind="tasklist", id="l1")
+    fetcher = TaskFetcher(_Service(_items()), planned_list, listing_sizes=sizes)
+    assert (
+        fetcher.resolve_strategy(TaskFetchStrategy.AUTO, 10, True)
+        == TaskFetchStrategy.SINGLE_PASS
+    )
+    sizes.record("l1", 1000)
+    assert (
+        fetcher.resolve_strategy(TaskFetchStrategy.AUTO, 10, True)
+        == TaskFetchStrategy.TWO_QUERY
+    )
+    other = TaskFetcher(_Service(_items()), planned_list)
+    assert other.listing_sizes.get("l1") is None
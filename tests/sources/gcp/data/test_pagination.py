@@ -0,0 +1,113 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=protected-access
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from src.model import PlannedItemList
+from src.sources.gcp.data.fetcher import TaskFetcher
+from src.sources.gcp.data.pagination import (iter_pages, paginate,
+                                             prefetch_pages_enabled)
+from src.sources.gcp.google_planned_source import GooglePlannedSource
+
+
+class _PagedTasks:
+    def __init__(self, items: List[Dict]) -> None:
+        self.items = items
+        self.sizes: List[int] = []
+
+    def fetch(self, page_token: Optional[str], size: int) -> Dict:
+        self.sizes.append(size)
+        start = int(page_token or 0)
+        resp: Dict = {"items": self.items[start : start + size]}
+        if start + size < len(self.items):
+            resp["nextPageToken"] = str(start + size)
+        return resp
+
+
+class _Request:
+    def __init__(self, tasks: _PagedTasks, kwargs: Dict) -> None:
+        self._tasks = tasks
+        self._kwargs = kwargs
+
+    def execute(self) -> Dict:
+        return self._tasks.fetch(self._kwargs.get("pageToken"), self._kwargs["maxResults"])
+
+
+class _Service:
+    def __init__(self, tasks: _PagedTasks) -> None:
+        self._tasks = tasks
+
+    def tasks(self) -> _Service:
+        return self
+
+    def list(self, **kwargs) -> _Request:
+        return _Request(self._tasks, kwargs)
+
+
+def _dated(count: int) -> List[Dict]:
+    return [{"id": str(i), "due": "2026-01-10T00:00:00.000Z"} for i in range(count)]
+
+
+def test_prefetched_dated_pages_never_request_past_max_items():
+    tasks = _PagedTasks(_dated(500))
+    fetcher = TaskFetcher(
+        _Service(tasks), PlannedItemList(kind="tasklist", id="l1"), prefetch=True
+    )
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2026, 1, 31, tzinfo=timezone.utc)
+    fetcher.fetch_dated_tasks(120, start, end)
+    assert fetcher.item_count == 120
+    assert tasks.sizes == [100, 20]
+
+
+def test_prefetched_undated_pages_size_by_undated_items_only():
+    items = _dated(60) + [{"id": f"u{i}"} for i in range(100)]
+    tasks = _PagedTasks(items)
+    fetcher = TaskFetcher(
+        _Service(tasks), PlannedItemList(kind="tasklist", id="l1"), prefetch=True
+    )
+    fetcher.fetch_undated_tasks(50, include_undated=True)
+    assert fetcher.item_count == 50
+    assert tasks.sizes == [50, 50, 10]
+
+
+def test_paginate_with_prefetch_matches_sequential():
+    items = [{"id": str(i)} for i in range(230)]
+    sequential = list(paginate(_PagedTasks(items).fetch, 180, 100))
+    prefetched = list(paginate(_PagedTasks(items).fetch, 180, 100, prefetch=True))
+    assert prefetched == sequential == items[:180]
+
+
+def test_closing_a_prefetching_iterator_does_not_wait_for_the_pending_page():
+    release = threading.Event()
+    tasks = _PagedTasks([{"id": str(i)} for i in range(300)])
+
+    def _fetch(page_token: Optional[str], size: int) -> Dict:
+        if page_token is not None:
+            release.wait(5)
+        return tasks.fetch(page_token, size)
+
+    pages = iter_pages(_fetch, lambda _: 100, prefetch=True)
+    next(pages)
+    started = time.monotonic()
+    pages.close()
+    elapsed = time.monotonic() - started
+    release.set()
+    assert elapsed < 1
+
+
+def test_prefetch_setting_is_read_at_call_time(monkeypatch):
+    source = GooglePlannedSource()
+    monkeypatch.delenv("GOOGLE_PREFETCH_PAGES", raising=False)
+    assert not prefetch_pages_enabled()
+    assert not source._prefetch
+    monkeypatch.setenv("GOOGLE_PREFETCH_PAGES", "1")
+    assert prefetch_pages_enabled()
+    assert source._prefetch
+    assert not GooglePlannedSource(prefetch_pages=False)._prefetch
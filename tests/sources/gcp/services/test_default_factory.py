@@ -0,0 +1,104 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from typing import Dict, List, Optional, Set
+
+import httplib2
+from google.oauth2.credentials import Credentials
+
+from src.sources.gcp.async_google_planned_source import AsyncGooglePlannedSource
+from src.sources.gcp.auth.settings import AuthSettings
+from src.sources.gcp.auth.token_storage import TokenStorage
+from src.sources.gcp.services.default_factory import DefaultGoogleServiceFactory
+
+
+class _StaticCredentialsProvider:
+    def __init__(self) -> None:
+        self.credentials = Credentials(token="token")
+
+    def get(self, settings: AuthSettings, storage: Optional[TokenStorage]) -> Credentials:
+        return self.credentials
+
+
+class _TransportProbe:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_flight: set = set()
+        self.transports: List[int] = []
+        self.by_thread: Dict[int, Set[int]] = {}
+        self.shared_in_flight = False
+        self.max_concurrency = 0
+
+    def request(self, http: httplib2.Http, *_args, **_kwargs):
+        with self._lock:
+            if id(http) in self._in_flight:
+                self.shared_in_flight = True
+            self._in_flight.add(id(http))
+            self.transports.append(id(http))
+            self.by_thread.setdefault(threading.get_ident(), set()).add(id(http))
+            self.max_concurrency = max(self.max_concurrency, len(self._in_flight))
+        time.sleep(0.05)
+        with self._lock:
+            self._in_flight.discard(id(http))
+        body = json.dumps({"items": [{"id": "l1", "title": "List"}]}).encode()
+        return httplib2.Response({"status": "200"}), body
+
+
+def test_resources_and_transports_are_shared_per_credentials():
+    factory = DefaultGoogleServiceFactory(_StaticCredentialsProvider())
+    service = factory.build("tasks", "v1", settings=AuthSettings())
+    assert factory.build("tasks", "v1", settings=AuthSettings()) is service
+    calendar = factory.build("calendar", "v3", settings=AuthSettings())
+    first = service.tasklists().list()
+    second = calendar.calendarList().list()
+    assert first.http is second.http
+    assert first.http.http is second.http.http
+
+
+def test_each_thread_reuses_its_own_transport(monkeypatch):
+    probe = _TransportProbe()
+    monkeypatch.setattr(
+        httplib2.Http,
+        "request",
+        lambda http, *args, **kwargs: probe.request(http, *args, **kwargs),
+    )
+    factory = DefaultGoogleServiceFactory(_StaticCredentialsProvider())
+    service = factory.build("tasks", "v1", settings=AuthSettings())
+    request = service.tasklists().list()
+    request.execute()
+    request.execute()
+    worker = threading.Thread(target=request.execute)
+    worker.start()
+    worker.join()
+    assert len(probe.transports) == 3
+    assert probe.transports[0] == probe.transports[1] != probe.transports[2]
+
+
+def test_overlapping_async_fetches_reuse_one_transport_per_thread(monkeypatch):
+    probe = _TransportProbe()
+    monkeypatch.setattr(
+        httplib2.Http,
+        "request",
+        lambda http, *args, **kwargs: probe.request(http, *args, **kwargs),
+    )
+    factory = DefaultGoogleServiceFactory(_StaticCredentialsProvider())
+    source = AsyncGooglePlannedSource(service_factory=factory)
+
+    async def _fetch_all() -> list:
+        first = await asyncio.gather(*(source.get_tasks_lists() for _ in range(6)))
+        second = await asyncio.gather(*(source.get_tasks_lists() for _ in range(6)))
+        return first + second
+
+    results = asyncio.run(_fetch_all())
+    assert all(lists == results[0] for lists in results)
+    assert results[0][0]["id"] == "l1"
+    assert probe.max_concurrency > 1
+    assert not probe.shared_in_flight
+    assert all(len(transports) == 1 for transports in probe.by_thread.values())
+    assert len(set(probe.transports)) == len(probe.by_thread) < len(probe.transports)
@@ -0,0 +1,26 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from src.sources.todoist.auth.settings import TodoistAuthSettings
+
+
+def test_pool_size_is_read_when_settings_are_created(monkeypatch):
+    monkeypatch.setenv("TODOIST_POOL_SIZE", "8")
+    assert TodoistAuthSettings(api_token="token").pool_size == 8
+
+
+def test_invalid_pool_size_falls_back_to_the_default(monkeypatch):
+    monkeypatch.setenv("TODOIST_POOL_SIZE", "eight")
+    assert TodoistAuthSettings(api_token="token").pool_size == 4
+
+
+def test_index_ttl_is_read_from_the_environment(monkeypatch):
+    monkeypatch.setenv("TODOIST_INDEX_TTL", "300")
+    assert TodoistAuthSettings(api_token="token").index_ttl == 300.0
+
+
+def test_invalid_index_ttl_falls_back_to_the_default(monkeypatch):
+    monkeypatch.setenv("TODOIST_INDEX_TTL", "soon")
+    assert TodoistAuthSettings(api_token="token").index_ttl == 60.0
@@ -0,0 +1,62 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Set
+
+from src.sources.todoist.services.command_batch import (SYNC_COMMANDS_LIMIT,
+                                                        close_tasks,
+                                                        execute_commands)
+
+
+class _FakeClient:
+    def __init__(
+        self, failing_calls: Optional[Set[int]] = None, rejected: Optional[Set[str]] = None
+    ) -> None:
+        self.failing_calls = failing_calls or set()
+        self.rejected = rejected or set()
+        self.chunks: List[List[Dict[str, Any]]] = []
+
+    def post_sync(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        commands = fields["commands"]
+        self.chunks.append(commands)
+        if len(self.chunks) in self.failing_calls:
+            raise ValueError("Network error: connection reset")
+        status: Dict[str, Any] = {}
+        for command in commands:
+            task_id = command["args"]["id"]
+            if task_id in self.rejected:
+                status[command["uuid"]] = {"error_code": 22, "error": "Item not found"}
+            elif task_id != "silent":
+                status[command["uuid"]] = "ok"
+        return {"sync_status": status}
+
+
+def test_commands_are_sent_in_chunks_of_at_most_the_api_limit():
+    client = _FakeClient()
+    task_ids = [str(i) for i in range(SYNC_COMMANDS_LIMIT * 2 + 5)]
+    outcomes = close_tasks(client, task_ids, batch_size=500)
+    assert [len(chunk) for chunk in client.chunks] == [100, 100, 5]
+    assert set(outcomes) == set(task_ids)
+    assert all(outcome.ok for outcome in outcomes.values())
+
+
+def test_sync_status_is_mapped_back_to_each_command():
+    client = _FakeClient(rejected={"2"})
+    outcomes = close_tasks(client, ["1", "2", "silent"])
+    assert outcomes["1"].ok
+    assert outcomes["2"].error == "Item not found"
+    assert outcomes["silent"].error == "missing sync_status entry"
+
+
+def test_failed_request_only_fails_its_own_chunk():
+    client = _FakeClient(failing_calls={2})
+    commands = [
+        {"type": "item_close", "uuid": f"u{i}", "args": {"id": str(i)}} for i in range(5)
+    ]
+    outcomes = execute_commands(client, commands, batch_size=2)
+    failed = {key for key, outcome in outcomes.items() if not outcome.ok}
+    assert failed == {"u2", "u3"}
+    assert "connection reset" in outcomes["u2"].error
+    assert outcomes["u4"].ok
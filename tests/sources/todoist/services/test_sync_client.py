@@ -0,0 +1,94 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from src.common.sync.file_sync_state_store import FileSyncStateStore
+from src.sources.todoist.auth.settings import TodoistAuthSettings
+from src.sources.todoist.services.sync_client import TodoistSyncClient
+
+
+class _FakeRestClient:
+    def __init__(self, token: str, payloads: List[Dict[str, Any]]) -> None:
+        self.settings = TodoistAuthSettings(api_token=token)
+        self.payloads = payloads
+        self.sync_tokens: List[str] = []
+
+    def post_sync(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        self.sync_tokens.append(fields["sync_token"])
+        return self.payloads.pop(0)
+
+
+def _item(item_id: str, **extra: Any) -> Dict[str, Any]:
+    return {"id": item_id, "content": item_id, "project_id": "p1", **extra}
+
+
+def _client(tmp_path, rest: _FakeRestClient, sync_ttl: float = 30.0) -> TodoistSyncClient:
+    return TodoistSyncClient(
+        store=FileSyncStateStore(tmp_path), rest_client=rest, sync_ttl=sync_ttl
+    )
+
+
+def test_replica_is_reused_within_the_ttl_and_updated_incrementally(tmp_path):
+    rest = _FakeRestClient(
+        "token-a",
+        [
+            {"full_sync": True, "sync_token": "s1", "items": [_item("1"), _item("2")]},
+            {
+                "sync_token": "s2",
+                "items": [_item("1", is_deleted=True), _item("3", checked=True)],
+            },
+        ],
+    )
+    client = _client(tmp_path, rest)
+    assert [t["id"] for t in client.get_tasks()] == ["1", "2"]
+    assert [t["id"] for t in client.get_tasks(project_id="p1")] == ["1", "2"]
+    assert rest.sync_tokens == ["*"]
+    client.invalidate()
+    assert [t["id"] for t in client.get_tasks()] == ["2"]
+    assert rest.sync_tokens == ["*", "s1"]
+
+
+def test_expired_ttl_triggers_an_incremental_sync(tmp_path):
+    rest = _FakeRestClient(
+        "token-a",
+        [
+            {"full_sync": True, "sync_token": "s1", "items": [_item("1")]},
+            {"sync_token": "s2", "items": [_item("2")]},
+        ],
+    )
+    client = _client(tmp_path, rest, sync_ttl=0.0)
+    client.get_tasks()
+    assert [t["id"] for t in client.get_tasks()] == ["1", "2"]
+    assert rest.sync_tokens == ["*", "s1"]
+
+
+def test_state_is_persisted_per_api_token(tmp_path):
+    first = _FakeRestClient(
+        "token-a", [{"full_sync": True, "sync_token": "s1", "items": [_item("1")]}]
+    )
+    _client(tmp_path, first).sync()
+    same_token = _FakeRestClient("token-a", [{"sync_token": "s2", "items": []}])
+    assert [t["id"] for t in _client(tmp_path, same_token).get_tasks()] == ["1"]
+    assert same_token.sync_tokens == ["s1"]
+    other_token = _FakeRestClient("token-b", [{"full_sync": True, "sync_token": "t1"}])
+    assert _client(tmp_path, other_token).get_tasks() == []
+    assert other_token.sync_tokens == ["*"]
+
+
+def test_commands_invalidate_the_replica(tmp_path):
+    rest = _FakeRestClient(
+        "token-a",
+        [
+            {"full_sync": True, "sync_token": "s1", "items": [_item("1")]},
+            {"sync_status": {}},
+            {"sync_token": "s2", "items": [_item("1", checked=True)]},
+        ],
+    )
+    client = _client(tmp_path, rest)
+    client.get_tasks()
+    client.post_sync({"commands": [], "sync_token": "-"})
+    assert client.get_tasks() == []
+    assert rest.sync_tokens == ["*", "-", "s1"]
@@ -0,0 +1,68 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from src.model import PlannedItemList
+from src.sources.todoist.auth.settings import TodoistAuthSettings
+from src.sources.todoist.todoist_planned_source import TodoistPlannedSource
+
+_TASKS: List[Dict[str, Any]] = [
+    {"id": "1", "content": "inbox task", "project_id": "100", "is_completed": False},
+    {"id": "2", "content": "work task", "project_id": "200", "is_completed": False},
+    {"id": "3", "content": "home task", "project_id": "300", "is_completed": False},
+]
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.task_requests = 0
+
+    def get_tasks(self, project_id: Optional[str] = None, **_kwargs) -> List[Dict[str, Any]]:
+        self.task_requests += 1
+        return [
+            dict(task) for task in _TASKS if project_id in (None, task["project_id"])
+        ]
+
+    def get_projects(self) -> List[Dict[str, Any]]:
+        return [{"id": "100", "name": "Inbox", "is_inbox_project": True}]
+
+
+def _source(account_wide: bool, client: _FakeClient) -> TodoistPlannedSource:
+    return TodoistPlannedSource(
+        auth_settings=TodoistAuthSettings(api_token="token"),
+        account_wide=account_wide,
+        client=client,
+    )
+
+
+@pytest.mark.parametrize(
+    "list_id, expected",
+    [("inbox", {"1", "2", "3"}), ("200", {"2"})],
+)
+def test_account_wide_mode_returns_the_same_tasks_as_the_default_mode(list_id, expected):
+    planned_list = PlannedItemList(kind="todoist_project", id=list_id)
+    for account_wide in (False, True):
+        tasks = _source(account_wide, _FakeClient()).get_pending_tasks(planned_list)
+        assert {task.id for task in tasks} == expected
+
+
+def test_account_wide_mode_serves_every_project_from_one_request():
+    client = _FakeClient()
+    source = _source(True, client)
+    for list_id in ("inbox", "100", "200", "300"):
+        source.get_pending_tasks(PlannedItemList(kind="todoist_project", id=list_id))
+    assert client.task_requests == 1
+
+
+def test_index_ttl_defaults_to_the_settings_value(monkeypatch):
+    monkeypatch.setenv("TODOIST_INDEX_TTL", "0")
+    client = _FakeClient()
+    source = _source(True, client)
+    for _ in range(2):
+        source.get_pending_tasks(PlannedItemList(kind="todoist_project", id="200"))
+    assert client.task_requests == 2